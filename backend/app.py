@@ -3,8 +3,20 @@ Flask Application Entry Point
 
 Initializes the Flask application, registers blueprints,
 configures CORS, and initializes database.
+
+Every blueprint import and init step is timed; set STARTUP_PROFILE=true
+to print the report at startup (also served at /api/admin/startup).
+
+Request metrics are served at /metrics (METRICS_TOKEN or an admin token)
+unless METRICS_ENABLED=false, and
+responses carry a Server-Timing header unless SERVER_TIMING=false. Admins
+can profile any request with an X-Profile header (utils/request_profiler).
+SQL statements per request are audited for N+1 patterns (database/query_audit).
+Logs are JSON lines written by a background thread (utils/structured_logging).
 """
 
+import importlib
+import logging
 import os
 import sys
 
@@ -14,25 +26,62 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from flask import Flask, request
-from flask_cors import CORS
-from dotenv import load_dotenv
-from backend.routes.estimate import estimate_bp
-from backend.routes.auth import auth_bp
-from backend.routes.analyses import analyses_bp
-from backend.routes.admin import admin_bp
-from backend.routes.education import education_bp
-from backend.routes.providers import providers_bp
-from backend.routes.pricing import pricing_bp
-from backend.database.connection import init_db
+from backend.utils.startup_profile import startup_profile, STARTUP_PROFILE
+
+with startup_profile.step("flask", "import"):
+    from flask import Flask, request
+    from flask_cors import CORS
+    from dotenv import load_dotenv
+
+with startup_profile.step("backend.database.connection", "import"):
+    from backend.database.connection import DB_INIT_MODE, engine, ensure_schema, close_request_db
+
+# One step per module; shared dependencies count towards the first module that imports them
+with startup_profile.step("backend.database.query_audit", "import"):
+    from backend.database.query_audit import init_query_audit
+
+with startup_profile.step("backend.utils.structured_logging", "import"):
+    from backend.utils.structured_logging import init_logging
+
+with startup_profile.step("backend.utils.metrics", "import"):
+    from backend.utils.metrics import METRICS_ENABLED, init_metrics
+
+with startup_profile.step("backend.utils.server_timing", "import"):
+    from backend.utils.server_timing import init_server_timing
+
+with startup_profile.step("backend.utils.request_profiler", "import"):
+    from backend.utils.request_profiler import init_request_profiler
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# (module, blueprint, URL prefix), imported and registered by create_app()
+BLUEPRINTS = [
+    ("backend.routes.estimate", "estimate_bp", "/api"),
+    ("backend.routes.auth", "auth_bp", "/api/auth"),
+    ("backend.routes.analyses", "analyses_bp", "/api/analyses"),
+    ("backend.routes.admin", "admin_bp", "/api/admin"),
+    ("backend.routes.education", "education_bp", "/api/education"),
+    ("backend.routes.providers", "providers_bp", "/api"),
+    ("backend.routes.pricing", "pricing_bp", "/api")
+]
+
 def create_app():
     """Create and configure Flask application."""
     app = Flask(__name__)
     
+    # Request ids and queued JSON logging first, so every later hook can log
+    init_logging(app)
+    
+    # Instrument requests early so every other hook is inside the timing
+    if METRICS_ENABLED:
+        init_metrics(app, engine)
+    init_query_audit(app, engine)
+    init_server_timing(app)
+    init_request_profiler(app)
+    
     # Enable CORS for frontend integration
     # Get frontend URL from environment variable or allow all origins
     frontend_url = os.getenv("FRONTEND_URL", "*")
@@ -55,8 +104,8 @@ def create_app():
              r"/api/*": {
                  "origins": allowed_origins,
                  "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-                 "allow_headers": ["Content-Type", "Authorization", "X-Requested-With"],
-                 "expose_headers": ["Content-Type", "Authorization"],
+                 "allow_headers": ["Content-Type", "Authorization", "X-Requested-With", "X-Profile", "X-Request-ID"],
+                 "expose_headers": ["Content-Type", "Authorization", "X-Cache", "Server-Timing", "X-Profile-Id", "X-Request-ID"],
                  "supports_credentials": True,
                  "max_age": 3600
              }
@@ -85,25 +134,37 @@ def create_app():
                 headers['Access-Control-Allow-Origin'] = "*"
             
             headers['Access-Control-Allow-Methods'] = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-            headers['Access-Control-Allow-Headers'] = "Content-Type, Authorization, X-Requested-With"
+            headers['Access-Control-Allow-Headers'] = "Content-Type, Authorization, X-Requested-With, X-Profile, X-Request-ID"
             headers['Access-Control-Max-Age'] = "3600"
             return response
     
-    # Initialize database
-    try:
-        init_db()
-        print("✓ Database initialized successfully")
-    except Exception as e:
-        print(f"⚠ Database initialization warning: {e}")
+    # Initialize database unless its schema is already current
+    # (DB_INIT_MODE=deferred, the default, checks on first database use instead, off never checks)
+    if DB_INIT_MODE == "eager":
+        with startup_profile.step("ensure_schema"):
+            try:
+                if ensure_schema():
+                    logger.info("Database initialized")
+                else:
+                    logger.info("Database schema is up to date")
+            except RuntimeError:
+                # Missing columns: every query on those tables would fail
+                raise
+            except Exception as e:
+                logger.warning("Database initialization warning: %s", e, exc_info=e)
+    
+    # Return each request's database session to the pool
+    app.teardown_appcontext(close_request_db)
     
     # Register blueprints
-    app.register_blueprint(estimate_bp, url_prefix="/api")
-    app.register_blueprint(auth_bp, url_prefix="/api/auth")
-    app.register_blueprint(analyses_bp, url_prefix="/api/analyses")
-    app.register_blueprint(admin_bp, url_prefix="/api/admin")
-    app.register_blueprint(education_bp, url_prefix="/api/education")
-    app.register_blueprint(providers_bp, url_prefix="/api")
-    app.register_blueprint(pricing_bp, url_prefix="/api")
+    for module_name, blueprint_name, url_prefix in BLUEPRINTS:
+        with startup_profile.step(module_name, "import"):
+            module = importlib.import_module(module_name)
+        app.register_blueprint(getattr(module, blueprint_name), url_prefix=url_prefix)
+    
+    startup_profile.mark_ready()
+    if STARTUP_PROFILE:
+        logger.info("Startup profile:\n%s", startup_profile.format_report())
     
     return app
 
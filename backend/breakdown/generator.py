@@ -5,13 +5,12 @@ Generates human-readable cost impact breakdown per question.
 Tracks which questions increase, decrease, or maintain cost.
 """
 
-from backend.questions import get_question_by_id
-
 def generate_breakdown(
     validated_data: dict,
     base_cost: float,
     applied_multipliers: dict,
-    final_cost: float
+    final_cost: float,
+    estimator=None
 ) -> list:
     """
     Generate cost impact breakdown for each question.
@@ -21,15 +20,21 @@ def generate_breakdown(
         base_cost: Starting base cost
         applied_multipliers: Dictionary of applied multipliers per question
         final_cost: Final calculated cost
+        estimator: Compiled estimator (defaults to the current one)
         
     Returns:
         List of breakdown items, one per question
     """
+    if estimator is None:
+        # Imported here: the estimator module depends on this one
+        from backend.calculation.estimator import get_estimator
+        estimator = get_estimator()
+    
     breakdown = []
     cumulative_cost = base_cost
     
     for question_id, multiplier_data in applied_multipliers.items():
-        question = get_question_by_id(question_id)
+        question = estimator.get_question(question_id)
         if not question:
             continue
         
@@ -50,16 +55,16 @@ def generate_breakdown(
             impact_direction = "neutral"
         
         # Format answer for display
-        display_answer = format_answer_for_display(question_id, answer)
+        display_answer = question.format_answer(answer)
         
         breakdown.append({
             "question_id": question_id,
-            "question_title": format_question_title(question_id),
+            "question_title": question.title,
             "user_answer": display_answer,
             "multiplier": round(multiplier, 3),
             "cost_impact": round(cost_impact, 2),
             "impact_direction": impact_direction,
-            "explanation": question["explanation"]
+            "explanation": question.explanation
         })
     
     return breakdown
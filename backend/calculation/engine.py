@@ -4,67 +4,71 @@ Calculation Engine
 Core cost estimation logic.
 Applies base cost and multipliers to compute final estimate.
 Delegates breakdown generation to breakdown layer.
+Batch requests are evaluated with vectorized array products.
+Optionally replaces the fixed min/max band with Monte Carlo percentiles.
 """
 
-from backend.config.base_costs import get_base_cost
-from backend.config.multipliers import get_multiplier
 from backend.config.cost_ranges import calculate_cost_range
 from backend.breakdown.generator import generate_breakdown
-from backend.questions import QUESTIONS_METADATA, get_base_cost_question
+from backend.calculation.estimator import get_estimator
+from backend.calculation.uncertainty import simulate_cost_distribution
+from backend.schemas.estimate_request import validate_estimate_request
+from backend.utils.server_timing import span
 
-def calculate_estimate(validated_data: dict) -> dict:
+def calculate_estimate(validated_data: dict, range_options: dict = None) -> dict:
     """
     Calculate cost estimate from validated request data.
     
     Args:
         validated_data: Validated and normalized request data
+        range_options: Monte Carlo options (samples, seed); None for fixed range
         
     Returns:
         Complete estimation result with cost, range, and breakdown
     """
+    estimator = get_estimator()
+    
     # Get base cost from company size
-    base_cost_question = get_base_cost_question()
-    company_size = validated_data[base_cost_question["question_id"]]
-    base_cost = get_base_cost(company_size)
+    company_size = validated_data[estimator.base_cost_question.question_id]
+    base_cost = estimator.get_base_cost(company_size)
     
-    # Apply multipliers
+    # Apply multipliers (base cost question is not a multiplier question)
     final_cost = base_cost
     applied_multipliers = {}
     
-    for question in QUESTIONS_METADATA:
-        question_id = question["question_id"]
-        
-        # Skip base cost question (already applied)
-        if question["affects_base_cost"]:
-            continue
+    for question in estimator.multiplier_questions:
+        question_id = question.question_id
         
         # Get answer value
         answer_value = validated_data.get(question_id)
         if answer_value is None:
             continue
         
-        # Get multiplier
-        multiplier_key = question["multiplier_key"]
-        if multiplier_key:
-            multiplier = get_multiplier(multiplier_key, answer_value)
-            final_cost *= multiplier
-            applied_multipliers[question_id] = {
-                "multiplier": multiplier,
-                "answer": answer_value
-            }
+        multiplier = question.get_multiplier(answer_value)
+        final_cost *= multiplier
+        applied_multipliers[question_id] = {
+            "multiplier": multiplier,
+            "answer": answer_value
+        }
     
     # Calculate cost range
-    cost_range = calculate_cost_range(final_cost)
+    cost_range = calculate_cost_range(
+        final_cost,
+        estimator.min_cost_deviation,
+        estimator.max_cost_deviation
+    )
     
     # Generate breakdown
-    breakdown = generate_breakdown(
-        validated_data,
-        base_cost,
-        applied_multipliers,
-        final_cost
-    )
+    with span("breakdown"):
+        breakdown = generate_breakdown(
+            validated_data,
+            base_cost,
+            applied_multipliers,
+            final_cost,
+            estimator=estimator
+        )
     
-    return {
+    result = {
         "cost_estimate": {
             "base_cost": round(base_cost, 2),
             "final_cost": cost_range["final_cost"],
@@ -74,7 +78,82 @@ def calculate_estimate(validated_data: dict) -> dict:
         },
         "breakdown": breakdown,
         "metadata": {
-            "total_questions": len(QUESTIONS_METADATA),
+            "total_questions": len(estimator.questions),
             "questions_answered": len(validated_data)
         }
     }
+    
+    # Probabilistic range: min/max become P10/P90 of simulated costs
+    if range_options:
+        with span("monte_carlo"):
+            distribution = simulate_cost_distribution(
+                validated_data,
+                samples=range_options["samples"],
+                seed=range_options["seed"]
+            )
+        result["cost_estimate"]["min_cost"] = distribution["percentiles"]["p10"]
+        result["cost_estimate"]["max_cost"] = distribution["percentiles"]["p90"]
+        result["uncertainty"] = distribution
+    
+    return result
+
+
+def calculate_estimates_batch(answer_sets: list) -> list:
+    """
+    Calculate cost estimates for many wizard answer sets at once.
+    
+    Each answer set is validated and encoded individually; all valid rows are
+    then evaluated together with array products over the compiled multipliers.
+    Invalid rows produce an error entry instead of failing the batch.
+    
+    Args:
+        answer_sets: List of raw wizard answer dictionaries
+        
+    Returns:
+        List of result dictionaries in input order, each with either a
+        cost_estimate or an error message
+    """
+    estimator = get_estimator()
+    results = [None] * len(answer_sets)
+    positions = []
+    base_codes = []
+    row_codes = []
+    
+    for position, answers in enumerate(answer_sets):
+        try:
+            if not isinstance(answers, dict):
+                raise ValueError("Each answer set must be a JSON object")
+            validated_data = validate_estimate_request(answers)
+            base_code, codes = estimator.encode(validated_data)
+        except (ValueError, TypeError) as e:
+            results[position] = {
+                "index": position,
+                "error": "validation_error",
+                "message": str(e)
+            }
+            continue
+        
+        positions.append(position)
+        base_codes.append(base_code)
+        row_codes.append(codes)
+    
+    if not positions:
+        return results
+    
+    base_costs, final_costs = estimator.evaluate_encoded(base_codes, row_codes)
+    min_costs = final_costs * (1 + estimator.min_cost_deviation)
+    max_costs = final_costs * (1 + estimator.max_cost_deviation)
+    
+    for row, position in enumerate(positions):
+        results[position] = {
+            "index": position,
+            "cost_estimate": {
+                "base_cost": round(float(base_costs[row]), 2),
+                "final_cost": round(float(final_costs[row]), 2),
+                "min_cost": round(float(min_costs[row]), 2),
+                "max_cost": round(float(max_costs[row]), 2),
+                "currency": "USD"
+            }
+        }
+    
+    return results
@@ -0,0 +1,346 @@
+"""
+Compiled Estimator
+
+Pre-resolves question metadata and configuration into lookup tables.
+Each question is bound once to its multiplier table, value mapping,
+explanation and display title, so the estimate hot path only does
+O(1) indexed reads instead of scanning QUESTIONS_METADATA.
+
+The estimator is a snapshot of the configuration at build time.
+Call rebuild_estimator() after changing BASE_COSTS, MULTIPLIERS or the
+cost range settings; its config_version changes with the configuration.
+"""
+
+import hashlib
+import json
+import threading
+
+import numpy as np
+
+from backend.config.base_costs import BASE_COSTS
+from backend.config.multipliers import MULTIPLIERS
+from backend.config import cost_ranges
+from backend.breakdown.generator import format_question_title, format_answer_for_display
+from backend.questions import QUESTIONS_METADATA
+
+
+def _triangular_log_quantiles(downside: float, upside: float, resolution: int):
+    """
+    Tabulate log-quantiles of a triangular distribution on [1 - downside, 1 + upside].
+    
+    Sampling a random index into the table draws log(multiplier / mode)
+    from the distribution by inverse transform.
+    
+    Returns:
+        Array of `resolution` log-quantiles at the bin midpoints
+    """
+    low, high = 1.0 - downside, 1.0 + upside
+    if high <= low:
+        return np.zeros(resolution, dtype=np.float64)
+    
+    u = (np.arange(resolution, dtype=np.float64) + 0.5) / resolution
+    width = high - low
+    mode_cdf = (1.0 - low) / width
+    quantiles = np.where(
+        u < mode_cdf,
+        low + np.sqrt(u * width * (1.0 - low)),
+        high - np.sqrt((1.0 - u) * width * (high - 1.0))
+    )
+    return np.log(quantiles)
+
+
+class CompiledQuestion:
+    """Question metadata resolved against the multiplier configuration."""
+    
+    __slots__ = (
+        "question_id", "position", "input_type", "is_checkbox", "required",
+        "value_mapping", "multiplier_key", "multipliers", "explanation",
+        "title", "affects_base_cost", "option_index", "option_values",
+        "display_values", "uncertainty", "log_quantiles"
+    )
+    
+    def __init__(self, question: dict, position: int):
+        self.question_id = question["question_id"]
+        self.position = position
+        self.input_type = question["input_type"]
+        self.is_checkbox = question["input_type"] == "checkbox"
+        self.required = question["required"]
+        self.value_mapping = dict(question["value_mapping"])
+        self.multiplier_key = question["multiplier_key"]
+        self.explanation = question["explanation"]
+        self.title = format_question_title(self.question_id)
+        self.affects_base_cost = question["affects_base_cost"]
+        
+        # Snapshot of the multiplier table (empty if key is not configured)
+        self.multipliers = dict(MULTIPLIERS.get(self.multiplier_key) or {})
+        
+        # Array form for batch evaluation; the last slot is the neutral 1.0
+        # used for answers that have no configured multiplier
+        options = list(self.multipliers)
+        self.option_index = {option: i for i, option in enumerate(options)}
+        self.option_values = np.array(
+            [self.multipliers[option] for option in options] + [1.0],
+            dtype=np.float64
+        )
+        
+        # Display strings for every known answer value
+        known_values = set(self.value_mapping.values()) | set(self.multipliers)
+        self.display_values = {
+            value: format_answer_for_display(self.question_id, value)
+            for value in known_values if isinstance(value, str)
+        }
+        
+        # Standardized log-quantiles of the multiplier's uncertainty distribution
+        self.uncertainty = tuple(cost_ranges.MULTIPLIER_UNCERTAINTY.get(
+            self.multiplier_key, cost_ranges.DEFAULT_MULTIPLIER_UNCERTAINTY
+        ))
+        self.log_quantiles = _triangular_log_quantiles(
+            *self.uncertainty, cost_ranges.MONTE_CARLO_QUANTILE_RESOLUTION
+        )
+    
+    def format_answer(self, answer) -> str:
+        """
+        Format answer for display (same output as format_answer_for_display).
+        
+        Args:
+            answer: Answer value (string or list)
+            
+        Returns:
+            Formatted answer string
+        """
+        display_values = self.display_values
+        
+        if isinstance(answer, list):
+            if all(a in display_values for a in answer):
+                return ", ".join(display_values[a] for a in answer)
+        elif answer in display_values:
+            return display_values[answer]
+        
+        return format_answer_for_display(self.question_id, answer)
+    
+    def get_multiplier(self, answer_value) -> float:
+        """
+        Get multiplier for an answer (same semantics as config.get_multiplier).
+        
+        Args:
+            answer_value: Normalized answer value
+        
+        Returns:
+            Multiplier value (default 1.0 if not found)
+        """
+        multiplier_map = self.multipliers
+        
+        if isinstance(answer_value, list):
+            total = 1.0
+            for val in answer_value:
+                if val in multiplier_map:
+                    total *= multiplier_map[val]
+            return total
+        
+        return multiplier_map.get(answer_value, 1.0)
+
+
+class CompiledEstimator:
+    """
+    Immutable lookup tables for estimate validation, calculation and breakdown.
+    
+    Attributes:
+        questions: All questions in wizard order
+        questions_by_id: O(1) question lookup by question_id
+        base_cost_question: Question that selects the base cost
+        multiplier_questions: Questions applied as multipliers, in order
+        base_costs: Snapshot of BASE_COSTS
+        min_cost_deviation: Snapshot of MIN_COST_DEVIATION
+        max_cost_deviation: Snapshot of MAX_COST_DEVIATION
+        uncertainty_scale: Snapshot of UNCERTAINTY_DEVIATION_SCALE
+        histogram_bins: Snapshot of MONTE_CARLO_HISTOGRAM_BINS
+        percentile_subbins: Snapshot of MONTE_CARLO_PERCENTILE_SUBBINS
+        quantile_resolution: Snapshot of MONTE_CARLO_QUANTILE_RESOLUTION
+    """
+    
+    def __init__(self):
+        self.questions = tuple(
+            CompiledQuestion(question, position)
+            for position, question in enumerate(QUESTIONS_METADATA)
+        )
+        self.questions_by_id = {q.question_id: q for q in self.questions}
+        self.base_cost_question = next(q for q in self.questions if q.affects_base_cost)
+        self.multiplier_questions = tuple(
+            q for q in self.questions
+            if not q.affects_base_cost and q.multiplier_key
+        )
+        
+        self.base_costs = dict(BASE_COSTS)
+        self.base_index = {size: i for i, size in enumerate(self.base_costs)}
+        self.base_values = np.array(list(self.base_costs.values()), dtype=np.float64)
+        
+        self.min_cost_deviation = cost_ranges.MIN_COST_DEVIATION
+        self.max_cost_deviation = cost_ranges.MAX_COST_DEVIATION
+        self.uncertainty_scale = cost_ranges.UNCERTAINTY_DEVIATION_SCALE
+        self.histogram_bins = cost_ranges.MONTE_CARLO_HISTOGRAM_BINS
+        self.percentile_subbins = cost_ranges.MONTE_CARLO_PERCENTILE_SUBBINS
+        self.quantile_resolution = cost_ranges.MONTE_CARLO_QUANTILE_RESOLUTION
+        self.config_version = self._compute_config_version()
+    
+    def _compute_config_version(self) -> str:
+        """Hash every configuration value that can change an estimate."""
+        config = {
+            "base_costs": self.base_costs,
+            "questions": [
+                [q.question_id, q.input_type, q.value_mapping, q.multipliers, q.uncertainty]
+                for q in self.questions
+            ],
+            "cost_range": [
+                self.min_cost_deviation,
+                self.max_cost_deviation,
+                self.histogram_bins,
+                self.percentile_subbins,
+                self.quantile_resolution,
+                self.uncertainty_scale
+            ]
+        }
+        payload = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+    
+    def fingerprint(self, validated_data: dict) -> str:
+        """
+        Canonical hash of validated answers under this configuration.
+        
+        Checkbox selections are order-normalized, so answer sets that differ
+        only in selection order share a fingerprint. The config version is
+        included, so fingerprints change whenever the configuration does.
+        
+        Args:
+            validated_data: Validated and normalized request data
+            
+        Returns:
+            Hex digest identifying the answers and configuration
+        """
+        answers = []
+        for question in self.questions:
+            value = validated_data.get(question.question_id)
+            if question.is_checkbox and isinstance(value, list):
+                value = sorted(value, key=lambda v: json.dumps(v, sort_keys=True, default=str))
+            answers.append(value)
+        
+        payload = json.dumps([self.config_version, answers], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get_question(self, question_id: str):
+        """Get compiled question by ID, or None if not found."""
+        return self.questions_by_id.get(question_id)
+    
+    def get_base_cost(self, company_size: str) -> float:
+        """
+        Get base cost for company size.
+        
+        Raises:
+            ValueError: If company_size is invalid
+        """
+        if company_size not in self.base_costs:
+            raise ValueError(f"Invalid company size: {company_size}")
+        return self.base_costs[company_size]
+    
+    def encode(self, validated_data: dict) -> tuple:
+        """
+        Encode validated answers as integer indices into the option arrays.
+        
+        Single-choice answers become one index per question. Checkbox answers
+        become selection counts per option, so repeated selections compound.
+        
+        Args:
+            validated_data: Validated and normalized request data
+        
+        Returns:
+            Tuple of (base cost index, list of per-question codes)
+        
+        Raises:
+            ValueError: If company size is invalid
+        """
+        company_size = validated_data[self.base_cost_question.question_id]
+        if company_size not in self.base_index:
+            raise ValueError(f"Invalid company size: {company_size}")
+        
+        codes = []
+        for question in self.multiplier_questions:
+            answer_value = validated_data.get(question.question_id)
+            index = question.option_index
+            unknown = len(index)
+            
+            if question.is_checkbox:
+                counts = [0] * (unknown + 1)
+                for val in answer_value or []:
+                    counts[index.get(val, unknown)] += 1
+                codes.append(counts)
+            elif answer_value is None or isinstance(answer_value, list):
+                codes.append(unknown)
+            else:
+                codes.append(index.get(answer_value, unknown))
+        
+        return self.base_index[company_size], codes
+    
+    def evaluate_encoded(self, base_codes: list, row_codes: list) -> tuple:
+        """
+        Evaluate encoded rows with array products, one column per question.
+        
+        Args:
+            base_codes: Base cost index per row
+            row_codes: Per-question codes per row (from encode)
+        
+        Returns:
+            Tuple of (base cost array, final cost array)
+        """
+        base_costs = self.base_values[np.array(base_codes, dtype=np.intp)]
+        final_costs = base_costs.copy()
+        
+        for j, question in enumerate(self.multiplier_questions):
+            if question.is_checkbox:
+                counts = np.array([row[j] for row in row_codes], dtype=np.float64)
+                final_costs *= np.prod(question.option_values ** counts, axis=1)
+            else:
+                codes = np.array([row[j] for row in row_codes], dtype=np.intp)
+                final_costs *= question.option_values[codes]
+        
+        return base_costs, final_costs
+
+
+_estimator = CompiledEstimator()
+_rebuild_lock = threading.Lock()
+_rebuild_hooks = []
+
+
+def get_estimator() -> CompiledEstimator:
+    """Get the current compiled estimator."""
+    return _estimator
+
+
+def rebuild_estimator() -> CompiledEstimator:
+    """
+    Rebuild the compiled estimator from the current configuration.
+    
+    Must be called after BASE_COSTS, MULTIPLIERS, cost range settings or
+    QUESTIONS_METADATA change. In-flight requests keep the estimator they
+    already obtained. Registered rebuild hooks (cache invalidation) run
+    after the new estimator is in place.
+    
+    Returns:
+        Newly built estimator
+    """
+    global _estimator
+    with _rebuild_lock:
+        _estimator = CompiledEstimator()
+        hooks = list(_rebuild_hooks)
+    
+    for hook in hooks:
+        hook(_estimator)
+    return _estimator
+
+
+def register_rebuild_hook(hook) -> None:
+    """
+    Register a callable invoked with the new estimator after every rebuild.
+    
+    Used by caches of config-dependent results to drop stale entries.
+    """
+    with _rebuild_lock:
+        _rebuild_hooks.append(hook)
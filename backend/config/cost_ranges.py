@@ -3,24 +3,82 @@ Cost Range Configuration
 
 Defines percentage-based deviations for min/max cost calculation.
 These percentages create optimistic (min) and conservative (max) estimates.
+
+Also defines the per-multiplier uncertainty used by the probabilistic
+(Monte Carlo) range mode, where min/max become P10/P90 of simulated costs.
 """
 
 # Percentage deviation from final cost
 MIN_COST_DEVIATION = -0.20  # 20% below final cost (optimistic)
 MAX_COST_DEVIATION = 0.30   # 30% above final cost (conservative)
 
-def calculate_cost_range(final_cost: float) -> dict:
+# Range mode used when a request does not choose one ("fixed" or "monte_carlo")
+DEFAULT_COST_RANGE_MODE = "fixed"
+
+# Monte Carlo simulation settings
+MONTE_CARLO_DEFAULT_SAMPLES = 50000
+MONTE_CARLO_MIN_SAMPLES = 1000
+MONTE_CARLO_MAX_SAMPLES = 200000
+MONTE_CARLO_HISTOGRAM_BINS = 20
+# Precomputed quantiles per distribution; up to 256 keeps sample indices in uint8
+MONTE_CARLO_QUANTILE_RESOLUTION = 256
+# Percentiles are interpolated on histogram bins split this many times,
+# i.e. to within 1/(bins * subbins) of the simulated cost range
+MONTE_CARLO_PERCENTILE_SUBBINS = 100
+
+# Multiplier uncertainty as (downside, upside) fractions of the multiplier.
+# Each multiplier is sampled from a triangular distribution with its
+# configured value as the mode, e.g. 1.0 with (0.10, 0.12) spans 0.90-1.12.
+MULTIPLIER_UNCERTAINTY = {
+    "INFRASTRUCTURE_TYPE_MULTIPLIER": (0.08, 0.08),
+    "DATA_SIZE_MULTIPLIER": (0.10, 0.12),
+    "DATABASE_COMPLEXITY_MULTIPLIER": (0.10, 0.12),
+    "TRAFFIC_VOLUME_MULTIPLIER": (0.08, 0.08),
+    "ARCHITECTURE_TYPE_MULTIPLIER": (0.08, 0.08),
+    "APPLICATION_COUNT_MULTIPLIER": (0.08, 0.08),
+    "OS_DIVERSITY_MULTIPLIER": (0.05, 0.05),
+    "SECURITY_REQUIREMENTS_MULTIPLIER": (0.04, 0.04),
+    "COMPLIANCE_REQUIREMENTS_MULTIPLIER": (0.06, 0.06),
+    "BACKUP_DR_MULTIPLIER": (0.05, 0.05),
+    "AVAILABILITY_MULTIPLIER": (0.05, 0.05),
+    "PEAK_LOAD_MULTIPLIER": (0.08, 0.08),
+    "CICD_AUTOMATION_MULTIPLIER": (0.05, 0.05),
+    "MONITORING_LOGGING_MULTIPLIER": (0.04, 0.04),
+    "TEAM_EXPERIENCE_MULTIPLIER": (0.10, 0.12),
+    "TIMELINE_MULTIPLIER": (0.08, 0.08),
+    "MIGRATION_STRATEGY_MULTIPLIER": (0.12, 0.15)
+}
+
+# Used for multiplier keys missing from MULTIPLIER_UNCERTAINTY
+DEFAULT_MULTIPLIER_UNCERTAINTY = (0.08, 0.08)
+
+# Answers further from neutral (1.0) are less certain: the sampled deviation
+# is scaled by 1 + UNCERTAINTY_DEVIATION_SCALE * |multiplier - 1|
+UNCERTAINTY_DEVIATION_SCALE = 2.0
+
+def calculate_cost_range(
+    final_cost: float,
+    min_deviation: float = None,
+    max_deviation: float = None
+) -> dict:
     """
     Calculate min and max cost range from final cost.
     
     Args:
         final_cost: Calculated final cost estimate
+        min_deviation: Lower deviation; current MIN_COST_DEVIATION if omitted
+        max_deviation: Upper deviation; current MAX_COST_DEVIATION if omitted
         
     Returns:
         Dictionary with min_cost and max_cost
     """
-    min_cost = final_cost * (1 + MIN_COST_DEVIATION)
-    max_cost = final_cost * (1 + MAX_COST_DEVIATION)
+    if min_deviation is None:
+        min_deviation = MIN_COST_DEVIATION
+    if max_deviation is None:
+        max_deviation = MAX_COST_DEVIATION
+    
+    min_cost = final_cost * (1 + min_deviation)
+    max_cost = final_cost * (1 + max_deviation)
     
     return {
         "min_cost": round(min_cost, 2),
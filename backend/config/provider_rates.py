@@ -0,0 +1,125 @@
+"""
+Provider Rate Configuration
+
+Defines simulated hourly compute rates for each provider pricing API.
+The hourly rate is base rate (by OS) x instance multiplier; every
+pricing tier is that on-demand rate times its tier factor.
+Unknown instance types use the default multiplier and unknown operating
+systems are priced as Linux.
+"""
+
+PROVIDER_RATES = {
+    "aws": {
+        "base_rates": {
+            "linux": 0.0415,
+            "windows": 0.083
+        },
+        "instance_multipliers": {
+            "t3.small": 0.5,
+            "t3.medium": 1.0,
+            "t3.large": 2.0,
+            "t3.xlarge": 4.0,
+            "m5.large": 2.0,
+            "m5.xlarge": 4.0,
+            "m5.2xlarge": 8.0
+        },
+        "default_multiplier": 2.0,
+        "tiers": {
+            "reserved_1_year": 0.6,
+            "reserved_3_year": 0.5
+        }
+    },
+    "azure": {
+        "base_rates": {
+            "linux": 0.0468,
+            "windows": 0.0936
+        },
+        "instance_multipliers": {
+            "Standard_B2s": 1.0,
+            "Standard_B4ms": 2.0,
+            "Standard_D2s_v3": 2.0,
+            "Standard_D4s_v3": 4.0,
+            "Standard_D8s_v3": 8.0
+        },
+        "default_multiplier": 2.0,
+        "tiers": {
+            "reserved_1_year": 0.58,
+            "reserved_3_year": 0.48,
+            "spot": 0.7
+        }
+    },
+    "gcp": {
+        "base_rates": {
+            "linux": 0.0495,
+            "windows": 0.099
+        },
+        "instance_multipliers": {
+            "e2-micro": 0.25,
+            "e2-small": 0.5,
+            "e2-medium": 1.0,
+            "e2-standard-2": 2.0,
+            "e2-standard-4": 4.0,
+            "n1-standard-2": 2.0,
+            "n1-standard-4": 4.0
+        },
+        "default_multiplier": 2.0,
+        "tiers": {
+            "committed_use_1_year": 0.7,
+            "committed_use_3_year": 0.5,
+            "sustained_use": 0.8
+        }
+    },
+    "huawei": {
+        "base_rates": {
+            "linux": 0.042,
+            "windows": 0.084
+        },
+        "instance_multipliers": {
+            "s6.small.1": 0.5,
+            "s6.medium.2": 1.0,
+            "s6.large.2": 2.0,
+            "s6.xlarge.2": 4.0,
+            "c6.large.2": 2.0,
+            "c6.xlarge.2": 4.0,
+            "c6.2xlarge.2": 8.0
+        },
+        "default_multiplier": 2.0,
+        "tiers": {
+            "yearly_package_1_year": 0.65,
+            "yearly_package_3_year": 0.55,
+            "spot": 0.75
+        }
+    },
+    "huawei-cce": {
+        "base_rates": {
+            "linux": 0.045,
+            "windows": 0.090
+        },
+        "instance_multipliers": {
+            "standard": 1.0,
+            "autopilot": 1.2,
+            "dedicated": 1.5
+        },
+        "default_multiplier": 1.0,
+        "tiers": {
+            "yearly_package_1_year": 0.65,
+            "yearly_package_3_year": 0.55
+        }
+    },
+    "huawei-cci": {
+        "base_rates": {
+            "linux": 0.044,
+            "windows": 0.088
+        },
+        "instance_multipliers": {
+            "small": 0.5,
+            "medium": 1.0,
+            "large": 2.0,
+            "xlarge": 4.0
+        },
+        "default_multiplier": 1.0,
+        "tiers": {
+            "pay_per_use": 1.0
+        }
+    }
+}
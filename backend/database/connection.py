@@ -2,12 +2,28 @@
 Database Connection Management
 
 Handles PostgreSQL database connection and session management.
+
+Routes use get_request_db(): one session per request, opened on first use
+and closed (rolled back if unfinished) when the app context tears down.
+The connection pool records checkout wait times and timeouts, readable
+through get_pool_stats().
+
+At startup, ensure_schema() compares a fingerprint of the models with the
+one stored in the database and only runs init_db() when they differ.
+DB_INIT_MODE chooses when that happens: "deferred" (on first database
+use, the default), "eager" (before serving) or "off".
 """
 
+import hashlib
 import os
-from sqlalchemy import create_engine
+import threading
+import time
+from flask import g
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # Database configuration from environment variables
 # Supports Neon PostgreSQL (for Render/Vercel) and local PostgreSQL
@@ -36,13 +52,95 @@ if DATABASE_URL.startswith("postgresql://"):
     # Use psycopg (psycopg3) driver for better Python 3.13 support
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
 
+# Pool sizing (per process)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+
+# When app startup checks the schema: deferred, eager or off
+DB_INIT_MODE = os.getenv("DB_INIT_MODE", "deferred").lower()
+if DB_INIT_MODE not in ("eager", "deferred", "off"):
+    raise ValueError(f"DB_INIT_MODE must be eager, deferred or off, not {DB_INIT_MODE!r}")
+
+# cache_versions row holding the fingerprint of the schema init_db() last created
+SCHEMA_VERSION_NAME = "schema"
+
+# Columns create_all() cannot add to existing tables, and the script that adds each
+COLUMN_MIGRATIONS = {
+    "analyses.headline_cost": "backend.scripts.add_analysis_headline_cost",
+    "analyses.headline_provider": "backend.scripts.add_analysis_headline_cost",
+    "providers.features": "backend.scripts.add_features_column"
+}
+
+
+class PoolMetrics:
+    """Thread-safe counters for connection pool checkouts."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connections_created = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+    
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+    
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connections_created += 1
+    
+    def snapshot(self) -> dict:
+        """Get a consistent copy of the counters (wait times in ms)."""
+        with self._lock:
+            checkouts = self.checkouts
+            return {
+                "connections_created": self.connections_created,
+                "checkouts": checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "wait_time_total_ms": round(self.wait_time_total * 1000, 3),
+                "wait_time_avg_ms": round(self.wait_time_total * 1000 / checkouts, 3) if checkouts else 0.0,
+                "wait_time_max_ms": round(self.wait_time_max * 1000, 3)
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times every checkout, including ones that time out."""
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
 engine = create_engine(
     DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,
-    max_overflow=20
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT
 )
 
+@event.listens_for(engine, "connect")
+def _count_connection(dbapi_connection, connection_record):
+    pool_metrics.record_connect()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -60,9 +158,169 @@ def get_db():
     finally:
         db.close()
 
+def get_request_db():
+    """
+    Get the database session for the current request.
+    
+    The session is created on first use and closed by close_request_db()
+    when the app context tears down, so its connection always returns to
+    the pool.
+    """
+    if "db" not in g:
+        if DB_INIT_MODE == "deferred":
+            ensure_schema()
+        g.db = SessionLocal()
+    return g.db
+
+def close_request_db(exc=None):
+    """
+    Close the current request's session, if one was opened.
+    
+    Registered as an app context teardown. Uncommitted work is rolled back.
+    """
+    db = g.pop("db", None)
+    if db is None:
+        return
+    try:
+        if exc is not None:
+            db.rollback()
+    finally:
+        db.close()
+
+def get_pool_stats() -> dict:
+    """
+    Get connection pool statistics.
+    
+    Returns:
+        Dictionary with pool size, connections checked out, checked in and
+        open, overflow in use, connections created (overflow connections are
+        discarded on checkin, so this grows under bursts), checkout counts,
+        checkout timeouts and wait times (ms)
+    """
+    pool = engine.pool
+    stats = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT
+    }
+    
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "connections_open": pool.checkedout() + pool.checkedin(),
+            "overflow": max(0, pool.overflow())
+        })
+    
+    stats.update(pool_metrics.snapshot())
+    return stats
+
 def init_db():
     """
     Initialize database tables.
-    Creates all tables defined in models.
+    Creates all tables defined in models and the education search index.
     """
+    from backend.database.search import setup_education_search
+    
     Base.metadata.create_all(bind=engine)
+    setup_education_search(engine)
+
+def check_columns():
+    """
+    Check that existing tables have every column the models define.
+    
+    create_all() only creates missing tables, so a column added to a model
+    has to be added to an existing table by its migration script.
+    
+    Raises:
+        RuntimeError: If columns are missing, naming them and the scripts that add them
+    """
+    from sqlalchemy import inspect
+    
+    inspector = inspect(engine)
+    missing = []
+    for table in Base.metadata.tables.values():
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(
+            f"{table.name}.{column.name}" for column in table.columns
+            if column.name not in existing
+        )
+    if not missing:
+        return
+    
+    scripts = sorted({COLUMN_MIGRATIONS[name] for name in missing if name in COLUMN_MIGRATIONS})
+    hint = "; ".join(f"python -m {script}" for script in scripts) or "add them with ALTER TABLE"
+    raise RuntimeError(f"Database is missing columns {', '.join(sorted(missing))}. Run: {hint}")
+
+def schema_version() -> int:
+    """
+    Fingerprint the schema init_db() creates: tables, columns, indexes and search setup.
+    
+    Returns:
+        Positive integer that changes whenever the models change
+    """
+    from backend.database import models  # noqa: F401 - registers every table on Base
+    from backend.database.search import POSTGRES_SETUP, SQLITE_SETUP
+    
+    parts = []
+    for table in sorted(Base.metadata.tables.values(), key=lambda table: table.name):
+        parts.append(table.name)
+        parts.extend(f"{column.name}:{column.type}:{column.nullable}" for column in table.columns)
+        parts.extend(sorted(index.name for index in table.indexes))
+    parts.extend(POSTGRES_SETUP + SQLITE_SETUP)
+    digest = hashlib.sha1("\n".join(parts).encode()).hexdigest()
+    # Fits the integer version column
+    return int(digest[:7], 16)
+
+_schema_lock = threading.Lock()
+_schema_checked = False
+
+def ensure_schema() -> bool:
+    """
+    Run init_db() unless the database already has the current schema.
+    
+    The first call reads the stored schema fingerprint (one query); later
+    calls in the same process return at once. After init_db() the tables
+    are checked for missing columns, and the fingerprint is only stored
+    once they pass, so a database that needs a migration fails every check.
+    
+    Returns:
+        True if init_db() ran
+    
+    Raises:
+        RuntimeError: If existing tables are missing model columns
+    """
+    global _schema_checked
+    if _schema_checked:
+        return False
+    
+    with _schema_lock:
+        if _schema_checked:
+            return False
+        
+        version = schema_version()
+        try:
+            with engine.connect() as conn:
+                stored = conn.execute(
+                    text("SELECT version FROM cache_versions WHERE name = :name"),
+                    {"name": SCHEMA_VERSION_NAME}
+                ).scalar()
+        except Exception:
+            # No cache_versions table yet
+            stored = None
+        
+        initialized = stored != version
+        if initialized:
+            init_db()
+            check_columns()
+            with engine.begin() as conn:
+                params = {"name": SCHEMA_VERSION_NAME, "version": version}
+                updated = conn.execute(
+                    text("UPDATE cache_versions SET version = :version, updated_at = CURRENT_TIMESTAMP WHERE name = :name"),
+                    params
+                ).rowcount
+                if not updated:
+                    conn.execute(text("INSERT INTO cache_versions (name, version) VALUES (:name, :version)"), params)
+        
+        _schema_checked = True
+        return initialized
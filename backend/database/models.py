@@ -4,8 +4,9 @@ Database Models
 SQLAlchemy models for users, analyses, and reports.
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, Boolean, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, JSON, Boolean, Text, Index
 from sqlalchemy.sql import func
+from datetime import datetime, timezone
 from backend.database.connection import Base
 
 class User(Base):
@@ -50,9 +51,30 @@ class Analysis(Base):
     # Trends (optional, stored as JSON)
     trends = Column(JSON, nullable=True)
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Headline figures copied out of estimates so listings can skip the JSON columns
+    headline_cost = Column(Float, nullable=True)  # Cheapest monthly cost
+    headline_provider = Column(String, nullable=True)  # Provider with the cheapest monthly cost
+    
+    # Set in Python too so the stored value round-trips exactly into pagination cursors
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    __table_args__ = (
+        # Keyset pagination of a user's analyses, newest first
+        Index("ix_analyses_user_created_id", "user_id", "created_at", "id"),
+    )
+    
+    def to_summary_dict(self):
+        """Convert analysis to a listing summary (no config, estimates or trends)."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "headline_cost": self.headline_cost,
+            "headline_provider": self.headline_provider,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+    
     def to_dict(self):
         """Convert analysis to dictionary."""
         return {
@@ -62,6 +84,8 @@ class Analysis(Base):
             "config": self.config,
             "estimates": self.estimates,
             "trends": self.trends,
+            "headline_cost": self.headline_cost,
+            "headline_provider": self.headline_provider,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -83,16 +107,24 @@ class Education(Base):
     tags = Column(JSON, nullable=True)  # Array of tags
     url = Column(String, nullable=True)  # External URL if applicable
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set in Python too so the stored value round-trips exactly into pagination cursors
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    def to_dict(self):
-        """Convert education to dictionary."""
-        return {
+    __table_args__ = (
+        # Public listings filter active content on one field and sort newest first
+        Index("ix_education_active_created", "is_active", "created_at", "id"),
+        Index("ix_education_active_category", "is_active", "category", "created_at"),
+        Index("ix_education_active_provider", "is_active", "provider", "created_at"),
+        Index("ix_education_active_level_type", "is_active", "level", "type", "created_at"),
+    )
+    
+    def to_dict(self, include_full_content: bool = True):
+        """Convert education to dictionary (full_content only if requested)."""
+        data = {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "full_content": self.full_content,
             "type": self.type,
             "category": self.category,
             "duration": self.duration,
@@ -104,6 +136,9 @@ class Education(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+        if include_full_content:
+            data["full_content"] = self.full_content
+        return data
 
 
 class Provider(Base):
@@ -150,3 +185,30 @@ class Provider(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class CacheVersion(Base):
+    """Version counter per cached dataset, bumped on every write so all worker processes can invalidate."""
+    __tablename__ = "cache_versions"
+    
+    name = Column(String, primary_key=True)  # e.g., providers
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class RevokedToken(Base):
+    """Auth token revoked before its expiry (e.g., on logout); kept until it expires."""
+    __tablename__ = "revoked_tokens"
+    
+    jti = Column(String, primary_key=True)  # Token ID claim
+    user_id = Column(String, index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class TokenCutoff(Base):
+    """Per-user token cutoff: tokens issued before valid_after are rejected (password, role change or deletion)."""
+    __tablename__ = "token_cutoffs"
+    
+    user_id = Column(String, primary_key=True)  # No foreign key: the cutoff outlives a deleted user
+    valid_after = Column(DateTime(timezone=True), index=True, nullable=False)
@@ -0,0 +1,221 @@
+"""
+SQL Query Audit
+
+Counts the SQL statements each request runs, grouped by normalized SQL
+(parameters, literals and IN-lists collapsed), and flags:
+
+- possible N+1 patterns: one normalized statement repeated at least
+  QUERY_REPEAT_THRESHOLD times in a request
+- requests over QUERY_BUDGET statements (0 = no budget)
+- statements slower than SLOW_QUERY_MS, logged with their parameters
+  redacted
+
+QUERY_AUDIT selects what happens to a flagged request: "log" (default)
+logs a warning, "off" removes the hooks. "strict" raises
+QueryBudgetExceeded from the request instead (a 500); it is only ever
+enabled explicitly, for test runs against the test client.
+
+Budgets are enforced in tests and scripts/check_query_budget.py with:
+
+    with query_budget(max_queries=2) as tracker:
+        client.get("/api/providers")
+"""
+
+import logging
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from flask import has_request_context, request
+
+from backend.database.statement_events import observe_statements
+
+QUERY_AUDIT = os.getenv("QUERY_AUDIT", "log").lower()
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", "0"))
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+logger = logging.getLogger(__name__)
+
+if QUERY_AUDIT not in ("off", "log", "strict"):
+    raise ValueError(f"QUERY_AUDIT must be off, log or strict, not {QUERY_AUDIT!r}")
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):[A-Za-z_]\w*|\?")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\([?,\s]*\)(?:\s*,\s*\([?,\s]*\))*", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a query_budget block (or, with QUERY_AUDIT=strict, a request) breaks its budget."""
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape, so per-row repeats group together.
+    
+    Args:
+        statement: SQL as sent to the driver
+    
+    Returns:
+        Statement with placeholders and literals as ?, IN and VALUES lists
+        collapsed, and whitespace squeezed
+    """
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _LITERAL.sub("?", _PLACEHOLDER.sub("?", sql))
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _VALUES_LIST.sub("VALUES (...)", sql)
+
+
+class QueryTracker:
+    """Statements run within one request or query_budget block."""
+    
+    def __init__(self):
+        self.statements: Dict[str, list] = {}
+        self.total = 0
+        self.seconds = 0.0
+    
+    def record(self, statement: str, seconds: float) -> None:
+        entry = self.statements.get(statement)
+        if entry is None:
+            entry = self.statements[statement] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        self.total += 1
+        self.seconds += seconds
+    
+    def repeated(self, threshold: int = QUERY_REPEAT_THRESHOLD) -> List[Tuple[str, int]]:
+        """Normalized statements run at least `threshold` times, most repeated first."""
+        groups: Dict[str, int] = {}
+        for statement, (count, _) in self.statements.items():
+            sql = normalize_sql(statement)
+            groups[sql] = groups.get(sql, 0) + count
+        return sorted(
+            ((sql, count) for sql, count in groups.items() if count >= threshold),
+            key=lambda item: item[1],
+            reverse=True
+        )
+    
+    def violations(self, max_queries: int = QUERY_BUDGET, repeat_threshold: int = QUERY_REPEAT_THRESHOLD) -> List[str]:
+        """
+        Describe how this tracker breaks a budget.
+        
+        Args:
+            max_queries: Statement budget (0 = none)
+            repeat_threshold: Repeats of one normalized statement treated as N+1 (0 = no check)
+        
+        Returns:
+            One message per problem; empty if within budget
+        """
+        problems = []
+        if max_queries and self.total > max_queries:
+            problems.append(f"{self.total} statements, budget is {max_queries}")
+        if repeat_threshold:
+            for sql, count in self.repeated(repeat_threshold):
+                problems.append(f"possible N+1: {count}x {sql[:300]}")
+        return problems
+    
+    def report(self) -> Dict:
+        """Statement count, time and the normalized statements with their counts."""
+        return {
+            "statements": self.total,
+            "seconds": round(self.seconds, 6),
+            "by_statement": self.repeated(1)
+        }
+
+
+_current: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+def _where() -> str:
+    return f"{request.method} {request.path}" if has_request_context() else "outside a request"
+
+
+def _observe_statement(statement, parameters, elapsed):
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.record(statement, elapsed)
+    
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        count = len(parameters) if isinstance(parameters, (list, tuple, dict)) else 0
+        logger.warning("Slow query (%.1f ms, %s, %d parameter(s) redacted): %s",
+                       elapsed * 1000, _where(), count, normalize_sql(statement)[:500],
+                       extra={"duration_ms": round(elapsed * 1000, 2)})
+
+
+def _before_request():
+    # A query_budget block around a test client call collects the request itself
+    if _current.get() is None:
+        request.environ["backend.query_tracker"] = _current.set(QueryTracker())
+
+
+def _after_request(response):
+    token = request.environ.pop("backend.query_tracker", None)
+    if token is None:
+        return response
+    tracker = _current.get()
+    _current.reset(token)
+    
+    problems = tracker.violations()
+    if problems:
+        message = f"Query audit: {_where()}: " + "; ".join(problems)
+        if QUERY_AUDIT == "strict":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message, extra={"statements": tracker.total})
+    return response
+
+
+def _teardown_request(exc=None):
+    # Requests that failed before after_request still release their tracker
+    token = request.environ.pop("backend.query_tracker", None)
+    if token is not None:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int = 0, repeat_threshold: int = QUERY_REPEAT_THRESHOLD):
+    """
+    Track the statements run inside the block and fail if it breaks the budget.
+    
+    Args:
+        max_queries: Statement budget (0 = none)
+        repeat_threshold: Repeats of one normalized statement treated as N+1 (0 = no check)
+    
+    Yields:
+        QueryTracker for the block
+    
+    Raises:
+        QueryBudgetExceeded: If the block ran more statements than allowed
+            or repeated one statement too often
+    """
+    tracker = QueryTracker()
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+    
+    problems = tracker.violations(max_queries, repeat_threshold)
+    if problems:
+        raise QueryBudgetExceeded("; ".join(problems))
+
+
+def init_query_audit(app, engine) -> None:
+    """
+    Audit the SQL statements of every request of a Flask app.
+    
+    Args:
+        app: Flask application
+        engine: SQLAlchemy engine to watch
+    """
+    if QUERY_AUDIT == "off":
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    observe_statements(engine, _observe_statement)
@@ -5,12 +5,193 @@ Data access layer for database operations.
 Separates business logic from database queries.
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import Optional, List, Dict, Any
-from backend.database.models import User, Analysis, Education, Provider
+from sqlalchemy.orm import Session, load_only, defer
+from sqlalchemy import and_, or_, tuple_, cast, false, func, literal_column, Boolean, JSON, update as sql_update, delete as sql_delete
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
+from backend.database.models import User, Analysis, Education, Provider, CacheVersion
+from backend.utils.cache import LRUCache
+import base64
 import hashlib
+import json
+import os
 import secrets
+import threading
+import time
+
+# Seconds a worker trusts its last read of the providers version before re-reading it
+PROVIDER_VERSION_CHECK_INTERVAL = float(os.getenv("PROVIDER_VERSION_CHECK_INTERVAL", "1"))
+
+# Active provider snapshots keyed by providers version
+provider_snapshot_cache = LRUCache("provider_snapshot", maxsize=4)
+
+# Rows per INSERT ... ON CONFLICT statement in bulk upserts
+UPSERT_BATCH_SIZE = int(os.getenv("UPSERT_BATCH_SIZE", "500"))
+
+
+def _update_returning(db: Session, model, conditions: list, values: Dict[str, Any]):
+    """
+    Run UPDATE ... RETURNING for at most one row, in one round trip (no commit).
+    
+    The returned object is fully loaded from RETURNING and detached from
+    the session, so committing afterwards does not expire it and reading
+    it needs no refresh query.
+    
+    Returns:
+        Updated object, or None if no row matched
+    """
+    stmt = (
+        sql_update(model)
+        .where(*conditions)
+        .values(**values)
+        .returning(model)
+        .execution_options(populate_existing=True, synchronize_session=False)
+    )
+    obj = db.execute(stmt).scalars().first()
+    if obj is not None:
+        db.expunge(obj)
+    return obj
+
+
+def _delete_returning(db: Session, model, conditions: list) -> bool:
+    """Run DELETE ... RETURNING id in one round trip (no commit). Returns True if a row was deleted."""
+    stmt = (
+        sql_delete(model)
+        .where(*conditions)
+        .returning(model.id)
+        .execution_options(synchronize_session=False)
+    )
+    return db.execute(stmt).first() is not None
+
+
+def _column_updates(model, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only updates to the model's own columns (never the primary key)."""
+    columns = set(model.__table__.columns.keys()) - {"id"}
+    return {key: value for key, value in updates.items() if key in columns}
+
+
+def _bulk_upsert(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    key: str,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Insert or update rows matched on a unique key, one statement per batch (no commit).
+    
+    Each batch is a single INSERT ... ON CONFLICT DO UPDATE whose update
+    only fires when a column actually differs, with RETURNING reporting the
+    rows written; rows not returned were unchanged. On PostgreSQL the
+    statement also returns (xmax = 0), which is true only for rows it
+    inserted. Elsewhere the keys already present are selected first, in
+    the same transaction. With dry_run, each batch is diffed against a
+    SELECT of the existing rows instead and nothing is written.
+    
+    Args:
+        db: Database session
+        model: Model class
+        rows: Row dictionaries, all with the same columns, including key
+        key: Unique column to match existing rows on
+        batch_size: Rows per statement
+        dry_run: Only report what would change
+    
+    Returns:
+        Dictionary with inserted, updated and unchanged counts and changes
+        (key, action and, for dry runs, the changed fields of each row
+        that would be written)
+    
+    Raises:
+        ValueError: If rows are inconsistent or the database has no upsert support
+    """
+    table = model.__table__
+    columns = list(rows[0].keys()) if rows else []
+    if any(set(row.keys()) != set(columns) for row in rows):
+        raise ValueError("All rows must have the same columns")
+    unknown = set(columns) - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+    keys = [row[key] for row in rows]
+    if len(set(keys)) != len(keys):
+        raise ValueError(f"Duplicate {key} values in rows")
+    
+    # Columns an upsert may change: never the row identity or timestamps
+    compared = [column for column in columns if column not in {"id", key, "created_at", "updated_at"}]
+    result = {"inserted": 0, "updated": 0, "unchanged": 0, "changes": []}
+    
+    dialect = db.get_bind().dialect.name
+    if not dry_run and dialect not in ("postgresql", "sqlite"):
+        raise ValueError(f"Bulk upsert is not supported on {dialect}")
+    
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        
+        if dry_run:
+            existing = {
+                row[0]: row for row in db.query(table.c[key], *[table.c[column] for column in compared])
+                .filter(table.c[key].in_([row[key] for row in batch]))
+            }
+            for row in batch:
+                current = existing.get(row[key])
+                if current is None:
+                    result["inserted"] += 1
+                    result["changes"].append({"key": row[key], "action": "insert", "fields": compared})
+                    continue
+                fields = [column for i, column in enumerate(compared) if current[i + 1] != row[column]]
+                if fields:
+                    result["updated"] += 1
+                    result["changes"].append({"key": row[key], "action": "update", "fields": fields})
+                else:
+                    result["unchanged"] += 1
+            continue
+        
+        # Dialect modules are imported here to keep them out of app startup
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import JSONB, insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(table).values(batch)
+        excluded = stmt.excluded
+        
+        changed = []
+        for column in compared:
+            current, incoming = table.c[column], excluded[column]
+            if dialect == "postgresql" and isinstance(table.c[column].type, JSON):
+                # The json type has no equality operator; compare as jsonb
+                current, incoming = cast(current, JSONB), cast(incoming, JSONB)
+            changed.append(current.is_distinct_from(incoming))
+        
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={**{column: excluded[column] for column in compared}, "updated_at": func.now()},
+            where=or_(*changed) if changed else false()
+        )
+        
+        if dialect == "postgresql":
+            # xmax is 0 for a freshly inserted tuple and set on an updated one
+            written = db.execute(stmt.returning(table.c[key], literal_column("xmax = 0", Boolean))).all()
+        else:
+            existing = {
+                row[0] for row in db.query(table.c[key])
+                .filter(table.c[key].in_([row[key] for row in batch]))
+            }
+            written = [
+                (row_key, row_key not in existing)
+                for row_key, in db.execute(stmt.returning(table.c[key]))
+            ]
+        
+        for row_key, inserted in written:
+            if inserted:
+                result["inserted"] += 1
+                result["changes"].append({"key": row_key, "action": "insert"})
+            else:
+                result["updated"] += 1
+                result["changes"].append({"key": row_key, "action": "update"})
+        result["unchanged"] += len(batch) - len(written)
+    
+    return result
+
 
 # Password hashing (simple for academic project - use bcrypt in production)
 def hash_password(password: str) -> str:
@@ -26,7 +207,14 @@ class UserRepository:
     """Repository for user operations."""
     
     @staticmethod
-    def create(db: Session, email: str, password: str, name: str, title: Optional[str] = None) -> User:
+    def create(
+        db: Session,
+        email: str,
+        password: str,
+        name: str,
+        title: Optional[str] = None,
+        is_admin: bool = False
+    ) -> User:
         """Create a new user."""
         user_id = f"user_{secrets.token_hex(8)}"
         password_hash = hash_password(password)
@@ -36,7 +224,8 @@ class UserRepository:
             email=email,
             password_hash=password_hash,
             name=name,
-            title=title
+            title=title,
+            is_admin=is_admin
         )
         
         db.add(user)
@@ -61,36 +250,32 @@ class UserRepository:
     
     @staticmethod
     def update(db: Session, user_id: str, **updates) -> Optional[User]:
-        """Update user fields."""
-        user = UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
-        
+        """Update user fields (single UPDATE ... RETURNING)."""
+        values = {}
         if "email" in updates:
-            user.email = updates["email"]
+            values["email"] = updates["email"]
         if "name" in updates:
-            user.name = updates["name"]
+            values["name"] = updates["name"]
         if "title" in updates:
-            user.title = updates["title"]
+            values["title"] = updates["title"]
         if "password" in updates:
-            user.password_hash = hash_password(updates["password"])
+            values["password_hash"] = hash_password(updates["password"])
         if "is_admin" in updates:
-            user.is_admin = updates["is_admin"]
+            values["is_admin"] = updates["is_admin"]
         
+        if not values:
+            return UserRepository.get_by_id(db, user_id)
+        
+        user = _update_returning(db, User, [User.id == user_id], values)
         db.commit()
-        db.refresh(user)
         return user
     
     @staticmethod
     def delete(db: Session, user_id: str) -> bool:
-        """Delete user."""
-        user = UserRepository.get_by_id(db, user_id)
-        if not user:
-            return False
-        
-        db.delete(user)
+        """Delete user (single DELETE ... RETURNING)."""
+        deleted = _delete_returning(db, User, [User.id == user_id])
         db.commit()
-        return True
+        return deleted
     
     @staticmethod
     def authenticate(db: Session, email: str, password: str) -> Optional[User]:
@@ -104,9 +289,53 @@ class UserRepository:
         return None
 
 
+def encode_keyset_cursor(created_at: Optional[datetime], row_id: str) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat() if created_at else None, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor from encode_keyset_cursor().
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def headline_from_estimates(estimates: Optional[list]) -> Tuple[Optional[float], Optional[str]]:
+    """Get the cheapest monthly cost and its provider from an analysis' estimates."""
+    best = None
+    for estimate in estimates or []:
+        if not isinstance(estimate, dict):
+            continue
+        cost = estimate.get("monthlyCost")
+        if isinstance(cost, (int, float)) and (best is None or cost < best[0]):
+            best = (float(cost), estimate.get("provider"))
+    return best if best is not None else (None, None)
+
+
 class AnalysisRepository:
     """Repository for analysis operations."""
     
+    # Columns loaded for listings; config, estimates and trends stay unloaded
+    SUMMARY_COLUMNS = (
+        Analysis.id,
+        Analysis.user_id,
+        Analysis.title,
+        Analysis.headline_cost,
+        Analysis.headline_provider,
+        Analysis.created_at,
+        Analysis.updated_at
+    )
+    
     @staticmethod
     def create(
         db: Session,
@@ -118,6 +347,7 @@ class AnalysisRepository:
     ) -> Analysis:
         """Create a new analysis."""
         analysis_id = f"analysis_{secrets.token_hex(12)}"
+        headline_cost, headline_provider = headline_from_estimates(estimates)
         
         analysis = Analysis(
             id=analysis_id,
@@ -125,7 +355,9 @@ class AnalysisRepository:
             title=title,
             config=config,
             estimates=estimates,
-            trends=trends
+            trends=trends,
+            headline_cost=headline_cost,
+            headline_provider=headline_provider
         )
         
         db.add(analysis)
@@ -143,6 +375,60 @@ class AnalysisRepository:
         """Get all analyses for a user."""
         return db.query(Analysis).filter(Analysis.user_id == user_id).order_by(Analysis.created_at.desc()).all()
     
+    @staticmethod
+    def get_summaries_by_user(
+        db: Session,
+        user_id: str,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Analysis], Optional[str]]:
+        """
+        Get one page of a user's analyses, newest first, without the JSON columns.
+        
+        Pages are keyed on (created_at, id), so each page is a single range
+        scan of ix_analyses_user_created_id however deep the user pages.
+        
+        Args:
+            db: Database session
+            user_id: Owner of the analyses
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first page
+        
+        Returns:
+            Tuple of (analyses with only summary columns loaded, cursor for the next page or None)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = db.query(Analysis).options(
+            load_only(*AnalysisRepository.SUMMARY_COLUMNS, raiseload=True)
+        ).filter(Analysis.user_id == user_id)
+        
+        if cursor:
+            created_at, analysis_id = decode_keyset_cursor(cursor)
+            query = query.filter(tuple_(Analysis.created_at, Analysis.id) < tuple_(created_at, analysis_id))
+        
+        # One extra row tells whether another page exists
+        rows = query.order_by(Analysis.created_at.desc(), Analysis.id.desc()).limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_keyset_cursor(rows[-1].created_at, rows[-1].id)
+        return rows, next_cursor
+    
+    @staticmethod
+    def get_by_ids(db: Session, user_id: str, analysis_ids: List[str]) -> List[Analysis]:
+        """Get a user's analyses with full payloads, in the order of analysis_ids."""
+        if not analysis_ids:
+            return []
+        
+        analyses = db.query(Analysis).filter(
+            and_(Analysis.user_id == user_id, Analysis.id.in_(analysis_ids))
+        ).all()
+        by_id = {analysis.id: analysis for analysis in analyses}
+        return [by_id[analysis_id] for analysis_id in dict.fromkeys(analysis_ids) if analysis_id in by_id]
+    
     @staticmethod
     def update(
         db: Session,
@@ -150,39 +436,42 @@ class AnalysisRepository:
         title: Optional[str] = None,
         config: Optional[dict] = None,
         estimates: Optional[list] = None,
-        trends: Optional[list] = None
+        trends: Optional[list] = None,
+        owner_id: Optional[str] = None
     ) -> Optional[Analysis]:
-        """Update analysis."""
-        analysis = AnalysisRepository.get_by_id(db, analysis_id)
-        if not analysis:
-            return None
+        """
+        Update analysis (single UPDATE ... RETURNING).
         
+        With owner_id, only an analysis owned by that user is updated.
+        """
+        conditions = [Analysis.id == analysis_id]
+        if owner_id is not None:
+            conditions.append(Analysis.user_id == owner_id)
+        
+        values = {}
         if title:
-            analysis.title = title
+            values["title"] = title
         if config:
-            analysis.config = config
+            values["config"] = config
         if estimates:
-            analysis.estimates = estimates
+            values["estimates"] = estimates
+            values["headline_cost"], values["headline_provider"] = headline_from_estimates(estimates)
         if trends is not None:
-            analysis.trends = trends
+            values["trends"] = trends
+        
+        if not values:
+            return db.query(Analysis).filter(*conditions).first()
         
+        analysis = _update_returning(db, Analysis, conditions, values)
         db.commit()
-        db.refresh(analysis)
         return analysis
     
     @staticmethod
     def delete(db: Session, analysis_id: str, user_id: str) -> bool:
-        """Delete analysis (only if owned by user)."""
-        analysis = db.query(Analysis).filter(
-            and_(Analysis.id == analysis_id, Analysis.user_id == user_id)
-        ).first()
-        
-        if not analysis:
-            return False
-        
-        db.delete(analysis)
+        """Delete analysis (only if owned by user; single DELETE ... RETURNING)."""
+        deleted = _delete_returning(db, Analysis, [Analysis.id == analysis_id, Analysis.user_id == user_id])
         db.commit()
-        return True
+        return deleted
     
     @staticmethod
     def count_all(db: Session) -> int:
@@ -245,39 +534,194 @@ class EducationRepository:
             query = query.filter(Education.is_active == True)
         return query.order_by(Education.created_at.desc()).all()
     
+    @staticmethod
+    def get_listing(
+        db: Session,
+        active_only: bool = True,
+        category: Optional[str] = None,
+        provider: Optional[str] = None,
+        level: Optional[str] = None,
+        type_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Education], Optional[str]]:
+        """
+        Get filtered education content for list views, newest first.
+        
+        Filters are applied in the query and full_content is not loaded.
+        With a limit, results are paged on (created_at, id).
+        
+        Args:
+            db: Database session
+            active_only: Only include active content
+            category: Category filter
+            provider: Provider filter
+            level: Level filter
+            type_filter: Type filter
+            limit: Page size, or None for every match
+            cursor: Cursor returned with the previous page
+        
+        Returns:
+            Tuple of (education content, cursor for the next page or None)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = db.query(Education).options(defer(Education.full_content, raiseload=True))
+        
+        if active_only:
+            query = query.filter(Education.is_active == True)
+        if category:
+            query = query.filter(Education.category == category)
+        if provider:
+            query = query.filter(Education.provider == provider)
+        if level:
+            query = query.filter(Education.level == level)
+        if type_filter:
+            query = query.filter(Education.type == type_filter)
+        if cursor:
+            created_at, education_id = decode_keyset_cursor(cursor)
+            query = query.filter(tuple_(Education.created_at, Education.id) < tuple_(created_at, education_id))
+        
+        query = query.order_by(Education.created_at.desc(), Education.id.desc())
+        if limit is None:
+            return query.all(), None
+        
+        # One extra row tells whether another page exists
+        rows = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_keyset_cursor(rows[-1].created_at, rows[-1].id)
+        return rows, next_cursor
+    
     @staticmethod
     def update(
         db: Session,
         education_id: str,
         **updates
     ) -> Optional[Education]:
-        """Update education content."""
-        education = EducationRepository.get_by_id(db, education_id)
-        if not education:
-            return None
-        
-        for key, value in updates.items():
-            if hasattr(education, key):
-                setattr(education, key, value)
+        """Update education content (single UPDATE ... RETURNING)."""
+        values = _column_updates(Education, updates)
+        if not values:
+            return EducationRepository.get_by_id(db, education_id)
         
+        education = _update_returning(db, Education, [Education.id == education_id], values)
         db.commit()
-        db.refresh(education)
         return education
     
     @staticmethod
     def delete(db: Session, education_id: str) -> bool:
-        """Delete education content."""
-        education = EducationRepository.get_by_id(db, education_id)
-        if not education:
-            return False
-        
-        db.delete(education)
+        """Delete education content (single DELETE ... RETURNING)."""
+        deleted = _delete_returning(db, Education, [Education.id == education_id])
         db.commit()
-        return True
+        return deleted
+    
+    @staticmethod
+    def bulk_upsert(
+        db: Session,
+        rows: List[Dict[str, Any]],
+        batch_size: int = UPSERT_BATCH_SIZE,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Insert or update education content by ID in one transaction, one statement per batch.
+        
+        Args:
+            db: Database session
+            rows: Education dictionaries with id and the same columns each
+            batch_size: Rows per statement
+            dry_run: Only report what would change
+        
+        Returns:
+            Dictionary with inserted, updated and unchanged counts and changes
+        """
+        try:
+            result = _bulk_upsert(db, Education, rows, "id", batch_size, dry_run)
+        except Exception:
+            db.rollback()
+            raise
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+        return result
 
 
 class ProviderRepository:
-    """Repository for cloud provider operations."""
+    """
+    Repository for cloud provider operations.
+    
+    Active providers are also served from an in-memory snapshot. Every
+    write bumps the "providers" row of cache_versions in the same
+    transaction; workers compare that version (at most once per
+    PROVIDER_VERSION_CHECK_INTERVAL) before reusing their snapshot.
+    """
+    
+    VERSION_NAME = "providers"
+    
+    _known_version = None
+    _version_checked_at = 0.0
+    _version_lock = threading.Lock()
+    
+    @staticmethod
+    def _bump_version(db: Session) -> None:
+        """Increment the providers version (no commit)."""
+        updated = db.query(CacheVersion).filter(
+            CacheVersion.name == ProviderRepository.VERSION_NAME
+        ).update({CacheVersion.version: CacheVersion.version + 1}, synchronize_session=False)
+        if not updated:
+            db.add(CacheVersion(name=ProviderRepository.VERSION_NAME, version=1))
+    
+    @staticmethod
+    def invalidate_snapshot() -> None:
+        """Make the next snapshot read re-check the providers version."""
+        with ProviderRepository._version_lock:
+            ProviderRepository._known_version = None
+    
+    @staticmethod
+    def get_version(db: Session) -> int:
+        """Get the providers version, re-reading it at most once per check interval."""
+        cls = ProviderRepository
+        now = time.monotonic()
+        with cls._version_lock:
+            if cls._known_version is not None and now - cls._version_checked_at < PROVIDER_VERSION_CHECK_INTERVAL:
+                return cls._known_version
+        
+        row = db.query(CacheVersion.version).filter(CacheVersion.name == cls.VERSION_NAME).first()
+        version = row[0] if row else 0
+        with cls._version_lock:
+            cls._known_version = version
+            cls._version_checked_at = now
+        return version
+    
+    @staticmethod
+    def get_active_snapshot(db: Session) -> Dict[str, Any]:
+        """
+        Get the active providers as a cached, pre-serialized snapshot.
+        
+        The version is read before the rows, so a snapshot is never stored
+        under a newer version than the data it holds.
+        
+        Returns:
+            Dictionary with version, providers (list of dicts), body (JSON
+            bytes of {"providers": [...]}) and etag
+        """
+        version = ProviderRepository.get_version(db)
+        snapshot = provider_snapshot_cache.get(version)
+        if snapshot is not None:
+            return snapshot
+        
+        providers = [provider.to_dict() for provider in ProviderRepository.get_all(db, active_only=True)]
+        body = json.dumps({"providers": providers}, sort_keys=True, separators=(",", ":")).encode()
+        snapshot = {
+            "version": version,
+            "providers": providers,
+            "body": body,
+            "etag": hashlib.sha1(body).hexdigest()
+        }
+        provider_snapshot_cache.set(version, snapshot)
+        return snapshot
     
     @staticmethod
     def create(
@@ -314,7 +758,9 @@ class ProviderRepository:
         )
         
         db.add(provider)
+        ProviderRepository._bump_version(db)
         db.commit()
+        ProviderRepository.invalidate_snapshot()
         db.refresh(provider)
         return provider
     
@@ -342,26 +788,65 @@ class ProviderRepository:
         provider_id: str,
         **updates
     ) -> Optional[Provider]:
-        """Update provider."""
-        provider = ProviderRepository.get_by_id(db, provider_id)
-        if not provider:
-            return None
+        """Update provider (single UPDATE ... RETURNING, plus the version bump)."""
+        values = _column_updates(Provider, updates)
+        if not values:
+            return ProviderRepository.get_by_id(db, provider_id)
         
-        for key, value in updates.items():
-            if hasattr(provider, key):
-                setattr(provider, key, value)
+        provider = _update_returning(db, Provider, [Provider.id == provider_id], values)
+        if provider is None:
+            db.rollback()
+            return None
         
+        ProviderRepository._bump_version(db)
         db.commit()
-        db.refresh(provider)
+        ProviderRepository.invalidate_snapshot()
         return provider
     
     @staticmethod
     def delete(db: Session, provider_id: str) -> bool:
-        """Delete provider."""
-        provider = ProviderRepository.get_by_id(db, provider_id)
-        if not provider:
+        """Delete provider (single DELETE ... RETURNING, plus the version bump)."""
+        if not _delete_returning(db, Provider, [Provider.id == provider_id]):
+            db.rollback()
             return False
         
-        db.delete(provider)
+        ProviderRepository._bump_version(db)
         db.commit()
+        ProviderRepository.invalidate_snapshot()
         return True
+    
+    @staticmethod
+    def bulk_upsert(
+        db: Session,
+        rows: List[Dict[str, Any]],
+        batch_size: int = UPSERT_BATCH_SIZE,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Insert or update providers by name in one transaction, one statement per batch.
+        
+        New providers get a generated ID; existing ones keep theirs. The
+        providers version is bumped only if something was written.
+        
+        Args:
+            db: Database session
+            rows: Provider dictionaries with name and the same columns each
+            batch_size: Rows per statement
+            dry_run: Only report what would change
+        
+        Returns:
+            Dictionary with inserted, updated and unchanged counts and changes
+        """
+        rows = [{"id": f"provider_{secrets.token_hex(8)}", **row} for row in rows]
+        try:
+            result = _bulk_upsert(db, Provider, rows, "name", batch_size, dry_run)
+            if dry_run or not (result["inserted"] or result["updated"]):
+                db.rollback()
+                return result
+            ProviderRepository._bump_version(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        ProviderRepository.invalidate_snapshot()
+        return result
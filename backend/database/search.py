@@ -0,0 +1,247 @@
+"""
+Education Full-Text Search
+
+Ranked full-text search over education title, description, tags and
+full_content, backed by an inverted index kept up to date by the database:
+
+- PostgreSQL: a generated, weighted tsvector column with a GIN index,
+  ranked with ts_rank_cd and highlighted with ts_headline.
+- SQLite: an external-content FTS5 table synced by triggers, ranked with
+  bm25 and highlighted with snippet().
+
+Snippets are plain text made HTML-safe: the database wraps matched words
+in private-use marker characters, then markup in the source text is
+dropped and the rest escaped before the markers become <mark>...</mark>.
+Only <mark> tags are ever emitted.
+
+The index lives outside the SQLAlchemy models so list queries never load it.
+"""
+
+import html
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Title matches outrank description, tags and body matches
+POSTGRES_SETUP = [
+    """
+    ALTER TABLE education ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(tags::text, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(full_content, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_education_search_vector ON education USING GIN (search_vector)"
+]
+
+SQLITE_SETUP = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS education_fts USING fts5(
+        title, description, tags, full_content,
+        content='education', content_rowid='rowid', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS education_fts_insert AFTER INSERT ON education BEGIN
+        INSERT INTO education_fts (rowid, title, description, tags, full_content)
+        VALUES (new.rowid, new.title, new.description, new.tags, new.full_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS education_fts_delete AFTER DELETE ON education BEGIN
+        INSERT INTO education_fts (education_fts, rowid, title, description, tags, full_content)
+        VALUES ('delete', old.rowid, old.title, old.description, old.tags, old.full_content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS education_fts_update AFTER UPDATE ON education BEGIN
+        INSERT INTO education_fts (education_fts, rowid, title, description, tags, full_content)
+        VALUES ('delete', old.rowid, old.title, old.description, old.tags, old.full_content);
+        INSERT INTO education_fts (rowid, title, description, tags, full_content)
+        VALUES (new.rowid, new.title, new.description, new.tags, new.full_content);
+    END
+    """
+]
+
+POSTGRES_SEARCH = """
+WITH q AS (SELECT websearch_to_tsquery('english', :query) AS query),
+ranked AS (
+    SELECT e.id, ts_rank_cd(e.search_vector, q.query, 32) AS rank
+    FROM education e, q
+    WHERE e.search_vector @@ q.query {filters}
+    ORDER BY rank DESC, e.id
+    LIMIT :limit OFFSET :offset
+)
+SELECT e.id, e.title, e.description, e.type, e.category, e.duration, e.level,
+       e.provider, e.tags, e.url, r.rank,
+       ts_headline('english', coalesce(e.description, '') || ' ' || coalesce(e.full_content, ''), q.query,
+                   :headline_options) AS snippet
+FROM ranked r JOIN education e ON e.id = r.id, q
+ORDER BY r.rank DESC, e.id
+"""
+
+# bm25 column weights follow the column order of education_fts
+SQLITE_SEARCH = """
+SELECT e.id, e.title, e.description, e.type, e.category, e.duration, e.level,
+       e.provider, e.tags, e.url, -bm25(education_fts, 10.0, 4.0, 4.0, 1.0) AS rank,
+       snippet(education_fts, -1, :mark_start, :mark_end, ' … ', 24) AS snippet
+FROM education_fts JOIN education e ON e.rowid = education_fts.rowid
+WHERE education_fts MATCH :query {filters}
+ORDER BY bm25(education_fts, 10.0, 4.0, 4.0, 1.0), e.id
+LIMIT :limit OFFSET :offset
+"""
+
+FILTER_COLUMNS = ("category", "provider", "level", "type")
+
+# Match markers from the database; private-use characters do not occur in content
+MARK_START = "\ue000"
+MARK_END = "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_END}, "
+    'MinWords=10, MaxWords=30, MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_TAG = re.compile(r"<[^<>]*>")
+_WHITESPACE = re.compile(r"\s+")
+_MARKED = re.compile(f"{MARK_START}([^{MARK_START}{MARK_END}]*){MARK_END}")
+
+
+def setup_education_search(engine: Engine) -> None:
+    """
+    Create the education search index if it does not exist (idempotent).
+    
+    On SQLite, a newly created index is filled from the existing rows.
+    """
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            for statement in POSTGRES_SETUP:
+                conn.execute(text(statement))
+        elif engine.dialect.name == "sqlite":
+            existed = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'education_fts'"
+            )).first() is not None
+            for statement in SQLITE_SETUP:
+                conn.execute(text(statement))
+            if not existed:
+                conn.execute(text("INSERT INTO education_fts (education_fts) VALUES ('rebuild')"))
+
+
+def rebuild_education_search(engine: Engine) -> None:
+    """Rebuild the SQLite search index from the education table (PostgreSQL keeps itself current)."""
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO education_fts (education_fts) VALUES ('rebuild')"))
+
+
+def to_fts5_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query matching every word.
+    
+    Words are quoted so user input cannot inject FTS5 syntax; the last
+    word also matches as a prefix, for search-as-you-type.
+    """
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def render_snippet(raw: Optional[str]) -> str:
+    """
+    Turn a marked database snippet into HTML-safe text with <mark> highlights.
+    
+    Args:
+        raw: Snippet with matches between MARK_START and MARK_END
+    
+    Returns:
+        Escaped text; the only markup is <mark>...</mark> around matches
+    """
+    if not raw:
+        return ""
+    text = html.unescape(_TAG.sub(" ", raw))
+    text = html.escape(_WHITESPACE.sub(" ", text).strip(), quote=False)
+    text = _MARKED.sub(r"<mark>\1</mark>", text)
+    return text.replace(MARK_START, "").replace(MARK_END, "")
+
+
+def search_education(
+    db: Session,
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    filters: Optional[Dict[str, str]] = None
+) -> Tuple[List[Dict], bool]:
+    """
+    Search active education content, best matches first.
+    
+    Args:
+        db: Database session
+        query: Free-text search query
+        limit: Maximum results
+        offset: Results to skip
+        filters: Optional equality filters on category, provider, level and type
+    
+    Returns:
+        Tuple of (results with rank and highlighted snippet, whether more results exist)
+    
+    Raises:
+        ValueError: If the database has no search index support
+    """
+    dialect = db.get_bind().dialect.name
+    params = {"limit": limit + 1, "offset": offset}
+    
+    clauses = ["e.is_active = :is_active"]
+    params["is_active"] = True
+    for column in FILTER_COLUMNS:
+        value = (filters or {}).get(column)
+        if value:
+            clauses.append(f"e.{column} = :{column}")
+            params[column] = value
+    filter_sql = "".join(f" AND {clause}" for clause in clauses)
+    
+    if dialect == "postgresql":
+        params["query"] = query
+        params["headline_options"] = HEADLINE_OPTIONS
+        sql = POSTGRES_SEARCH.format(filters=filter_sql)
+    elif dialect == "sqlite":
+        fts_query = to_fts5_query(query)
+        if fts_query is None:
+            return [], False
+        params["query"] = fts_query
+        params["mark_start"] = MARK_START
+        params["mark_end"] = MARK_END
+        sql = SQLITE_SEARCH.format(filters=filter_sql)
+    else:
+        raise ValueError(f"Full-text search is not supported on {dialect}")
+    
+    rows = db.execute(text(sql), params).mappings().all()
+    has_more = len(rows) > limit
+    
+    results = []
+    for row in rows[:limit]:
+        result = dict(row)
+        result["rank"] = round(float(result["rank"] or 0), 6)
+        result["snippet"] = render_snippet(result["snippet"])
+        if isinstance(result["tags"], str):
+            # SQLite returns the raw JSON text of the column
+            result["tags"] = _load_tags(result["tags"])
+        result["tags"] = result["tags"] or []
+        results.append(result)
+    return results, has_more
+
+
+def _load_tags(raw: str) -> list:
+    """Parse a JSON tags column value, tolerating malformed data."""
+    try:
+        return json.loads(raw) or []
+    except ValueError:
+        return []
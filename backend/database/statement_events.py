@@ -0,0 +1,55 @@
+"""
+SQL Statement Events
+
+One pair of SQLAlchemy cursor-event listeners per engine. Each statement
+is timed once and handed to every registered observer as (statement,
+parameters, seconds). Request metrics and the query audit both observe
+statements through it, so adding a consumer does not add timing hooks.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+
+# observer(statement, parameters, seconds)
+StatementObserver = Callable[[str, object, float], None]
+
+_observers: Dict[object, List[StatementObserver]] = {}
+_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_statement_start", []).append(time.perf_counter())
+
+
+def _listener(observers: List[StatementObserver]):
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_statement_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        for observer in observers:
+            observer(statement, parameters, elapsed)
+    return _after_cursor_execute
+
+
+def observe_statements(engine, observer: StatementObserver) -> None:
+    """
+    Call an observer after every statement an engine executes.
+    
+    Registering the same observer twice has no effect.
+    
+    Args:
+        engine: SQLAlchemy engine
+        observer: Callable taking (statement, parameters, seconds)
+    """
+    with _lock:
+        observers = _observers.get(engine)
+        if observers is None:
+            observers = _observers[engine] = []
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", _listener(observers))
+        if observer not in observers:
+            observers.append(observer)
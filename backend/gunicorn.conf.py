@@ -0,0 +1,64 @@
+"""
+Gunicorn Configuration
+
+Multi-process, multi-threaded production server for wsgi:app.
+
+Run with: cd backend && gunicorn -c gunicorn.conf.py wsgi:app
+
+Tuning (environment):
+    PORT                     Port to bind (Render sets it), default 5000
+    WEB_CONCURRENCY          Worker processes, default min(2 x CPUs + 1, 4)
+    GUNICORN_THREADS         Threads per worker, default 4
+    GUNICORN_TIMEOUT         Seconds before a silent worker is restarted, default 30
+    GUNICORN_MAX_REQUESTS    Requests before a worker is recycled (0 = never), default 1000
+    GUNICORN_KEEPALIVE       Seconds to keep idle client connections open, default 5
+
+Size DB_POOL_SIZE so WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+stays under the database's connection limit; a worker needs at most
+GUNICORN_THREADS connections at once.
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 4)))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# Build the app once in the master; workers share its memory copy-on-write
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers periodically, staggered so they do not restart together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+# Worker heartbeat files in memory rather than on a possibly slow container disk
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    """After preloading: move loaded objects out of the collector's reach so workers keep sharing their pages."""
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """
+    In each new worker: stop using database connections inherited from the master.
+    
+    Connections pooled in the master (e.g., by the startup schema check)
+    are forgotten without being closed, so the master's sockets stay intact
+    and the worker opens its own.
+    """
+    from backend.database.connection import engine
+    engine.dispose(close=False)
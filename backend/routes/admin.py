@@ -4,8 +4,9 @@ Admin API Routes
 Handles admin operations for users, education, and providers management.
 """
 
-from flask import Blueprint, request, jsonify
-from backend.database.connection import get_db
+import os
+from flask import Blueprint, request, jsonify, send_from_directory
+from backend.database.connection import get_request_db, get_pool_stats
 from backend.database.repositories import (
     UserRepository,
     EducationRepository,
@@ -14,6 +15,12 @@ from backend.database.repositories import (
 )
 from backend.utils.error_handler import handle_calculation_error
 from backend.utils.admin_auth import require_admin
+from backend.utils.auth_tokens import deny_list
+from backend.utils.cache import get_all_cache_stats, get_cache, clear_all_caches
+from backend.calculation.estimator import rebuild_estimator
+from backend.services.rate_catalog import rebuild_rate_catalog
+from backend.utils.startup_profile import startup_profile
+from backend.utils.request_profiler import PROFILE_DIR, PROFILE_NAME, list_profiles
 
 admin_bp = Blueprint("admin", __name__)
 
@@ -24,7 +31,7 @@ admin_bp = Blueprint("admin", __name__)
 def list_users():
     """Get all users (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         users = UserRepository.get_all(db)
         
         return jsonify({
@@ -38,7 +45,7 @@ def list_users():
 def get_user(user_id: str):
     """Get user by ID (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         user = UserRepository.get_by_id(db, user_id)
         
         if not user:
@@ -66,20 +73,15 @@ def create_user():
         if not email or not password or not name:
             return jsonify({"error": "Email, password, and name are required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         # Check if user exists
         existing_user = UserRepository.get_by_email(db, email)
         if existing_user:
             return jsonify({"error": "User with this email already exists"}), 400
         
-        # Create user
-        user = UserRepository.create(db, email, password, name, title)
-        
-        # Set admin status if requested
-        if is_admin:
-            UserRepository.update(db, user.id, is_admin=True)
-            user = UserRepository.get_by_id(db, user.id)
+        # Create user (admin status set in the same INSERT)
+        user = UserRepository.create(db, email, password, name, title, is_admin=bool(is_admin))
         
         return jsonify({
             "message": "User created successfully",
@@ -97,7 +99,7 @@ def update_user(user_id: str):
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         updates = {}
         if "email" in data:
@@ -116,6 +118,10 @@ def update_user(user_id: str):
         if not user:
             return jsonify({"error": "User not found"}), 404
         
+        # Issued tokens carry the old role and were obtained with the old password
+        if "password" in updates or "is_admin" in updates:
+            deny_list.revoke_user(db, user_id)
+        
         return jsonify({
             "message": "User updated successfully",
             "user": user.to_dict()
@@ -128,12 +134,14 @@ def update_user(user_id: str):
 def delete_user(user_id: str):
     """Delete user (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         success = UserRepository.delete(db, user_id)
         
         if not success:
             return jsonify({"error": "User not found"}), 404
         
+        deny_list.revoke_user(db, user_id)
+        
         return jsonify({"message": "User deleted successfully"}), 200
     except Exception as e:
         return handle_calculation_error(e)
@@ -146,7 +154,7 @@ def list_education():
     """Get all education content (admin only)."""
     try:
         active_only = request.args.get("active_only", "false").lower() == "true"
-        db = next(get_db())
+        db = get_request_db()
         education = EducationRepository.get_all(db, active_only=active_only)
         
         return jsonify({
@@ -160,7 +168,7 @@ def list_education():
 def get_education(education_id: str):
     """Get education by ID (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         education = EducationRepository.get_by_id(db, education_id)
         
         if not education:
@@ -190,7 +198,7 @@ def create_education():
                 "error": "title, description, type, category, and level are required"
             }), 400
         
-        db = next(get_db())
+        db = get_request_db()
         # Generate ID if not provided
         education_id = data.get("id")
         if not education_id:
@@ -228,7 +236,7 @@ def update_education(education_id: str):
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         updates = {}
         allowed_fields = [
@@ -257,7 +265,7 @@ def update_education(education_id: str):
 def delete_education(education_id: str):
     """Delete education content (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         success = EducationRepository.delete(db, education_id)
         
         if not success:
@@ -275,7 +283,7 @@ def list_providers():
     """Get all providers (admin only)."""
     try:
         active_only = request.args.get("active_only", "false").lower() == "true"
-        db = next(get_db())
+        db = get_request_db()
         providers = ProviderRepository.get_all(db, active_only=active_only)
         
         return jsonify({
@@ -289,7 +297,7 @@ def list_providers():
 def get_provider(provider_id: str):
     """Get provider by ID (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         provider = ProviderRepository.get_by_id(db, provider_id)
         
         if not provider:
@@ -317,7 +325,7 @@ def create_provider():
                 "error": "name, display_name, and short_name are required"
             }), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         # Check if provider exists
         existing_provider = ProviderRepository.get_by_name(db, name)
@@ -355,7 +363,7 @@ def update_provider(provider_id: str):
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         updates = {}
         allowed_fields = [
@@ -385,7 +393,7 @@ def update_provider(provider_id: str):
 def delete_provider(provider_id: str):
     """Delete provider (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         success = ProviderRepository.delete(db, provider_id)
         
         if not success:
@@ -402,7 +410,7 @@ def delete_provider(provider_id: str):
 def count_analyses():
     """Get total count of all analyses (admin only)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         count = AnalysisRepository.count_all(db)
         
         return jsonify({
@@ -410,3 +418,100 @@ def count_analyses():
         }), 200
     except Exception as e:
         return handle_calculation_error(e)
+
+
+# ==================== CACHE MANAGEMENT ====================
+
+@admin_bp.route("/cache/stats", methods=["GET"])
+@require_admin
+def cache_stats():
+    """Get hit/miss/eviction counters for all in-process caches (admin only)."""
+    try:
+        return jsonify({"caches": get_all_cache_stats()}), 200
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/db/pool", methods=["GET"])
+@require_admin
+def db_pool_stats():
+    """Get database connection pool statistics (admin only)."""
+    try:
+        return jsonify({"pool": get_pool_stats()}), 200
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/startup", methods=["GET"])
+@require_admin
+def startup_report():
+    """Get this process's startup timing per blueprint import and init step (admin only)."""
+    try:
+        return jsonify({"startup": startup_profile.report()}), 200
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/profiles", methods=["GET"])
+@require_admin
+def profiles():
+    """List request profiles saved by X-Profile requests, newest first (admin only)."""
+    try:
+        return jsonify({"profiles": list_profiles()}), 200
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/profiles/<name>", methods=["GET"])
+@require_admin
+def download_profile(name: str):
+    """Download a saved request profile (cProfile/pstats format, admin only)."""
+    try:
+        if not PROFILE_NAME.match(name) or not os.path.isfile(os.path.join(PROFILE_DIR, name)):
+            return jsonify({"error": "Profile not found"}), 404
+        return send_from_directory(PROFILE_DIR, name, as_attachment=True, mimetype="application/octet-stream")
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/cache/clear", methods=["POST"])
+@require_admin
+def clear_cache():
+    """
+    Clear one in-process cache, or all of them (admin only).
+    
+    Query Parameters:
+        - name: Cache name from /cache/stats (omit to clear every cache)
+    """
+    try:
+        name = request.args.get("name")
+        
+        if name:
+            cache = get_cache(name)
+            if not cache:
+                return jsonify({"error": "Cache not found"}), 404
+            cache.clear()
+        else:
+            clear_all_caches()
+        
+        return jsonify({"message": "Cache cleared successfully"}), 200
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@admin_bp.route("/config/reload", methods=["POST"])
+@require_admin
+def reload_config():
+    """
+    Recompile estimator and rate catalog tables from the current configuration (admin only).
+    
+    Invalidates every cached estimate, Monte Carlo result and provider price.
+    """
+    try:
+        estimator = rebuild_estimator()
+        rebuild_rate_catalog()
+        
+        pricing_cache = get_cache("provider_pricing")
+        if pricing_cache:
+            pricing_cache.clear()
+        
+        return jsonify({
+            "message": "Configuration reloaded successfully",
+            "config_version": estimator.config_version
+        }), 200
+    except Exception as e:
+        return handle_calculation_error(e)
@@ -5,38 +5,105 @@ Handles CRUD operations for cost analyses and reports.
 """
 
 from flask import Blueprint, request, jsonify
-from backend.database.connection import get_db
+from backend.database.connection import get_request_db
 from backend.database.repositories import AnalysisRepository
 from backend.utils.error_handler import handle_validation_error, handle_calculation_error
+from backend.utils.admin_auth import require_user, get_current_user_id, get_target_user_id, current_user_is_admin
 
 analyses_bp = Blueprint("analyses", __name__)
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_BULK_IDS = 100
+
+def _owned_by_caller(analysis) -> bool:
+    """Whether the token's user may access an analysis (never without a token)."""
+    caller = get_current_user_id()
+    return caller is not None and (current_user_is_admin() or analysis.user_id == caller)
+
 @analyses_bp.route("", methods=["GET"])
+@require_user
 def list_analyses():
-    """Get all analyses for a user."""
+    """
+    Get analyses for a user.
+    
+    With limit and/or cursor, returns one page of summaries (no config,
+    estimates or trends) plus next_cursor. Without them, returns every
+    analysis with its full payload.
+    """
     try:
-        user_id = request.args.get("user_id")
+        user_id = get_target_user_id()
         if not user_id:
             return jsonify({"error": "user_id parameter is required"}), 400
         
-        db = next(get_db())
-        analyses = AnalysisRepository.get_by_user(db, user_id)
+        db = get_request_db()
+        
+        if "limit" not in request.args and "cursor" not in request.args:
+            analyses = AnalysisRepository.get_by_user(db, user_id)
+            return jsonify({
+                "analyses": [analysis.to_dict() for analysis in analyses]
+            }), 200
+        
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        
+        analyses, next_cursor = AnalysisRepository.get_summaries_by_user(
+            db, user_id, limit, request.args.get("cursor") or None
+        )
+        
+        return jsonify({
+            "analyses": [analysis.to_summary_dict() for analysis in analyses],
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }), 200
+        
+    except ValueError as e:
+        return handle_validation_error(e)
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@analyses_bp.route("/bulk", methods=["POST"])
+@require_user
+def get_analyses_bulk():
+    """Get full payloads for a list of a user's analyses by ID."""
+    try:
+        data = request.json
+        if not data:
+            return jsonify({"error": "Request body required"}), 400
+        
+        user_id = get_target_user_id()
+        analysis_ids = data.get("ids")
+        if not user_id or not isinstance(analysis_ids, list):
+            return jsonify({"error": "user_id and ids are required"}), 400
+        if len(analysis_ids) > MAX_BULK_IDS:
+            raise ValueError(f"At most {MAX_BULK_IDS} ids can be fetched at once")
+        if not all(isinstance(analysis_id, str) for analysis_id in analysis_ids):
+            raise ValueError("ids must be a list of strings")
+        
+        db = get_request_db()
+        analyses = AnalysisRepository.get_by_ids(db, user_id, analysis_ids)
+        found = {analysis.id for analysis in analyses}
         
         return jsonify({
-            "analyses": [analysis.to_dict() for analysis in analyses]
+            "analyses": [analysis.to_dict() for analysis in analyses],
+            "missing": [analysis_id for analysis_id in dict.fromkeys(analysis_ids) if analysis_id not in found]
         }), 200
         
+    except ValueError as e:
+        return handle_validation_error(e)
     except Exception as e:
         return handle_calculation_error(e)
 
 @analyses_bp.route("/<analysis_id>", methods=["GET"])
+@require_user
 def get_analysis(analysis_id: str):
     """Get a specific analysis by ID."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         analysis = AnalysisRepository.get_by_id(db, analysis_id)
         
-        if not analysis:
+        if not analysis or not _owned_by_caller(analysis):
             return jsonify({"error": "Analysis not found"}), 404
         
         return jsonify({"analysis": analysis.to_dict()}), 200
@@ -45,6 +112,7 @@ def get_analysis(analysis_id: str):
         return handle_calculation_error(e)
 
 @analyses_bp.route("", methods=["POST"])
+@require_user
 def create_analysis():
     """Create a new analysis."""
     try:
@@ -52,7 +120,7 @@ def create_analysis():
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        user_id = data.get("user_id")
+        user_id = get_target_user_id()
         title = data.get("title")
         config = data.get("config")
         estimates = data.get("estimates")
@@ -63,7 +131,7 @@ def create_analysis():
                 "error": "user_id, title, config, and estimates are required"
             }), 400
         
-        db = next(get_db())
+        db = get_request_db()
         analysis = AnalysisRepository.create(
             db, user_id, title, config, estimates, trends
         )
@@ -77,6 +145,7 @@ def create_analysis():
         return handle_calculation_error(e)
 
 @analyses_bp.route("/<analysis_id>", methods=["PUT"])
+@require_user
 def update_analysis(analysis_id: str):
     """Update an analysis."""
     try:
@@ -84,7 +153,7 @@ def update_analysis(analysis_id: str):
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         updates = {}
         if "title" in data:
@@ -96,7 +165,13 @@ def update_analysis(analysis_id: str):
         if "trends" in data:
             updates["trends"] = data["trends"]
         
-        analysis = AnalysisRepository.update(db, analysis_id, **updates)
+        caller = get_current_user_id()
+        if caller is None:
+            return jsonify({"error": "Analysis not found"}), 404
+        
+        # Non-admins can only update their own analyses (checked in the UPDATE itself)
+        owner_id = None if current_user_is_admin() else caller
+        analysis = AnalysisRepository.update(db, analysis_id, owner_id=owner_id, **updates)
         
         if not analysis:
             return jsonify({"error": "Analysis not found"}), 404
@@ -110,14 +185,15 @@ def update_analysis(analysis_id: str):
         return handle_calculation_error(e)
 
 @analyses_bp.route("/<analysis_id>", methods=["DELETE"])
+@require_user
 def delete_analysis(analysis_id: str):
     """Delete an analysis."""
     try:
-        user_id = request.args.get("user_id")
-        if not user_id:
-            return jsonify({"error": "user_id parameter is required"}), 400
+        user_id = get_target_user_id()
+        if get_current_user_id() is None or not user_id:
+            return jsonify({"error": "Analysis not found or unauthorized"}), 404
         
-        db = next(get_db())
+        db = get_request_db()
         success = AnalysisRepository.delete(db, analysis_id, user_id)
         
         if not success:
@@ -5,9 +5,11 @@ Handles user registration, login, and profile management.
 """
 
 from flask import Blueprint, request, jsonify
-from backend.database.connection import get_db
+from backend.database.connection import get_request_db
 from backend.database.repositories import UserRepository
 from backend.utils.error_handler import handle_validation_error, handle_calculation_error
+from backend.utils.admin_auth import require_user
+from backend.utils.auth_tokens import TokenError, decode_token, deny_list, get_bearer_token, issue_token
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -27,7 +29,7 @@ def register():
         if not email or not password or not name:
             return jsonify({"error": "Email, password, and name are required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         # Check if user exists
         existing_user = UserRepository.get_by_email(db, email)
@@ -36,10 +38,14 @@ def register():
         
         # Create user
         user = UserRepository.create(db, email, password, name, title)
+        token, expires_at = issue_token(user.id, user.is_admin)
         
         return jsonify({
             "message": "User created successfully",
-            "user": user.to_dict()
+            "user": user.to_dict(),
+            "token": token,
+            "token_type": "Bearer",
+            "expires_at": expires_at
         }), 201
         
     except Exception as e:
@@ -47,7 +53,7 @@ def register():
 
 @auth_bp.route("/login", methods=["POST"])
 def login():
-    """Authenticate user and return user data."""
+    """Authenticate user and return user data with a signed access token."""
     try:
         data = request.json
         if not data:
@@ -59,26 +65,54 @@ def login():
         if not email or not password:
             return jsonify({"error": "Email and password are required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         # Authenticate
         user = UserRepository.authenticate(db, email, password)
         if not user:
             return jsonify({"error": "Invalid email or password"}), 401
         
+        token, expires_at = issue_token(user.id, user.is_admin)
+        
         return jsonify({
             "message": "Login successful",
-            "user": user.to_dict()
+            "user": user.to_dict(),
+            "token": token,
+            "token_type": "Bearer",
+            "expires_at": expires_at
         }), 200
         
     except Exception as e:
         return handle_calculation_error(e)
 
+@auth_bp.route("/logout", methods=["POST"])
+def logout():
+    """Revoke the bearer token sent with the request."""
+    try:
+        token = get_bearer_token(request.headers.get("Authorization"))
+        if not token:
+            return jsonify({"error": "Bearer token required"}), 400
+        
+        try:
+            claims = decode_token(token)
+        except TokenError:
+            # Invalid or expired tokens are already unusable
+            return jsonify({"message": "Logout successful"}), 200
+        
+        db = get_request_db()
+        deny_list.revoke(db, claims)
+        
+        return jsonify({"message": "Logout successful"}), 200
+        
+    except Exception as e:
+        return handle_calculation_error(e)
+
 @auth_bp.route("/profile/<user_id>", methods=["GET"])
+@require_user
 def get_profile(user_id: str):
     """Get user profile."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         user = UserRepository.get_by_id(db, user_id)
         
         if not user:
@@ -90,6 +124,7 @@ def get_profile(user_id: str):
         return handle_calculation_error(e)
 
 @auth_bp.route("/profile/<user_id>", methods=["PUT"])
+@require_user
 def update_profile(user_id: str):
     """Update user profile."""
     try:
@@ -97,7 +132,7 @@ def update_profile(user_id: str):
         if not data:
             return jsonify({"error": "Request body required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         updates = {}
         if "email" in data:
@@ -121,6 +156,7 @@ def update_profile(user_id: str):
         return handle_calculation_error(e)
 
 @auth_bp.route("/profile/<user_id>/password", methods=["PUT"])
+@require_user
 def update_password(user_id: str):
     """Update user password."""
     try:
@@ -134,7 +170,7 @@ def update_password(user_id: str):
         if not current_password or not new_password:
             return jsonify({"error": "Current password and new password are required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         
         # Verify current password
         user = UserRepository.get_by_id(db, user_id)
@@ -145,11 +181,16 @@ def update_password(user_id: str):
         if not verify_password(current_password, user.password_hash):
             return jsonify({"error": "Current password is incorrect"}), 401
         
-        # Update password
+        # Update password and log out every token issued before the change
         updated_user = UserRepository.update(db, user_id, password=new_password)
+        deny_list.revoke_user(db, user_id)
+        token, expires_at = issue_token(user_id, updated_user.is_admin)
         
         return jsonify({
-            "message": "Password updated successfully"
+            "message": "Password updated successfully",
+            "token": token,
+            "token_type": "Bearer",
+            "expires_at": expires_at
         }), 200
         
     except Exception as e:
@@ -5,37 +5,104 @@ Handles public access to education content.
 """
 
 from flask import Blueprint, request, jsonify
-from backend.database.connection import get_db
+from backend.database.connection import get_request_db
 from backend.database.repositories import EducationRepository
-from backend.utils.error_handler import handle_calculation_error
+from backend.database.search import search_education
+from backend.utils.error_handler import handle_validation_error, handle_calculation_error
+from backend.utils.server_timing import span
 
 education_bp = Blueprint("education", __name__)
 
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+MAX_QUERY_LENGTH = 200
+
 @education_bp.route("", methods=["GET"])
 def list_education():
-    """Get all active education content (public)."""
+    """
+    Get active education content (public).
+    
+    Filters: category, provider, level, type. With limit and/or cursor,
+    returns one page plus next_cursor. full_content is only returned by
+    the detail route.
+    """
     try:
-        category = request.args.get("category")
-        provider = request.args.get("provider")
-        level = request.args.get("level")
-        type_filter = request.args.get("type")
-        
-        db = next(get_db())
-        education = EducationRepository.get_all(db, active_only=True)
-        
-        # Apply filters
-        if category:
-            education = [e for e in education if e.category == category]
-        if provider:
-            education = [e for e in education if e.provider == provider]
-        if level:
-            education = [e for e in education if e.level == level]
-        if type_filter:
-            education = [e for e in education if e.type == type_filter]
+        limit = None
+        if "limit" in request.args or "cursor" in request.args:
+            limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+            if limit < 1 or limit > MAX_PAGE_SIZE:
+                raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        
+        db = get_request_db()
+        education, next_cursor = EducationRepository.get_listing(
+            db,
+            active_only=True,
+            category=request.args.get("category"),
+            provider=request.args.get("provider"),
+            level=request.args.get("level"),
+            type_filter=request.args.get("type"),
+            limit=limit,
+            cursor=request.args.get("cursor") or None
+        )
+        
+        response = {
+            "education": [edu.to_dict(include_full_content=False) for edu in education]
+        }
+        if limit is not None:
+            response["next_cursor"] = next_cursor
+            response["has_more"] = next_cursor is not None
+        return jsonify(response), 200
+    except ValueError as e:
+        return handle_validation_error(e)
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@education_bp.route("/search", methods=["GET"])
+def search():
+    """
+    Full-text search over active education content (public).
+    
+    Query parameters: q (required), limit, offset, and the list filters
+    category, provider, level and type. Results are ranked best first and
+    carry an HTML-escaped snippet with matched words wrapped in
+    <mark>...</mark>.
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            raise ValueError("q parameter is required")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise ValueError(f"q must be at most {MAX_QUERY_LENGTH} characters")
+        
+        limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        offset = int(request.args.get("offset", 0))
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        
+        db = get_request_db()
+        with span("search"):
+            results, has_more = search_education(
+                db,
+                query,
+                limit=limit,
+                offset=offset,
+                filters={
+                    "category": request.args.get("category"),
+                    "provider": request.args.get("provider"),
+                    "level": request.args.get("level"),
+                    "type": request.args.get("type")
+                }
+            )
         
         return jsonify({
-            "education": [edu.to_dict() for edu in education]
+            "query": query,
+            "results": results,
+            "has_more": has_more
         }), 200
+    except ValueError as e:
+        return handle_validation_error(e)
     except Exception as e:
         return handle_calculation_error(e)
 
@@ -43,7 +110,7 @@ def list_education():
 def get_education(education_id: str):
     """Get education by ID (public, only active)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         education = EducationRepository.get_by_id(db, education_id)
         
         if not education:
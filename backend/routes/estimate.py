@@ -6,17 +6,40 @@ Routes delegate to calculation layer - no business logic here.
 
 This module integrates with AWS, Azure, and GCP Pricing APIs to fetch
 real-time pricing data for accurate cost estimation.
+
+Results are cached by answer fingerprint, which includes the configuration
+version, so rebuilding the estimator invalidates every cached result.
+
+Each stage (validate, cache lookup, calculate, pricing, serialize) is
+reported in the Server-Timing header.
 """
 
+import logging
+import os
 from flask import Blueprint, request, jsonify
-from backend.schemas.estimate_request import validate_estimate_request
-from backend.calculation.engine import calculate_estimate
+from backend.schemas.estimate_request import validate_estimate_request, validate_cost_range_options
+from backend.calculation.engine import calculate_estimate, calculate_estimates_batch
+from backend.calculation.estimator import get_estimator, register_rebuild_hook
 from backend.services.pricing_service import PricingService
+from backend.utils.cache import LRUCache
 from backend.utils.error_handler import handle_validation_error, handle_calculation_error
+from backend.utils.server_timing import span
 
 estimate_bp = Blueprint("estimate", __name__)
+logger = logging.getLogger(__name__)
 pricing_service = PricingService()
 
+# Estimate result cache (size in entries, TTL in seconds)
+estimate_cache = LRUCache(
+    "estimate",
+    maxsize=int(os.getenv("ESTIMATE_CACHE_SIZE", 2048)),
+    ttl=float(os.getenv("ESTIMATE_CACHE_TTL", 3600))
+)
+register_rebuild_hook(lambda estimator: estimate_cache.clear())
+
+# Upper bound on answer sets accepted by a single batch request
+MAX_BATCH_SIZE = 5000
+
 @estimate_bp.route("/estimate", methods=["POST"])
 def estimate():
     """
@@ -26,13 +49,34 @@ def estimate():
     
     This endpoint integrates with cloud provider pricing APIs (AWS, Azure, GCP)
     to fetch real-time pricing data for accurate cost calculations.
+    
+    Optional "cost_range": {"mode": "monte_carlo", "samples": 50000, "seed": 42}
+    replaces the fixed -20%/+30% band with simulated P10/P90 and a histogram.
     """
     try:
         # Validate request
-        validated_data = validate_estimate_request(request.json)
+        with span("validate"):
+            validated_data = validate_estimate_request(request.json)
+            range_options = validate_cost_range_options(request.json)
+        
+        # Unseeded Monte Carlo runs are random by design and never cached
+        cache_key = None
+        if not range_options or range_options["seed"] is not None:
+            with span("cache"):
+                cache_key = (
+                    get_estimator().fingerprint(validated_data),
+                    (range_options["samples"], range_options["seed"]) if range_options else None
+                )
+                cached_result = estimate_cache.get(cache_key)
+            if cached_result is not None:
+                with span("serialize"):
+                    response = jsonify(cached_result)
+                response.headers["X-Cache"] = "HIT"
+                return response, 200
         
         # Delegate to calculation layer (this is the actual calculation - unchanged)
-        result = calculate_estimate(validated_data)
+        with span("calculate"):
+            result = calculate_estimate(validated_data, range_options)
         
         # NOTE: API pricing data is for demonstration only and does not affect calculations
         # Fetch pricing data from provider APIs if providers are specified (optional, for display only)
@@ -50,16 +94,17 @@ def estimate():
                 }
                 
                 # Fetch pricing from provider APIs (for demonstration only)
-                api_pricing_data = pricing_service.get_all_providers_pricing(
-                    providers=validated_data.get("providers", []),
-                    instance_types=instance_types,
-                    os_type=validated_data.get("os_type", "Linux"),
-                    storage_type=validated_data.get("storage_type", "standard-ssd"),
-                    region=validated_data.get("region", "europe")
-                )
+                with span("pricing"):
+                    api_pricing_data = pricing_service.get_all_providers_pricing(
+                        providers=validated_data.get("providers", []),
+                        instance_types=instance_types,
+                        os_type=validated_data.get("os_type", "Linux"),
+                        storage_type=validated_data.get("storage_type", "standard-ssd"),
+                        region=validated_data.get("region", "europe")
+                    )
             except Exception as api_error:
                 # Log API error but continue - this is optional and doesn't affect calculation
-                print(f"Info: API pricing data unavailable (demonstration only): {api_error}")
+                logger.info("API pricing data unavailable (demonstration only): %s", api_error)
         
         # Add API pricing metadata to response (for demonstration only)
         if api_pricing_data:
@@ -69,7 +114,60 @@ def estimate():
                 "note": "Pricing data fetched from official provider APIs (for demonstration only - does not affect calculations)"
             }
         
-        return jsonify(result), 200
+        if cache_key is not None:
+            estimate_cache.set(cache_key, result)
+        
+        with span("serialize"):
+            response = jsonify(result)
+        response.headers["X-Cache"] = "MISS" if cache_key is not None else "BYPASS"
+        return response, 200
+        
+    except ValueError as e:
+        return handle_validation_error(e)
+    except Exception as e:
+        return handle_calculation_error(e)
+
+@estimate_bp.route("/estimate/batch", methods=["POST"])
+def estimate_batch():
+    """
+    POST /api/estimate/batch
+    
+    Accepts a list of wizard answer sets and returns one cost estimate per set.
+    
+    Request Body:
+        {
+            "answer_sets": [
+                {"company_size": "1", "current_infrastructure_type": "hybrid", ...},
+                ...
+            ]
+        }
+    
+    Results are returned in input order. An answer set that fails validation
+    yields an error entry without failing the rest of the batch.
+    """
+    try:
+        data = request.json
+        answer_sets = data.get("answer_sets") if isinstance(data, dict) else data
+        
+        if not isinstance(answer_sets, list) or not answer_sets:
+            raise ValueError("answer_sets must be a non-empty list")
+        if len(answer_sets) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size exceeds maximum of {MAX_BATCH_SIZE}")
+        
+        with span("calculate"):
+            results = calculate_estimates_batch(answer_sets)
+        failed = sum(1 for result in results if "error" in result)
+        
+        with span("serialize"):
+            response = jsonify({
+                "results": results,
+                "summary": {
+                    "total": len(results),
+                    "succeeded": len(results) - failed,
+                    "failed": failed
+                }
+            })
+        return response, 200
         
     except ValueError as e:
         return handle_validation_error(e)
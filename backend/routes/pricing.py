@@ -10,7 +10,9 @@ They do not affect actual cost calculations - those use database/provider config
 
 from flask import Blueprint, request, jsonify
 from backend.services.pricing_service import PricingService
+from backend.services.rate_catalog import get_rate_catalog
 from backend.utils.error_handler import handle_calculation_error
+from backend.utils.server_timing import span
 
 pricing_bp = Blueprint("pricing", __name__)
 pricing_service = PricingService()
@@ -37,13 +39,14 @@ def get_provider_pricing(provider: str):
         storage_type = request.args.get("storage_type", "standard-ssd")
         region = request.args.get("region", "us-east-1")
         
-        pricing_data = pricing_service.get_provider_pricing(
-            provider=provider,
-            instance_type=instance_type,
-            os_type=os_type,
-            storage_type=storage_type,
-            region=region
-        )
+        with span("pricing"):
+            pricing_data = pricing_service.get_provider_pricing(
+                provider=provider,
+                instance_type=instance_type,
+                os_type=os_type,
+                storage_type=storage_type,
+                region=region
+            )
         
         return jsonify({
             "success": True,
@@ -92,13 +95,14 @@ def compare_provider_pricing():
         storage_type = data.get("storage_type", "standard-ssd")
         region = data.get("region", "europe")
         
-        pricing_data = pricing_service.get_all_providers_pricing(
-            providers=providers,
-            instance_types=instance_types,
-            os_type=os_type,
-            storage_type=storage_type,
-            region=region
-        )
+        with span("pricing"):
+            pricing_data = pricing_service.get_all_providers_pricing(
+                providers=providers,
+                instance_types=instance_types,
+                os_type=os_type,
+                storage_type=storage_type,
+                region=region
+            )
         
         return jsonify({
             "success": True,
@@ -108,3 +112,70 @@ def compare_provider_pricing():
         
     except Exception as e:
         return handle_calculation_error(e)
+
+@pricing_bp.route("/pricing/rates", methods=["POST"])
+def get_bulk_rates():
+    """
+    POST /api/pricing/rates
+    
+    Look up hourly rates for many instance types in one call.
+    Every tier (on-demand, reserved/committed, spot, ...) is returned.
+    
+    Request Body:
+        {
+            "queries": [
+                {"provider": "aws", "instance_type": "t3.large", "os_type": "Linux"},
+                {"provider": "huawei-cce", "instance_type": "autopilot"}
+            ]
+        }
+    
+    Returns:
+        {
+            "success": true,
+            "data": [
+                {"provider": "aws", "instance_type": "t3.large", "os_type": "Linux",
+                 "rates": {"on_demand": 0.083, "reserved_1_year": 0.0498, ...}},
+                ...
+            ]
+        }
+    """
+    try:
+        data = request.json or {}
+        queries = data.get("queries")
+        
+        if not isinstance(queries, list):
+            raise ValueError("queries must be a list")
+        
+        keys = []
+        for query in queries:
+            if not isinstance(query, dict) or "provider" not in query:
+                raise ValueError("Each query must be an object with a provider")
+            keys.append((
+                str(query["provider"]).lower(),
+                str(query.get("instance_type", "default")),
+                str(query.get("os_type", "Linux"))
+            ))
+        
+        with span("rates"):
+            rates = get_rate_catalog().get_rates_bulk(keys)
+        
+        return jsonify({
+            "success": True,
+            "data": [
+                {
+                    "provider": provider,
+                    "instance_type": instance_type,
+                    "os_type": os_type,
+                    "rates": dict(tier_rates)
+                }
+                for (provider, instance_type, os_type), tier_rates in zip(keys, rates)
+            ]
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    except Exception as e:
+        return handle_calculation_error(e)
@@ -5,8 +5,8 @@ Defines public endpoints for accessing provider information.
 Available to all authenticated users (not just admins).
 """
 
-from flask import Blueprint, request, jsonify
-from backend.database.connection import get_db
+from flask import Blueprint, request, jsonify, current_app
+from backend.database.connection import get_request_db
 from backend.database.repositories import ProviderRepository
 from backend.utils.error_handler import handle_calculation_error
 
@@ -14,15 +14,31 @@ providers_bp = Blueprint("providers", __name__)
 
 @providers_bp.route("/providers", methods=["GET"])
 def list_providers():
-    """Get all active providers (public endpoint for all users)."""
+    """
+    Get all active providers (public endpoint for all users).
+    
+    Active providers are served from the in-memory snapshot with an ETag;
+    a matching If-None-Match gets 304 without a query or serialization.
+    """
     try:
         active_only = request.args.get("active_only", "true").lower() == "true"
-        db = next(get_db())
-        providers = ProviderRepository.get_all(db, active_only=active_only)
+        db = get_request_db()
         
-        return jsonify({
-            "providers": [provider.to_dict() for provider in providers]
-        }), 200
+        if not active_only:
+            providers = ProviderRepository.get_all(db, active_only=False)
+            return jsonify({
+                "providers": [provider.to_dict() for provider in providers]
+            }), 200
+        
+        snapshot = ProviderRepository.get_active_snapshot(db)
+        if request.if_none_match.contains(snapshot["etag"]):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(snapshot["body"], mimetype="application/json")
+        response.set_etag(snapshot["etag"])
+        # Clients may keep the response but must revalidate before reuse
+        response.headers["Cache-Control"] = "no-cache"
+        return response
     except Exception as e:
         return handle_calculation_error(e)
 
@@ -30,7 +46,7 @@ def list_providers():
 def get_provider(provider_id: str):
     """Get provider by ID (public endpoint for all users)."""
     try:
-        db = next(get_db())
+        db = get_request_db()
         provider = ProviderRepository.get_by_id(db, provider_id)
         
         if not provider:
@@ -5,7 +5,13 @@ Validates incoming estimation requests and normalizes input values.
 Ensures all 18 questions are present and properly formatted.
 """
 
-from backend.questions import QUESTIONS_METADATA, get_question_by_id
+from backend.calculation.estimator import get_estimator
+from backend.config.cost_ranges import (
+    DEFAULT_COST_RANGE_MODE,
+    MONTE_CARLO_DEFAULT_SAMPLES,
+    MONTE_CARLO_MIN_SAMPLES,
+    MONTE_CARLO_MAX_SAMPLES
+)
 
 def validate_estimate_request(request_data: dict) -> dict:
     """
@@ -26,11 +32,10 @@ def validate_estimate_request(request_data: dict) -> dict:
     validated = {}
     
     # Validate each question
-    for question in QUESTIONS_METADATA:
-        question_id = question["question_id"]
-        input_type = question["input_type"]
-        required = question["required"]
-        value_mapping = question["value_mapping"]
+    for question in get_estimator().questions:
+        question_id = question.question_id
+        required = question.required
+        value_mapping = question.value_mapping
         
         # Check if question is present
         if question_id not in request_data:
@@ -41,7 +46,7 @@ def validate_estimate_request(request_data: dict) -> dict:
         raw_value = request_data[question_id]
         
         # Validate based on input type
-        if input_type == "checkbox":
+        if question.is_checkbox:
             # Checkbox returns list
             if not isinstance(raw_value, list):
                 raise ValueError(f"Question {question_id} must be a list (checkbox)")
@@ -58,3 +63,45 @@ def validate_estimate_request(request_data: dict) -> dict:
             validated[question_id] = mapped_value
     
     return validated
+
+
+def validate_cost_range_options(request_data: dict):
+    """
+    Validate the optional cost range mode of an estimation request.
+    
+    Request format:
+        "cost_range": {"mode": "monte_carlo", "samples": 50000, "seed": 42}
+    
+    Args:
+        request_data: Raw JSON request from frontend
+        
+    Returns:
+        None for the fixed range, or dict with samples and seed for Monte Carlo
+        
+    Raises:
+        ValueError: If validation fails
+    """
+    options = (request_data or {}).get("cost_range") or {}
+    if not isinstance(options, dict):
+        raise ValueError("cost_range must be an object")
+    
+    mode = options.get("mode", DEFAULT_COST_RANGE_MODE)
+    if mode == "fixed":
+        return None
+    if mode != "monte_carlo":
+        raise ValueError(f"Invalid cost range mode: {mode}")
+    
+    samples = options.get("samples", MONTE_CARLO_DEFAULT_SAMPLES)
+    if isinstance(samples, bool) or not isinstance(samples, int):
+        raise ValueError("cost_range.samples must be an integer")
+    if not MONTE_CARLO_MIN_SAMPLES <= samples <= MONTE_CARLO_MAX_SAMPLES:
+        raise ValueError(
+            f"cost_range.samples must be between {MONTE_CARLO_MIN_SAMPLES} "
+            f"and {MONTE_CARLO_MAX_SAMPLES}"
+        )
+    
+    seed = options.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or seed < 0):
+        raise ValueError("cost_range.seed must be a non-negative integer")
+    
+    return {"samples": samples, "seed": seed}
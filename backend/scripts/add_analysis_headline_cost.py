@@ -0,0 +1,88 @@
+"""
+Script to add headline cost columns and the listing index to the analyses table.
+
+Adds 'headline_cost' and 'headline_provider', creates the
+(user_id, created_at, id) index used for keyset pagination, and backfills
+the headline columns of existing analyses from their estimates.
+
+Run with: python -m backend.scripts.add_analysis_headline_cost
+"""
+import os
+import sys
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from sqlalchemy import inspect, text
+from backend.database.connection import engine, SessionLocal
+from backend.database.models import Analysis
+from backend.database.repositories import headline_from_estimates
+
+BACKFILL_BATCH_SIZE = 500
+
+NEW_COLUMNS = {
+    "headline_cost": "DOUBLE PRECISION",
+    "headline_provider": "VARCHAR"
+}
+
+def add_headline_columns():
+    """Add the headline columns and listing index if they don't exist."""
+    existing = {column["name"] for column in inspect(engine).get_columns("analyses")}
+    
+    with engine.begin() as conn:
+        for name, column_type in NEW_COLUMNS.items():
+            if name in existing:
+                print(f"✓ '{name}' column already exists in analyses table")
+            else:
+                conn.execute(text(f"ALTER TABLE analyses ADD COLUMN {name} {column_type}"))
+                print(f"✓ Added '{name}' column to analyses table")
+        
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_analyses_user_created_id "
+            "ON analyses (user_id, created_at, id)"
+        ))
+        print("✓ Index ix_analyses_user_created_id is in place")
+
+def backfill_headline_costs() -> int:
+    """Fill the headline columns of analyses saved before they existed."""
+    updated = 0
+    last_id = ""
+    db = SessionLocal()
+    try:
+        while True:
+            batch = db.query(Analysis.id, Analysis.estimates).filter(
+                Analysis.headline_cost.is_(None), Analysis.id > last_id
+            ).order_by(Analysis.id).limit(BACKFILL_BATCH_SIZE).all()
+            if not batch:
+                break
+            
+            for analysis_id, estimates in batch:
+                headline_cost, headline_provider = headline_from_estimates(estimates)
+                if headline_cost is not None:
+                    db.query(Analysis).filter(Analysis.id == analysis_id).update(
+                        {"headline_cost": headline_cost, "headline_provider": headline_provider},
+                        synchronize_session=False
+                    )
+                    updated += 1
+            db.commit()
+            last_id = batch[-1][0]
+    finally:
+        db.close()
+    
+    print(f"✓ Backfilled headline cost for {updated} analyses")
+    return updated
+
+if __name__ == "__main__":
+    print("Adding headline cost columns to analyses table...")
+    try:
+        add_headline_columns()
+        backfill_headline_costs()
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    print("Done!")
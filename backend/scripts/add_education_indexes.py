@@ -0,0 +1,43 @@
+"""
+Script to add the listing indexes to the education table.
+
+Creates the composite indexes declared on the Education model (active
+flag plus category, provider, level/type and creation time) on databases
+whose education table predates them.
+
+Run with: python -m backend.scripts.add_education_indexes
+"""
+import os
+import sys
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from sqlalchemy import inspect
+from backend.database.connection import engine
+from backend.database.models import Education
+
+def add_education_indexes():
+    """Create any missing Education indexes."""
+    try:
+        existing = {index["name"] for index in inspect(engine).get_indexes(Education.__tablename__)}
+        
+        for index in sorted(Education.__table__.indexes, key=lambda index: index.name):
+            if index.name in existing:
+                print(f"✓ Index {index.name} already exists")
+            else:
+                index.create(bind=engine)
+                print(f"✓ Created index {index.name}")
+    except Exception as e:
+        print(f"Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    print("Adding listing indexes to education table...")
+    add_education_indexes()
+    print("Done!")
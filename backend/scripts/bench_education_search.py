@@ -0,0 +1,161 @@
+"""
+Benchmark for education full-text search.
+
+Builds a corpus 100x the size of the seeded education content (every seed
+article copied with varied titles and tags) in a scratch database, then
+times ranked search queries through search_education against a Python scan
+over every row, like the learn page had to do before.
+
+Run with: python -m backend.scripts.bench_education_search [--copies 100] [--runs 200]
+By default a temporary SQLite database (FTS5) is used. Pass --database-url to
+benchmark a scratch PostgreSQL database instead; rows are removed afterwards.
+"""
+
+import sys
+import os
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.connection import Base
+from backend.database.models import Education
+from backend.database.search import search_education, setup_education_search
+from backend.scripts.migrate_education_data import STATIC_EDUCATION_DATA
+
+QUERIES = [
+    "migration strategy",
+    "aws ec2 pricing",
+    "security best practices",
+    "cost optimization",
+    "kubernetes containers",
+    "reserved instances savings",
+    "shared responsibility",
+    "serverless",
+    "disaster recovery backup",
+    "azure virtual machines"
+]
+
+VARIANTS = ["Guide", "Deep Dive", "Workshop", "Checklist", "Case Study", "Primer", "Playbook", "Handbook"]
+
+
+def build_corpus(copies: int) -> list:
+    """Copy every seed article with a varied title, tags and paragraph order."""
+    rng = random.Random(42)
+    rows = []
+    for copy in range(copies):
+        for data in STATIC_EDUCATION_DATA:
+            paragraphs = (data.get("full_content") or "").split("\n\n")
+            rng.shuffle(paragraphs)
+            rows.append({
+                "id": f"bench_{copy}_{data['id']}",
+                "title": f"{data['title']} {VARIANTS[copy % len(VARIANTS)]} {copy}",
+                "description": data["description"],
+                "full_content": "\n\n".join(paragraphs),
+                "type": data["type"],
+                "category": data["category"],
+                "duration": data.get("duration"),
+                "level": data["level"],
+                "provider": data.get("provider"),
+                "tags": data.get("tags", []) + [VARIANTS[copy % len(VARIANTS)].lower()],
+                "url": data.get("url"),
+                "is_active": True
+            })
+    return rows
+
+
+def scan_search(rows: list, query: str) -> list:
+    """Reference: case-insensitive word match over every row, as a client-side filter would."""
+    words = query.lower().split()
+    matches = []
+    for row in rows:
+        haystack = " ".join([
+            row["title"], row["description"], " ".join(row["tags"]), row["full_content"]
+        ]).lower()
+        if all(word in haystack for word in words):
+            matches.append(row["id"])
+    return matches
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_benchmark(database_url: str, copies: int, runs: int) -> None:
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine, tables=[Education.__table__])
+    setup_education_search(engine)
+    Session = sessionmaker(bind=engine)
+    
+    rows = build_corpus(copies)
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(Education.__table__.insert(), rows)
+    load_time = time.perf_counter() - start
+    
+    db = Session()
+    try:
+        # Warm up caches and the index
+        for query in QUERIES:
+            search_education(db, query, limit=20)
+        
+        index_times = []
+        hits = {}
+        for i in range(runs):
+            query = QUERIES[i % len(QUERIES)]
+            start = time.perf_counter()
+            results, _ = search_education(db, query, limit=20)
+            index_times.append((time.perf_counter() - start) * 1000)
+            hits[query] = len(results)
+        
+        scan_times = []
+        for query in QUERIES:
+            start = time.perf_counter()
+            scan_search(rows, query)
+            scan_times.append((time.perf_counter() - start) * 1000)
+        
+        sample, _ = search_education(db, "reserved instances savings", limit=1)
+    finally:
+        db.close()
+        if not database_url.startswith("sqlite"):
+            with engine.begin() as conn:
+                conn.execute(text("DELETE FROM education WHERE id LIKE 'bench\\_%'"))
+        engine.dispose()
+    
+    print("=" * 50)
+    print("Education Search Benchmark")
+    print("=" * 50)
+    print(f"Database:        {engine.dialect.name}")
+    print(f"Corpus:          {len(rows)} articles ({copies}x {len(STATIC_EDUCATION_DATA)} seeded), loaded and indexed in {load_time:.2f} s")
+    print(f"Index search:    p50 {statistics.median(index_times):.2f} ms, p95 {percentile(index_times, 0.95):.2f} ms, max {max(index_times):.2f} ms over {runs} queries")
+    print(f"Python scan:     p50 {statistics.median(scan_times):.2f} ms (rows already in memory)")
+    print(f"Results (top 20): {hits}")
+    if sample:
+        print(f"Top hit:         {sample[0]['title']} (rank {sample[0]['rank']})")
+        print(f"Snippet:         {sample[0]['snippet'][:120]}")
+    print("=" * 50)
+    
+    assert percentile(index_times, 0.95) < 10, "p95 search latency is above 10 ms"
+    print("✓ p95 search latency under 10 ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark education full-text search")
+    parser.add_argument("--copies", type=int, default=100, help="Copies of the seeded corpus")
+    parser.add_argument("--runs", type=int, default=200, help="Timed queries")
+    parser.add_argument("--database-url", help="Scratch database URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+    
+    if args.database_url:
+        run_benchmark(args.database_url, args.copies, args.runs)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            run_benchmark(f"sqlite:///{os.path.join(tmp, 'search_bench.db')}", args.copies, args.runs)
@@ -0,0 +1,168 @@
+"""
+Micro-benchmark for the compiled estimator.
+
+Compares the per-request cost of validate + calculate + breakdown through the
+compiled estimator against the previous path, which walked QUESTIONS_METADATA,
+resolved multipliers through get_multiplier and looked up every answered
+question with the linear get_question_by_id scan.
+
+Exits with status 1, without timing, if the two paths disagree.
+
+Run with: python -m backend.scripts.bench_estimator [--iterations 20000]
+"""
+
+import sys
+import os
+import argparse
+import random
+import timeit
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.breakdown.generator import format_question_title, format_answer_for_display
+from backend.calculation.engine import calculate_estimate
+from backend.config.base_costs import get_base_cost
+from backend.config.cost_ranges import calculate_cost_range
+from backend.config.multipliers import get_multiplier
+from backend.questions import QUESTIONS_METADATA, get_question_by_id, get_base_cost_question
+from backend.schemas.estimate_request import validate_estimate_request
+
+
+# ==================== PREVIOUS PATH (reference copy) ====================
+
+def legacy_validate(request_data: dict) -> dict:
+    """Validation as it worked before the compiled estimator."""
+    validated = {}
+    for question in QUESTIONS_METADATA:
+        question_id = question["question_id"]
+        value_mapping = question["value_mapping"]
+        if question_id not in request_data:
+            if question["required"]:
+                raise ValueError(f"Missing required question: {question_id}")
+            continue
+        raw_value = request_data[question_id]
+        if question["input_type"] == "checkbox":
+            validated[question_id] = [value_mapping.get(str(val), val) for val in raw_value]
+        else:
+            if isinstance(raw_value, list) and len(raw_value) > 0:
+                raw_value = raw_value[0]
+            validated[question_id] = value_mapping.get(str(raw_value), raw_value)
+    return validated
+
+
+def legacy_calculate(validated_data: dict) -> dict:
+    """Calculation and breakdown as they worked before the compiled estimator."""
+    company_size = validated_data[get_base_cost_question()["question_id"]]
+    base_cost = get_base_cost(company_size)
+    final_cost = base_cost
+    applied_multipliers = {}
+    for question in QUESTIONS_METADATA:
+        if question["affects_base_cost"]:
+            continue
+        answer_value = validated_data.get(question["question_id"])
+        if answer_value is None or not question["multiplier_key"]:
+            continue
+        multiplier = get_multiplier(question["multiplier_key"], answer_value)
+        final_cost *= multiplier
+        applied_multipliers[question["question_id"]] = {"multiplier": multiplier, "answer": answer_value}
+    
+    cost_range = calculate_cost_range(final_cost)
+    
+    breakdown = []
+    cumulative_cost = base_cost
+    for question_id, multiplier_data in applied_multipliers.items():
+        question = get_question_by_id(question_id)
+        multiplier = multiplier_data["multiplier"]
+        cost_before = cumulative_cost
+        cumulative_cost *= multiplier
+        breakdown.append({
+            "question_id": question_id,
+            "question_title": format_question_title(question_id),
+            "user_answer": format_answer_for_display(question_id, multiplier_data["answer"]),
+            "multiplier": round(multiplier, 3),
+            "cost_impact": round(cumulative_cost - cost_before, 2),
+            "impact_direction": "increase" if multiplier > 1.0 else "decrease" if multiplier < 1.0 else "neutral",
+            "explanation": question["explanation"]
+        })
+    
+    return {"cost_estimate": cost_range, "breakdown": breakdown}
+
+
+# ==================== BENCHMARK ====================
+
+def generate_answer_sets(count: int, seed: int) -> list:
+    """Generate random wizard answer sets from question value mappings."""
+    rng = random.Random(seed)
+    answer_sets = []
+    for _ in range(count):
+        answers = {}
+        for question in QUESTIONS_METADATA:
+            values = list(question["value_mapping"])
+            if question["input_type"] == "checkbox":
+                answers[question["question_id"]] = rng.sample(values, rng.randint(1, 3))
+            else:
+                answers[question["question_id"]] = rng.choice(values)
+        answer_sets.append(answers)
+    return answer_sets
+
+
+def run_benchmark(iterations: int, seed: int = 42) -> bool:
+    """
+    Time both paths over the same answer sets and print per-request cost.
+    
+    Returns:
+        False (without timing) if the paths disagree on any answer set
+    """
+    answer_sets = generate_answer_sets(256, seed)
+    
+    # Both paths must agree before timing means anything
+    mismatches = []
+    for i, answers in enumerate(answer_sets):
+        legacy = legacy_calculate(legacy_validate(answers))
+        compiled = calculate_estimate(validate_estimate_request(answers))
+        if legacy["cost_estimate"]["final_cost"] != compiled["cost_estimate"]["final_cost"]:
+            mismatches.append((i, "final_cost", legacy["cost_estimate"]["final_cost"], compiled["cost_estimate"]["final_cost"]))
+        elif legacy["breakdown"] != compiled["breakdown"]:
+            mismatches.append((i, "breakdown", None, None))
+    if mismatches:
+        print(f"✗ Compiled path disagrees with the previous path on {len(mismatches)} of {len(answer_sets)} answer sets")
+        for i, field, expected, actual in mismatches[:5]:
+            detail = f": {expected} != {actual}" if field == "final_cost" else ""
+            print(f"    answer set {i}: {field} differs{detail}")
+        return False
+    print(f"✓ Both paths agree on {len(answer_sets)} answer sets")
+    
+    def legacy_path():
+        for answers in answer_sets:
+            legacy_calculate(legacy_validate(answers))
+    
+    def compiled_path():
+        for answers in answer_sets:
+            calculate_estimate(validate_estimate_request(answers))
+    
+    rounds = max(1, iterations // len(answer_sets))
+    legacy_time = min(timeit.repeat(legacy_path, number=rounds, repeat=5))
+    compiled_time = min(timeit.repeat(compiled_path, number=rounds, repeat=5))
+    requests_timed = rounds * len(answer_sets)
+    
+    legacy_us = legacy_time / requests_timed * 1e6
+    compiled_us = compiled_time / requests_timed * 1e6
+    
+    print("=" * 50)
+    print("Estimator Micro-benchmark")
+    print("=" * 50)
+    print(f"Requests per round: {requests_timed}")
+    print(f"Previous path:  {legacy_us:8.2f} us/request")
+    print(f"Compiled path:  {compiled_us:8.2f} us/request")
+    print(f"Saving:         {legacy_us - compiled_us:8.2f} us/request ({legacy_us / compiled_us:.2f}x)")
+    print("=" * 50)
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the compiled estimator")
+    parser.add_argument("--iterations", type=int, default=20000, help="Requests per timing round")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for answer sets")
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.iterations, args.seed) else 1)
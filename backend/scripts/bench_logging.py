@@ -0,0 +1,103 @@
+"""
+Benchmark: cost of logging an error burst to the request thread.
+
+Logs a burst of exceptions with tracebacks to a deliberately slow stdout
+(each write sleeps, like a pipe whose reader is falling behind), once
+with print() + traceback.print_exc() as error handling used to, and once
+through the queued JSON logging of backend.utils.structured_logging.
+Reports the time the calling thread spent per error and how many records
+the bounded queue dropped.
+
+Run with: python -m backend.scripts.bench_logging [--errors 2000] [--write-ms 0.5] [--queue-size 1000]
+"""
+
+import sys
+import os
+import argparse
+import io
+import logging
+import queue
+import time
+import traceback
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.structured_logging import DroppingQueueHandler, JsonFormatter, LogListener
+
+
+class SlowStream(io.StringIO):
+    """Text stream whose every write takes `delay` seconds."""
+    
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+    
+    def write(self, text):
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def fail():
+    raise ValueError("calculation failed for answer set")
+
+
+def bench_print(errors: int, delay: float) -> float:
+    stream = SlowStream(delay)
+    start = time.perf_counter()
+    for _ in range(errors):
+        try:
+            fail()
+        except Exception as error:
+            print(f"ERROR: {type(error).__name__}: {str(error)}", file=stream)
+            traceback.print_exc(file=stream)
+    return (time.perf_counter() - start) / errors
+
+
+def bench_queue(errors: int, delay: float, queue_size: int) -> tuple:
+    output = logging.StreamHandler(SlowStream(delay))
+    output.setFormatter(JsonFormatter())
+    handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    listener = LogListener(handler.queue, output)
+    logger = logging.getLogger("bench_logging")
+    logger.propagate = False
+    logger.addHandler(handler)
+    listener.start()
+    
+    start = time.perf_counter()
+    for _ in range(errors):
+        try:
+            fail()
+        except Exception as error:
+            logger.error("%s: %s", type(error).__name__, error, exc_info=error)
+    per_error = (time.perf_counter() - start) / errors
+    
+    drain_start = time.perf_counter()
+    listener.stop()
+    return per_error, handler.dropped, time.perf_counter() - drain_start
+
+
+def run_benchmark(errors: int, write_ms: float, queue_size: int) -> None:
+    delay = write_ms / 1000
+    print_cost = bench_print(errors, delay)
+    queue_cost, dropped, drain = bench_queue(errors, delay, queue_size)
+    
+    print("=" * 50)
+    print("Error Logging Under a Slow stdout")
+    print("=" * 50)
+    print(f"{errors} errors with tracebacks, {write_ms} ms per stdout write, queue of {queue_size}")
+    print(f"  print + print_exc: {print_cost * 1e6:9.1f} µs per error in the request thread")
+    print(f"  queued JSON:       {queue_cost * 1e6:9.1f} µs per error in the request thread")
+    print(f"  dropped records:   {dropped} (logging thread drained the rest in {drain:.1f} s)")
+    print("=" * 50)
+    print(f"✓ Request thread {print_cost / queue_cost:.0f}x less blocked by logging")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare print() and queued logging under an error burst")
+    parser.add_argument("--errors", type=int, default=2000, help="Errors logged")
+    parser.add_argument("--write-ms", type=float, default=0.5, help="Milliseconds each stdout write takes")
+    parser.add_argument("--queue-size", type=int, default=1000, help="Log queue capacity")
+    args = parser.parse_args()
+    
+    run_benchmark(args.errors, args.write_ms, args.queue_size)
@@ -0,0 +1,189 @@
+"""
+Fan-out benchmark for PricingService.get_all_providers_pricing.
+
+Starts a local stub HTTP server that answers pricing requests after an
+injected per-provider delay, then points every provider at it. Checks
+that the concurrent fan-out takes about max(provider delay) rather than
+sum(provider delay), and that a provider slower than its timeout comes
+back as a partial result with status "timeout". Exits with status 1 if
+a check fails.
+
+Run with: python -m backend.scripts.bench_pricing_fanout
+"""
+
+import sys
+import os
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.pricing_service import PricingService
+
+
+# Injected round-trip delay per provider (milliseconds)
+PROVIDER_DELAYS_MS = {
+    "aws": 180,
+    "azure": 240,
+    "gcp": 120,
+    "huawei": 200,
+    "huawei-cce": 160,
+    "huawei-cci": 220
+}
+
+
+class StubPricingHandler(BaseHTTPRequestHandler):
+    """Answers GET /<provider>?delay_ms=N with a pricing payload after N ms."""
+    
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        params = dict(pair.split("=", 1) for pair in query.split("&") if "=" in pair)
+        time.sleep(int(params.get("delay_ms", 0)) / 1000)
+        
+        body = json.dumps({
+            "hourly_rate": 0.1,
+            "metadata": {"api_endpoint": f"stub{path}", "last_updated": "stub"}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StubPricingService(PricingService):
+    """PricingService whose providers make real HTTP calls to the stub server."""
+    
+    def __init__(self, base_url: str, delays_ms: dict, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+        self.delays_ms = delays_ms
+        self._local = threading.local()
+    
+    def get_provider_pricing(self, provider, instance_type, os_type, storage_type, region):
+        # One keep-alive session per worker thread
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        
+        response = session.get(
+            f"{self.base_url}/{provider}",
+            params={"delay_ms": self.delays_ms[provider]},
+            timeout=self.http_timeout(provider)
+        )
+        response.raise_for_status()
+        compute_pricing = response.json()
+        return {
+            "provider": provider,
+            "compute": compute_pricing,
+            "storage": compute_pricing,
+            "region_multiplier": 1.0,
+            "api_sources": {
+                "compute_api": compute_pricing["metadata"]["api_endpoint"],
+                "storage_api": compute_pricing["metadata"]["api_endpoint"],
+                "last_updated": compute_pricing["metadata"]["last_updated"]
+            }
+        }
+
+
+def time_call(func, rounds: int) -> float:
+    """Best wall time of func over several rounds (seconds)."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(rounds: int) -> bool:
+    """Compare sequential and concurrent fan-out against the stub server. Returns True if every check passed."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPricingHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    providers = list(PROVIDER_DELAYS_MS)
+    service = StubPricingService(base_url, PROVIDER_DELAYS_MS, provider_timeout=2.0, deadline=3.0)
+    
+    def sequential():
+        for provider in providers:
+            service.get_provider_pricing(provider, "default", "Linux", "standard-ssd", "europe")
+    
+    partial_runs = []
+    
+    def concurrent():
+        result = service.get_all_providers_pricing(providers, {}, "Linux", "standard-ssd", "europe")
+        if result["partial"]:
+            partial_runs.append(result["provider_status"])
+    
+    # Warm up connections so both paths measure the injected delays only
+    concurrent()
+    
+    sequential_time = time_call(sequential, rounds)
+    concurrent_time = time_call(concurrent, rounds)
+    sum_ms = sum(PROVIDER_DELAYS_MS.values())
+    max_ms = max(PROVIDER_DELAYS_MS.values())
+    
+    # A provider slower than its timeout must not hold up the others
+    slow_delays = dict(PROVIDER_DELAYS_MS, gcp=1500)
+    slow_service = StubPricingService(
+        base_url, slow_delays,
+        provider_timeout=2.0, deadline=3.0, provider_timeouts={"gcp": 0.5}
+    )
+    start = time.perf_counter()
+    partial = slow_service.get_all_providers_pricing(providers, {}, "Linux", "standard-ssd", "europe")
+    partial_time = time.perf_counter() - start
+    
+    print("=" * 50)
+    print("Pricing Fan-out Benchmark")
+    print("=" * 50)
+    print(f"Providers:            {len(providers)}")
+    print(f"Sum of delays:        {sum_ms:8.0f} ms")
+    print(f"Max delay:            {max_ms:8.0f} ms")
+    print(f"Sequential:           {sequential_time * 1000:8.1f} ms")
+    print(f"Concurrent fan-out:   {concurrent_time * 1000:8.1f} ms")
+    print(f"Partial (gcp 1500ms, 500ms timeout): {partial_time * 1000:.1f} ms")
+    for provider, status in partial["provider_status"].items():
+        print(f"  {provider:<12} {status['status']:<8} {status['latency_ms']:8.1f} ms")
+    print("=" * 50)
+    
+    server.shutdown()
+    
+    checks = [
+        (not partial_runs, "Every provider answered in the concurrent runs"),
+        # Latency tracks the slowest provider, not the total
+        (concurrent_time * 1000 < max_ms + 0.5 * (sum_ms - max_ms), "Fan-out latency tracks the slowest provider"),
+        (sequential_time * 1000 >= sum_ms, "Sequential latency is the sum of the delays"),
+        (
+            partial["partial"] and partial["provider_status"]["gcp"]["status"] == "timeout",
+            "Slow provider reported as timeout"
+        ),
+        (
+            all(
+                status["status"] == "ok"
+                for provider, status in partial["provider_status"].items() if provider != "gcp"
+            ),
+            "Other providers still answered"
+        ),
+        (partial_time < 1.0, "Slow provider did not hold up the fan-out")
+    ]
+    for passed, label in checks:
+        print(f"{'✓' if passed else '✗'} {label}")
+    return all(passed for passed, _ in checks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent provider pricing fan-out")
+    parser.add_argument("--rounds", type=int, default=3, help="Timing rounds per path")
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.rounds) else 1)
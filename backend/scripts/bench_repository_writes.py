@@ -0,0 +1,191 @@
+"""
+Benchmark for single-round-trip repository writes.
+
+Times one-row updates and deletes through the repositories (one
+UPDATE/DELETE ... RETURNING each) against the previous path (SELECT,
+mutate, COMMIT, then a refresh SELECT), and counts database round trips
+per write.
+
+Run with: python -m backend.scripts.bench_repository_writes [--database-url URL] [--writes 300] [--latency-ms 0]
+Point --database-url at a local PostgreSQL scratch database for realistic
+numbers (default: a temporary SQLite file). --latency-ms adds a delay per
+round trip to model a remote database such as Neon. Benchmark rows are
+removed afterwards.
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.database.connection import Base
+from backend.database.models import User, Analysis, Education
+from backend.database.repositories import (
+    UserRepository,
+    AnalysisRepository,
+    EducationRepository,
+    hash_password
+)
+
+PREFIX = "bench16_"
+
+
+# ==================== PREVIOUS PATH (reference copy) ====================
+
+def legacy_update(db, model, row_id: str, **values):
+    """Update as the repositories did it before: SELECT, mutate, COMMIT, refresh."""
+    obj = db.query(model).filter(model.id == row_id).first()
+    if not obj:
+        return None
+    for key, value in values.items():
+        setattr(obj, key, value)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def legacy_delete(db, model, row_id: str) -> bool:
+    """Delete as the repositories did it before: SELECT, DELETE, COMMIT."""
+    obj = db.query(model).filter(model.id == row_id).first()
+    if not obj:
+        return False
+    db.delete(obj)
+    db.commit()
+    return True
+
+
+# ==================== BENCHMARK ====================
+
+class RoundTripCounter:
+    """Counts statements and commits, optionally sleeping on each to model network latency."""
+    
+    def __init__(self, engine, latency_ms: float):
+        self.count = 0
+        self.latency = latency_ms / 1000
+        event.listen(engine, "before_cursor_execute", self._on_round_trip)
+        event.listen(engine, "commit", self._on_round_trip)
+    
+    def _on_round_trip(self, *args, **kwargs):
+        self.count += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+
+def seed(db, writes: int) -> None:
+    """Create the rows the benchmark updates and deletes."""
+    for i in range(writes * 2):
+        db.add(User(id=f"{PREFIX}user_{i}", email=f"{PREFIX}{i}@example.com",
+                    password_hash=hash_password("benchmark"), name=f"Bench {i}"))
+        db.add(Analysis(id=f"{PREFIX}analysis_{i}", user_id=f"{PREFIX}user_0", title=f"Bench {i}",
+                        config={"vcpu": 2}, estimates=[{"provider": "aws", "monthlyCost": 10.0 + i}]))
+        db.add(Education(id=f"{PREFIX}edu_{i}", title=f"Bench {i}", description="Benchmark row",
+                         type="article", category="basics", level="beginner", is_active=True))
+    db.commit()
+
+
+def cleanup(db) -> None:
+    for model in (User, Analysis, Education):
+        db.query(model).filter(model.id.like(f"{PREFIX}%")).delete(synchronize_session=False)
+    db.commit()
+
+
+def measure(Session, counter: RoundTripCounter, operations: list) -> dict:
+    """Run each operation in its own session; return ms and round trips per write."""
+    times = []
+    round_trips = []
+    for operation in operations:
+        db = Session()
+        try:
+            before = counter.count
+            start = time.perf_counter()
+            result = operation(db)
+            times.append((time.perf_counter() - start) * 1000)
+            round_trips.append(counter.count - before)
+            assert result, "write did not find its row"
+        finally:
+            db.close()
+    return {
+        "p50_ms": statistics.median(times),
+        "mean_ms": statistics.fmean(times),
+        "round_trips": statistics.fmean(round_trips)
+    }
+
+
+def run_benchmark(database_url: str, writes: int, latency_ms: float) -> None:
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, Analysis.__table__, Education.__table__])
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    db = Session()
+    try:
+        cleanup(db)
+        seed(db, writes)
+    finally:
+        db.close()
+    
+    counter = RoundTripCounter(engine, latency_ms)
+    ids = range(writes)
+    deleted = range(writes, writes * 2)
+    
+    cases = {
+        "User update": (
+            [lambda db, i=i: legacy_update(db, User, f"{PREFIX}user_{i}", name=f"Legacy {i}") for i in ids],
+            [lambda db, i=i: UserRepository.update(db, f"{PREFIX}user_{i}", name=f"Returning {i}") for i in ids]
+        ),
+        "Analysis update": (
+            [lambda db, i=i: legacy_update(db, Analysis, f"{PREFIX}analysis_{i}", title=f"Legacy {i}") for i in ids],
+            [lambda db, i=i: AnalysisRepository.update(db, f"{PREFIX}analysis_{i}", title=f"Returning {i}") for i in ids]
+        ),
+        "Education update": (
+            [lambda db, i=i: legacy_update(db, Education, f"{PREFIX}edu_{i}", duration="5 min") for i in ids],
+            [lambda db, i=i: EducationRepository.update(db, f"{PREFIX}edu_{i}", duration="10 min") for i in ids]
+        ),
+        "Education delete": (
+            [lambda db, i=i: legacy_delete(db, Education, f"{PREFIX}edu_{i}") for i in deleted[::2]],
+            [lambda db, i=i: EducationRepository.delete(db, f"{PREFIX}edu_{i}") for i in deleted[1::2]]
+        )
+    }
+    
+    print("=" * 50)
+    print("Repository Write Benchmark")
+    print("=" * 50)
+    print(f"Database: {engine.dialect.name}, {writes} writes per case, {latency_ms} ms added per round trip")
+    print(f"{'Case':<18} {'before ms':>10} {'after ms':>10} {'before RT':>10} {'after RT':>10}")
+    try:
+        for name, (legacy_ops, returning_ops) in cases.items():
+            before = measure(Session, counter, legacy_ops)
+            after = measure(Session, counter, returning_ops)
+            print(f"{name:<18} {before['p50_ms']:>10.2f} {after['p50_ms']:>10.2f} "
+                  f"{before['round_trips']:>10.1f} {after['round_trips']:>10.1f}")
+            assert after["round_trips"] < before["round_trips"], f"{name}: no fewer round trips"
+    finally:
+        db = Session()
+        try:
+            cleanup(db)
+        finally:
+            db.close()
+        engine.dispose()
+    print("=" * 50)
+    print("✓ Every write path needs fewer round trips (RT = statements + COMMIT per write)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark single-round-trip repository writes")
+    parser.add_argument("--database-url", help="Scratch database URL (default: temporary SQLite file)")
+    parser.add_argument("--writes", type=int, default=300, help="Writes per case")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added per round trip")
+    args = parser.parse_args()
+    
+    if args.database_url:
+        run_benchmark(args.database_url, args.writes, args.latency_ms)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            run_benchmark(f"sqlite:///{os.path.join(tmp, 'writes_bench.db')}", args.writes, args.latency_ms)
@@ -0,0 +1,97 @@
+"""
+Query budget check: SQL statements per endpoint.
+
+Calls the read endpoints through the Flask test client, each inside
+query_budget(), and fails (exit status 1) if one runs more statements than
+its budget or repeats a statement QUERY_REPEAT_THRESHOLD times (a likely
+N+1). Run it before merging repository or route changes, or as a CI step
+against a database seeded with providers and education content.
+
+Run with: python -m backend.scripts.check_query_budget [--admin-id <user id>] [--verbose]
+"""
+
+import sys
+import os
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.app import create_app
+from backend.database.connection import SessionLocal, ensure_schema
+from backend.database.models import User
+from backend.database.query_audit import QueryBudgetExceeded, query_budget
+from backend.utils.auth_tokens import issue_token
+
+# (method, path, statement budget); {admin} is replaced with the admin's user id.
+# Budgets allow one statement for the per-process cache version and token
+# deny-list checks, which run at most every few seconds.
+ENDPOINTS = [
+    ("GET", "/api/providers", 2),
+    ("GET", "/api/providers?active_only=false", 2),
+    ("GET", "/api/education?limit=24", 2),
+    ("GET", "/api/education/search?q=cloud", 2),
+    ("GET", "/api/analyses?user_id={admin}", 2),
+    ("GET", "/api/admin/users", 2),
+    ("GET", "/api/admin/education", 2),
+    ("GET", "/api/admin/providers", 2),
+    ("GET", "/api/admin/analyses/count", 2)
+]
+
+
+def find_admin_id() -> str:
+    db = SessionLocal()
+    try:
+        admin = db.query(User).filter(User.is_admin.is_(True)).first()
+        if admin is None:
+            raise SystemExit("No admin user found; pass --admin-id")
+        return admin.id
+    finally:
+        db.close()
+
+
+def run_check(admin_id: str, verbose: bool) -> bool:
+    client = create_app().test_client()
+    token, _ = issue_token(admin_id, True)
+    headers = {"Authorization": f"Bearer {token}"}
+    # Run the once-per-process schema check (DB_INIT_MODE=deferred) outside every budget
+    ensure_schema()
+    client.get("/api/health")
+    
+    print("=" * 50)
+    print("Query Budget Check")
+    print("=" * 50)
+    failures = 0
+    for method, path, budget in ENDPOINTS:
+        path = path.format(admin=admin_id)
+        try:
+            with query_budget(max_queries=budget) as tracker:
+                response = client.open(path, method=method, headers=headers)
+            problems = []
+        except QueryBudgetExceeded as e:
+            problems = [str(e)]
+        status = "✓" if not problems and response.status_code < 400 else "✗"
+        failures += status == "✗"
+        print(f"{status} {method} {path}: {tracker.total}/{budget} statements, "
+              f"{tracker.seconds * 1000:.1f} ms, HTTP {response.status_code}")
+        for problem in problems:
+            print(f"    {problem}")
+        if verbose:
+            for sql, count in tracker.report()["by_statement"]:
+                print(f"    {count}x {sql[:120]}")
+    
+    print("=" * 50)
+    if failures:
+        print(f"✗ {failures} endpoint(s) over budget or failing")
+        return False
+    print(f"✓ All {len(ENDPOINTS)} endpoints within budget")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check SQL statements per endpoint against budgets")
+    parser.add_argument("--admin-id", help="Admin user id for admin endpoints (default: first admin)")
+    parser.add_argument("--verbose", action="store_true", help="List each endpoint's statements")
+    args = parser.parse_args()
+    
+    sys.exit(0 if run_check(args.admin_id or find_admin_id(), args.verbose) else 1)
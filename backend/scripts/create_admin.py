@@ -13,7 +13,7 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from backend.database.connection import get_db
+from backend.database.connection import SessionLocal
 from backend.database.repositories import UserRepository
 
 def create_admin(email=None, password=None, name=None, title=None):
@@ -45,9 +45,8 @@ def create_admin(email=None, password=None, name=None, title=None):
         title = input("Enter admin title (optional): ").strip() or None
     
     # Create user
+    db = SessionLocal()
     try:
-        db = next(get_db())
-        
         # Check if user exists
         existing_user = UserRepository.get_by_email(db, email)
         if existing_user:
@@ -79,6 +78,8 @@ def create_admin(email=None, password=None, name=None, title=None):
         print(f"\nERROR: Error creating admin user: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        db.close()
 
 if __name__ == "__main__":
     # Get arguments from command line
@@ -0,0 +1,318 @@
+"""
+Ingest an AWS EC2 bulk offer file into the local price store.
+
+Streams the offer file (local path, .gz, or URL) without loading it into
+memory, keeps only EC2 instance on-demand and reserved rates, and upserts
+them into the price store read by AWSPricingClient. Reports throughput
+and peak RSS when done.
+
+Usage:
+    python -m backend.scripts.ingest_aws_offers <path-or-url> [--store PATH]
+    python -m backend.scripts.ingest_aws_offers https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/AmazonEC2/current/eu-central-1/index.json
+
+To try it without downloading a multi-gigabyte file, write a synthetic
+fixture in the same format first:
+    python -m backend.scripts.ingest_aws_offers --make-fixture /tmp/offer.json --products 20000
+    python -m backend.scripts.ingest_aws_offers /tmp/offer.json --store /tmp/prices.sqlite3
+
+--check ingests a file (or a fresh fixture) into a temporary store and
+exits 1 if two kept SKUs map to the same store key or fewer rows were
+stored than parsed.
+"""
+
+import sys
+import os
+import argparse
+import gzip
+import json
+import random
+import tempfile
+import time
+
+import requests
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.aws_offer_parser import AWSOfferParser
+from backend.services.price_store import PriceStore, PRICE_STORE_PATH
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def open_source(source: str):
+    """Open an offer file as a binary stream."""
+    if source.startswith(("http://", "https://")):
+        response = requests.get(source, stream=True, timeout=60)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return response.raw
+    if source.endswith(".gz"):
+        return gzip.open(source, "rb")
+    return open(source, "rb")
+
+
+def ingest(source: str, store_path: str, operating_systems, chunk_size: int, batch_size: int) -> dict:
+    """
+    Stream one offer file into the price store.
+    
+    Returns:
+        Ingestion statistics
+    """
+    store = PriceStore(store_path)
+    conn = store.connect_writer()
+    start = time.perf_counter()
+    
+    with open_source(source) as fileobj:
+        parser = AWSOfferParser(fileobj, operating_systems, chunk_size)
+        batch = []
+        written = 0
+        for row in parser.iter_rows():
+            batch.append(row)
+            if len(batch) >= batch_size:
+                written += store.upsert_prices(conn, batch)
+                batch = []
+        if batch:
+            written += store.upsert_prices(conn, batch)
+    
+    store.record_source(conn, "aws", source, parser.version, parser.rows)
+    conn.commit()
+    stored = store.count_rows(conn, "aws")
+    conn.close()
+    
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes": parser.bytes_read,
+        "elapsed": elapsed,
+        "products_seen": parser.products_seen,
+        "products_kept": parser.products_kept,
+        "terms_seen": parser.terms_seen,
+        "duplicates": parser.duplicates,
+        "duplicate_skus": parser.duplicate_skus,
+        "rows": parser.rows,
+        "written": written,
+        "stored": stored,
+        "version": parser.version
+    }
+
+
+# ==================== FIXTURE ====================
+
+FIXTURE_REGIONS = [
+    ("eu-central-1", "EU (Frankfurt)"),
+    ("us-east-1", "US East (N. Virginia)"),
+    ("us-west-2", "US West (Oregon)"),
+    ("ap-southeast-1", "Asia Pacific (Singapore)"),
+    ("eu-west-1", "EU (Ireland)"),
+    ("sa-east-1", "South America (Sao Paulo)")
+]
+FIXTURE_INSTANCE_TYPES = [
+    f"{family}{generation}{variant}.{size}"
+    for family in ("t", "m", "c", "r", "x")
+    for generation in range(3, 10)
+    for variant in ("", "a", "d", "n", "g", "i")
+    for size in ("medium", "large", "xlarge", "2xlarge", "4xlarge", "8xlarge",
+                 "12xlarge", "16xlarge", "24xlarge", "32xlarge", "48xlarge", "metal")
+]
+FIXTURE_OPERATING_SYSTEMS = ["Linux", "Windows"]
+
+
+def check(source: str, operating_systems, chunk_size: int, batch_size: int, products: int) -> bool:
+    """
+    Ingest a file into a temporary store and check every kept SKU got its own row.
+    
+    Returns:
+        True if no two kept SKUs shared a store key and every parsed row was stored
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        if source is None:
+            source = os.path.join(tmp, "offer.json")
+            make_fixture(source, products)
+        stats = ingest(source, os.path.join(tmp, "prices.sqlite3"), operating_systems, chunk_size, batch_size)
+    
+    print(f"{'✓' if not stats['duplicates'] else '✗'} {stats['products_kept']} SKUs kept, "
+          f"{stats['duplicates']} dropped for a store key already taken")
+    for key, kept_sku, dropped_sku in stats["duplicate_skus"]:
+        print(f"    {'/'.join(key)}: {kept_sku} kept, {dropped_sku} dropped")
+    print(f"{'✓' if stats['stored'] == stats['rows'] else '✗'} {stats['rows']} price rows parsed, {stats['stored']} stored")
+    return not stats["duplicates"] and stats["stored"] == stats["rows"]
+
+
+def make_fixture(path: str, products: int, seed: int = 42) -> None:
+    """
+    Write a synthetic offer file in the AWS bulk offer format.
+    
+    About half the products are canonical, each with its own (region,
+    instance type, os) key. The rest reuse those keys but are variants the
+    parser must drop (storage, dedicated tenancy, pre-installed software,
+    BYOL, capacity reservations, Local Zones, other OS), and reserved terms
+    include upfront options that must be skipped.
+    """
+    rng = random.Random(seed)
+    keys = [
+        (region, instance_type, os_name)
+        for region in FIXTURE_REGIONS
+        for instance_type in FIXTURE_INSTANCE_TYPES
+        for os_name in FIXTURE_OPERATING_SYSTEMS
+    ]
+    rng.shuffle(keys)
+    used = 0
+    skus = []
+    
+    with open(path, "w") as f:
+        f.write('{\n  "formatVersion" : "v1.0",\n  "disclaimer" : "Synthetic fixture",\n')
+        f.write('  "offerCode" : "AmazonEC2",\n  "version" : "20240115103000",\n')
+        f.write('  "publicationDate" : "2024-01-15T10:30:00Z",\n  "products" : {\n')
+        
+        for i in range(products):
+            sku = f"SKU{i:012d}"
+            canonical = used < len(keys) and (used == 0 or rng.random() < 0.5)
+            if canonical:
+                (region_code, location), instance_type, os_name = keys[used]
+                used += 1
+            else:
+                (region_code, location), instance_type, os_name = keys[rng.randrange(max(used, 1))]
+            attributes = {
+                "servicecode": "AmazonEC2",
+                "location": location,
+                "locationType": "AWS Region",
+                "instanceType": instance_type,
+                "vcpu": "2",
+                "memory": "8 GiB",
+                "tenancy": "Shared",
+                "operatingSystem": os_name,
+                "licenseModel": "License included" if os_name == "Windows" else "No License required",
+                "preInstalledSw": "NA",
+                "capacitystatus": "Used",
+                "marketoption": "OnDemand",
+                "regionCode": region_code
+            }
+            family = "Compute Instance"
+            if not canonical:
+                noise = rng.randrange(8)
+                if noise == 0:
+                    family = "Storage"
+                elif noise == 1:
+                    attributes["tenancy"] = "Dedicated"
+                elif noise == 2:
+                    attributes["preInstalledSw"] = "SQL Std"
+                elif noise == 3:
+                    attributes["licenseModel"] = "Bring your own license"
+                elif noise == 4:
+                    attributes["operatingSystem"] = "RHEL"
+                elif noise == 5:
+                    attributes["capacitystatus"] = "AllocatedCapacityReservation"
+                elif noise == 6:
+                    attributes["capacitystatus"] = "UnusedCapacityReservation"
+                else:
+                    attributes["locationType"] = "AWS Local Zone"
+            product = {"sku": sku, "productFamily": family, "attributes": attributes}
+            f.write(f'    "{sku}" : {json.dumps(product, indent=2)}')
+            f.write(",\n" if i < products - 1 else "\n")
+            skus.append(sku)
+        
+        f.write('  },\n  "terms" : {\n    "OnDemand" : {\n')
+        for i, sku in enumerate(skus):
+            price = round(rng.uniform(0.01, 2.0), 6)
+            term = {
+                f"{sku}.JRTCKXETXF": {
+                    "offerTermCode": "JRTCKXETXF",
+                    "sku": sku,
+                    "effectiveDate": "2024-01-01T00:00:00Z",
+                    "priceDimensions": {
+                        f"{sku}.JRTCKXETXF.6YS6EN2CT7": {
+                            "unit": "Hrs",
+                            "pricePerUnit": {"USD": f"{price:.10f}"}
+                        }
+                    },
+                    "termAttributes": {}
+                }
+            }
+            f.write(f'      "{sku}" : {json.dumps(term)}')
+            f.write(",\n" if i < len(skus) - 1 else "\n")
+        
+        f.write('    },\n    "Reserved" : {\n')
+        for i, sku in enumerate(skus):
+            term = {}
+            for lease, factor in (("1yr", 0.6), ("3yr", 0.45)):
+                for option in ("No Upfront", "All Upfront"):
+                    code = f"{lease}{option.replace(' ', '')}"
+                    term[f"{sku}.{code}"] = {
+                        "offerTermCode": code,
+                        "sku": sku,
+                        "effectiveDate": "2024-01-01T00:00:00Z",
+                        "priceDimensions": {
+                            f"{sku}.{code}.HRS": {
+                                "unit": "Hrs",
+                                "pricePerUnit": {"USD": f"{factor * (i % 97 + 1) / 50:.10f}"}
+                            }
+                        },
+                        "termAttributes": {
+                            "LeaseContractLength": lease,
+                            "OfferingClass": "standard",
+                            "PurchaseOption": option
+                        }
+                    }
+            f.write(f'      "{sku}" : {json.dumps(term)}')
+            f.write(",\n" if i < len(skus) - 1 else "\n")
+        
+        f.write('    }\n  }\n}\n')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest an AWS EC2 offer file into the local price store")
+    parser.add_argument("source", nargs="?", help="Offer file path (.json or .json.gz) or URL")
+    parser.add_argument("--store", default=PRICE_STORE_PATH, help="Price store path")
+    parser.add_argument("--os", nargs="+", default=["Linux", "Windows"], help="Operating systems to keep")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="Read chunk size in KB")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per upsert batch")
+    parser.add_argument("--make-fixture", metavar="PATH", help="Write a synthetic offer file and exit")
+    parser.add_argument("--products", type=int, default=20000, help="Products in the synthetic fixture")
+    parser.add_argument("--check", action="store_true", help="Check the source (default: a fresh fixture) maps each kept SKU to its own row")
+    args = parser.parse_args()
+    
+    if args.make_fixture:
+        make_fixture(args.make_fixture, args.products)
+        print(f"✓ Wrote fixture with {args.products} products to {args.make_fixture}")
+        sys.exit(0)
+    
+    if args.check:
+        sys.exit(0 if check(args.source, args.os, args.chunk_size * 1024, args.batch_size, args.products) else 1)
+    
+    if not args.source:
+        parser.error("source is required")
+    
+    print("=" * 50)
+    print("AWS Offer Ingestion")
+    print("=" * 50)
+    print(f"Source: {args.source}")
+    print(f"Store:  {args.store}")
+    
+    stats = ingest(args.source, args.store, args.os, args.chunk_size * 1024, args.batch_size)
+    megabytes = stats["bytes"] / (1024 * 1024)
+    peak = peak_rss_mb()
+    
+    print(f"Offer version:   {stats['version']}")
+    print(f"Read:            {megabytes:.1f} MB in {stats['elapsed']:.2f} s ({megabytes / stats['elapsed']:.1f} MB/s)")
+    print(f"Products:        {stats['products_seen']} seen, {stats['products_kept']} kept")
+    print(f"Term SKUs:       {stats['terms_seen']}")
+    print(f"Price rows:      {stats['rows']} parsed, {stats['stored']} stored for aws")
+    if stats["duplicates"]:
+        print(f"⚠ {stats['duplicates']} SKU(s) dropped: their store key was already taken by another SKU")
+        for key, kept_sku, dropped_sku in stats["duplicate_skus"]:
+            print(f"    {'/'.join(key)}: {kept_sku} kept, {dropped_sku} dropped")
+    print(f"Peak RSS:        {peak:.1f} MB" if peak is not None else "Peak RSS:        n/a")
+    print("=" * 50)
+    print("✓ Ingestion completed")
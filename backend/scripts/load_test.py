@@ -0,0 +1,367 @@
+"""
+Load test: per-endpoint throughput and latency for the main API flows.
+
+Drives a server with a seeded mix of estimate, pricing, provider, education
+and analyses requests and reports requests/s and p50/p95/p99 per endpoint.
+With --baseline it exits with status 1 if an endpoint regresses by more
+than --threshold percent. Without --url it starts a server itself. The run
+logs in as one load-test account per seed (registered on first use) and
+creates, then deletes, its analyses.
+
+Run with: python -m backend.scripts.load_test [--requests 3000] [--concurrency 16] [--seed 7]
+          [--server gunicorn|dev | --url http://host:port] [--output results.json]
+          [--baseline previous.json] [--threshold 15]
+"""
+
+import sys
+import os
+import argparse
+import http.client
+import json
+import platform
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scripts.bench_estimator import generate_answer_sets
+from backend.scripts.load_test_server import free_port, start_server, wait_until_ready
+
+# Share of operations per scenario; an analyses flow is five requests
+SCENARIO_WEIGHTS = {
+    "estimate": 40,
+    "pricing_compare": 10,
+    "providers": 15,
+    "education": 15,
+    "analyses_crud": 20
+}
+
+INSTANCE_TYPES = {
+    "aws": ["t3.medium", "t3.large", "m5.large", "m5.xlarge", "c5.large"],
+    "azure": ["Standard_B2s", "Standard_B4ms", "Standard_D2s_v3", "Standard_D4s_v3"],
+    "gcp": ["e2-standard-2", "e2-standard-4", "n2-standard-2"],
+    "huawei": ["s6.large.2", "s6.xlarge.2", "c6.large.2"]
+}
+REGIONS = ["europe", "us-east", "asia"]
+
+
+class Client:
+    """One keep-alive connection; reconnects after a transport error."""
+    
+    def __init__(self, host: str, port: int, token: str = None):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.conn = None
+    
+    def request(self, method: str, path: str, body=None) -> tuple:
+        """Send a request and return (status or None, latency in ms, parsed JSON or None)."""
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = json.dumps(body) if body is not None else None
+        
+        start = time.perf_counter()
+        try:
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            return None, (time.perf_counter() - start) * 1000, None
+        latency = (time.perf_counter() - start) * 1000
+        
+        parsed = None
+        if data and response.getheader("Content-Type", "").startswith("application/json"):
+            try:
+                parsed = json.loads(data)
+            except ValueError:
+                pass
+        return status, latency, parsed
+
+
+def build_operations(total: int, seed: int) -> list:
+    """
+    Generate the operation list for a run.
+    
+    Args:
+        total: Number of operations (an analyses flow counts as one)
+        seed: Seed for payloads and ordering; the same seed gives the same run
+    
+    Returns:
+        List of (scenario, payload) tuples in execution order
+    """
+    rng = random.Random(seed)
+    answer_sets = generate_answer_sets(256, seed)
+    scenarios = list(SCENARIO_WEIGHTS)
+    weights = [SCENARIO_WEIGHTS[name] for name in scenarios]
+    
+    operations = []
+    for _ in range(total):
+        scenario = rng.choices(scenarios, weights)[0]
+        if scenario == "estimate":
+            payload = rng.choice(answer_sets)
+        elif scenario == "pricing_compare":
+            providers = rng.sample(sorted(INSTANCE_TYPES), rng.randint(1, len(INSTANCE_TYPES)))
+            payload = {
+                "providers": providers,
+                "instance_types": {provider: rng.choice(INSTANCE_TYPES[provider]) for provider in providers},
+                "os_type": rng.choice(["Linux", "Windows"]),
+                "storage_type": rng.choice(["standard-hdd", "standard-ssd", "premium-ssd"]),
+                "region": rng.choice(REGIONS)
+            }
+        elif scenario == "education":
+            payload = {"limit": rng.choice([12, 24, 48])}
+        elif scenario == "analyses_crud":
+            answers = rng.choice(answer_sets)
+            final_cost = round(rng.uniform(500, 50000), 2)
+            payload = {
+                "title": f"Load test analysis {rng.randrange(10**6)}",
+                "config": answers,
+                "estimates": {"final_cost": final_cost, "min_cost": round(final_cost * 0.8, 2),
+                              "max_cost": round(final_cost * 1.3, 2), "currency": "USD"},
+                "trends": [round(final_cost * (1 + month / 100), 2) for month in range(12)]
+            }
+        else:
+            payload = None
+        operations.append((scenario, payload))
+    return operations
+
+
+def run_operation(client: Client, user_id: str, scenario: str, payload) -> list:
+    """Execute one operation; returns (endpoint label, status, latency ms) per request sent."""
+    if scenario == "estimate":
+        status, latency, _ = client.request("POST", "/api/estimate", payload)
+        return [("POST /api/estimate", status, latency)]
+    if scenario == "pricing_compare":
+        status, latency, _ = client.request("POST", "/api/pricing/compare", payload)
+        return [("POST /api/pricing/compare", status, latency)]
+    if scenario == "providers":
+        status, latency, _ = client.request("GET", "/api/providers")
+        return [("GET /api/providers", status, latency)]
+    if scenario == "education":
+        status, latency, _ = client.request("GET", f"/api/education?limit={payload['limit']}")
+        return [("GET /api/education", status, latency)]
+    
+    # Analyses CRUD flow
+    samples = []
+    status, latency, body = client.request("POST", "/api/analyses", {**payload, "user_id": user_id})
+    samples.append(("POST /api/analyses", status, latency))
+    if status != 201 or not body:
+        return samples
+    analysis_id = body["analysis"]["id"]
+    
+    status, latency, _ = client.request("GET", f"/api/analyses/{analysis_id}")
+    samples.append(("GET /api/analyses/<id>", status, latency))
+    status, latency, _ = client.request("PUT", f"/api/analyses/{analysis_id}", {"title": payload["title"] + " (edited)"})
+    samples.append(("PUT /api/analyses/<id>", status, latency))
+    status, latency, _ = client.request("GET", f"/api/analyses?user_id={user_id}")
+    samples.append(("GET /api/analyses", status, latency))
+    status, latency, _ = client.request("DELETE", f"/api/analyses/{analysis_id}?user_id={user_id}")
+    samples.append(("DELETE /api/analyses/<id>", status, latency))
+    return samples
+
+
+def load_test_user(host: str, port: int, seed: int) -> tuple:
+    """
+    Log in as the load-test account for a seed, registering it on first use.
+    
+    Repeated runs reuse the account, so the database gains at most one
+    user per seed.
+    
+    Returns:
+        Tuple of (user id, token)
+    """
+    client = Client(host, port)
+    credentials = {"email": f"loadtest-{seed}@example.com", "password": "load-test-password"}
+    status, _, body = client.request("POST", "/api/auth/login", credentials)
+    if status == 401:
+        status, _, body = client.request("POST", "/api/auth/register", {**credentials, "name": "Load Test"})
+    if status not in (200, 201):
+        raise RuntimeError(f"Could not log in as the load-test user (HTTP {status}): {body}")
+    return body["user"]["id"], body["token"]
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else float("nan")
+
+
+def drive(host: str, port: int, user_id: str, token: str, operations: list, concurrency: int) -> tuple:
+    """Run operations over `concurrency` keep-alive clients; returns (samples, wall seconds)."""
+    local = threading.local()
+    samples = []
+    lock = threading.Lock()
+    
+    def execute(operation):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = Client(host, port, token)
+        results = run_operation(client, user_id, *operation)
+        with lock:
+            samples.extend(results)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(execute, operations))
+    return samples, time.perf_counter() - start
+
+
+def summarize(samples: list, wall: float) -> dict:
+    """Per-endpoint and overall throughput, latency percentiles and errors."""
+    groups = {}
+    for endpoint, status, latency in samples:
+        groups.setdefault(endpoint, []).append((status, latency))
+    groups["ALL"] = [(status, latency) for _, status, latency in samples]
+    
+    summary = {}
+    for endpoint, entries in groups.items():
+        ok = sorted(latency for status, latency in entries if status is not None and status < 400)
+        summary[endpoint] = {
+            "requests": len(entries),
+            "errors": len(entries) - len(ok),
+            "throughput": round(len(ok) / wall, 2),
+            "p50_ms": round(percentile(ok, 0.50), 3),
+            "p95_ms": round(percentile(ok, 0.95), 3),
+            "p99_ms": round(percentile(ok, 0.99), 3),
+            "mean_ms": round(sum(ok) / len(ok), 3) if ok else None
+        }
+    return summary
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    Find endpoints that regressed against a baseline run.
+    
+    Args:
+        current: Endpoint summary of this run
+        baseline: Endpoint summary of the baseline run
+        threshold: Allowed change in percent
+    
+    Returns:
+        List of (endpoint, metric, baseline value, current value, change %)
+    """
+    regressions = []
+    for endpoint, now in current.items():
+        before = baseline.get(endpoint)
+        if not before:
+            continue
+        for metric, worse_if_higher in (("p95_ms", True), ("throughput", False)):
+            old, new = before.get(metric), now.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            if (change if worse_if_higher else -change) > threshold:
+                regressions.append((endpoint, metric, old, new, change))
+        if now["errors"] > before.get("errors", 0):
+            regressions.append((endpoint, "errors", before.get("errors", 0), now["errors"], float("inf")))
+    return regressions
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_load_test(args) -> int:
+    process = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        process = start_server(args.server, port, args.workers, args.threads)
+    
+    try:
+        if process is not None:
+            wait_until_ready(port, process)
+        user_id, token = load_test_user(host, port, args.seed)
+        
+        warmup = build_operations(args.warmup, args.seed + 1)
+        drive(host, port, user_id, token, warmup, args.concurrency)
+        samples, wall = drive(host, port, user_id, token, build_operations(args.requests, args.seed), args.concurrency)
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    
+    summary = summarize(samples, wall)
+    result = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": {
+            "operations": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "server": args.url or f"{args.server} ({args.workers} workers x {args.threads} threads)",
+            "python": platform.python_version(),
+            "cpus": os.cpu_count()
+        },
+        "wall_seconds": round(wall, 3),
+        "endpoints": summary
+    }
+    
+    print("=" * 50)
+    print("API Load Test")
+    print("=" * 50)
+    print(f"{args.requests} operations ({len(samples)} requests), {args.concurrency} concurrent clients, "
+          f"seed {args.seed}, commit {result['commit']}")
+    print(f"{'Endpoint':<28} {'reqs':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for endpoint, stats in summary.items():
+        print(f"{endpoint:<28} {stats['requests']:>6} {stats['throughput']:>8.1f} {stats['p50_ms']:>8.2f} "
+              f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['errors']:>6}")
+    print("=" * 50)
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"✓ Results saved to {args.output}")
+    
+    if not args.baseline:
+        return 0 if summary["ALL"]["errors"] == 0 else 1
+    
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(summary, baseline["endpoints"], args.threshold)
+    if not regressions:
+        print(f"✓ No regressions beyond {args.threshold:.0f}% against {baseline.get('commit', 'baseline')}")
+        return 0
+    print(f"✗ {len(regressions)} regression(s) beyond {args.threshold:.0f}% against {baseline.get('commit', 'baseline')}:")
+    for endpoint, metric, old, new, change in regressions:
+        print(f"    {endpoint} {metric}: {old} -> {new} ({change:+.1f}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-endpoint load test with baseline comparison")
+    parser.add_argument("--requests", type=int, default=3000, help="Operations to time (an analyses flow is one)")
+    parser.add_argument("--warmup", type=int, default=200, help="Untimed operations run first")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client connections")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for payloads and operation order")
+    parser.add_argument("--server", choices=["gunicorn", "dev"], default="gunicorn", help="Server to start")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    parser.add_argument("--url", help="Test an already running server instead of starting one")
+    parser.add_argument("--output", help="Save results as JSON")
+    parser.add_argument("--baseline", help="Results JSON of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=15, help="Allowed regression in percent")
+    args = parser.parse_args()
+    
+    sys.exit(run_load_test(args))
@@ -0,0 +1,101 @@
+"""
+Load test for request-scoped database sessions.
+
+Sends concurrent requests through the Flask test client and exits with
+status 1 if pool connections leak or keep growing.
+
+Run with: python -m backend.scripts.load_test_db_sessions [--requests 5000] [--threads 16]
+"""
+
+import sys
+import os
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.app import create_app
+from backend.database.connection import get_pool_stats
+from backend.utils.auth_tokens import issue_token
+
+ENDPOINTS = [
+    "/api/providers",
+    "/api/education",
+    "/api/analyses",
+    "/api/analyses/missing-analysis",
+    "/api/admin/users"
+]
+
+
+def run_load_test(total_requests: int, threads: int) -> bool:
+    """Fire requests from a thread pool and sample pool usage. Returns True if every check passed."""
+    app = create_app()
+    # A non-admin token: the analyses and admin endpoints still query the database
+    token, _ = issue_token("load-test-user", False)
+    headers = {"Authorization": f"Bearer {token}"}
+    local = threading.local()
+    samples = []
+    statuses = {}
+    lock = threading.Lock()
+    
+    def send(i: int):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        response = client.get(ENDPOINTS[i % len(ENDPOINTS)], headers=headers)
+        with lock:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        if i % 100 == 0:
+            stats = get_pool_stats()
+            with lock:
+                samples.append((i, stats["checked_out"], stats["connections_open"]))
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        half = total_requests // 2
+        list(executor.map(send, range(half)))
+        midpoint = get_pool_stats()
+        list(executor.map(send, range(half, total_requests)))
+    elapsed = time.perf_counter() - start
+    final = get_pool_stats()
+    
+    peak_checked_out = max(checked_out for _, checked_out, _ in samples)
+    peak_open = max(connections_open for _, _, connections_open in samples)
+    
+    print("=" * 50)
+    print("Database Session Load Test")
+    print("=" * 50)
+    print(f"Requests:               {total_requests} on {threads} threads in {elapsed:.2f} s ({total_requests / elapsed:.0f} req/s)")
+    print(f"Status codes:           {dict(sorted(statuses.items()))}")
+    print(f"Pool size / overflow:   {final['pool_size']} / {final['max_overflow']}")
+    print(f"Peak checked out:       {peak_checked_out}")
+    print(f"Checked out at end:     {final['checked_out']}")
+    print(f"Open connections:       {midpoint['connections_open']} at half, {final['connections_open']} at end (peak {peak_open})")
+    print(f"Connections created:    {final['connections_created']} (overflow churn)")
+    print(f"Checkouts:              {final['checkouts']}")
+    print(f"Checkout timeouts:      {final['checkout_timeouts']}")
+    print(f"Checkout wait avg/max:  {final['wait_time_avg_ms']} / {final['wait_time_max_ms']} ms")
+    print("=" * 50)
+    
+    checks = [
+        (not any(status >= 500 for status in statuses), "No server errors"),
+        (final["checked_out"] == 0, "No connection checked out after teardown"),
+        (final["checkout_timeouts"] == 0, "No request stalled on pool checkout"),
+        (peak_open <= final["pool_size"] + final["max_overflow"], "Open connections stayed within pool size plus overflow"),
+        (final["connections_open"] <= final["pool_size"], "Open connections settled back to the pool size"),
+        (midpoint["connections_open"] <= final["pool_size"], "Connection count did not grow with the request count")
+    ]
+    for passed, label in checks:
+        print(f"{'✓' if passed else '✗'} {label}")
+    return all(passed for passed, _ in checks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test request-scoped database sessions")
+    parser.add_argument("--requests", type=int, default=5000, help="Total requests")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent client threads")
+    args = parser.parse_args()
+    sys.exit(0 if run_load_test(args.requests, args.threads) else 1)
@@ -0,0 +1,177 @@
+"""
+Load test: gunicorn (gunicorn.conf.py) against the Flask development server.
+
+Compares throughput and p50/p95/p99 latency of both servers over a mix of
+estimate, provider, education and health requests. The database must
+already be initialized.
+
+Run with: python -m backend.scripts.load_test_server [--requests 4000] [--concurrency 32] [--workers 4] [--threads 4]
+"""
+
+import sys
+import os
+import argparse
+import http.client
+import json
+import socket
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.scripts.bench_estimator import generate_answer_sets
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def build_workload(total: int) -> list:
+    """Request mix: half estimates (64 distinct answer sets), then providers, education and health."""
+    answer_sets = generate_answer_sets(64, seed=7)
+    workload = []
+    for i in range(total):
+        slot = i % 10
+        if slot < 5:
+            workload.append(("POST", "/api/estimate", json.dumps(answer_sets[i % len(answer_sets)])))
+        elif slot < 7:
+            workload.append(("GET", "/api/providers", None))
+        elif slot < 9:
+            workload.append(("GET", "/api/education?limit=24", None))
+        else:
+            workload.append(("GET", "/api/health", None))
+    return workload
+
+
+def start_server(mode: str, port: int, workers: int, threads: int) -> subprocess.Popen:
+    """Start the dev server or gunicorn in the backend directory."""
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "FLASK_DEBUG": "False",
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_THREADS": str(threads),
+        "GUNICORN_MAX_REQUESTS": "0"
+    }
+    if mode == "dev":
+        command = [sys.executable, "app.py"]
+    else:
+        command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"]
+    return subprocess.Popen(command, cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/api/health")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Server did not become ready")
+
+
+def drive(port: int, workload: list, concurrency: int) -> dict:
+    """Send the workload over keep-alive connections (one per client thread)."""
+    local = threading.local()
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    
+    def send(item):
+        method, path, body = item
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        headers = {"Content-Type": "application/json"} if body else {}
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            local.conn = None
+            status = None
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            if status is None or status >= 500:
+                errors.append(status)
+            else:
+                latencies.append(elapsed)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, workload))
+    wall = time.perf_counter() - start
+    
+    ordered = sorted(latencies)
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else float("nan")
+    
+    return {
+        "throughput": len(latencies) / wall,
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "mean": statistics.fmean(latencies) if latencies else float("nan"),
+        "errors": len(errors)
+    }
+
+
+def run_load_test(total_requests: int, concurrency: int, workers: int, threads: int) -> None:
+    workload = build_workload(total_requests)
+    results = {}
+    for mode in ("dev", "gunicorn"):
+        port = free_port()
+        process = start_server(mode, port, workers, threads)
+        try:
+            wait_until_ready(port, process)
+            drive(port, workload[:max(200, concurrency * 4)], concurrency)  # Warm caches and connections
+            results[mode] = drive(port, workload, concurrency)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    
+    print("=" * 50)
+    print("Server Load Test")
+    print("=" * 50)
+    print(f"{total_requests} requests, {concurrency} concurrent clients; gunicorn: {workers} workers x {threads} threads")
+    print(f"{'Server':<10} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for mode, result in results.items():
+        print(f"{mode:<10} {result['throughput']:>9.1f} {result['p50']:>8.2f} {result['p95']:>8.2f} "
+              f"{result['p99']:>8.2f} {result['errors']:>7}")
+    print("=" * 50)
+    
+    speedup = results["gunicorn"]["throughput"] / results["dev"]["throughput"]
+    print(f"✓ gunicorn throughput {speedup:.2f}x the dev server, "
+          f"p99 {results['dev']['p99']:.1f} ms -> {results['gunicorn']['p99']:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare gunicorn with the Flask dev server under load")
+    parser.add_argument("--requests", type=int, default=4000, help="Timed requests per server")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent client connections")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn worker processes")
+    parser.add_argument("--threads", type=int, default=4, help="Threads per gunicorn worker")
+    args = parser.parse_args()
+    
+    run_load_test(args.requests, args.concurrency, args.workers, args.threads)
@@ -1,7 +1,10 @@
 """
 Script to migrate static education data to database.
 
-Run with: python -m backend.scripts.migrate_education_data --user_id <admin_user_id>
+Rows are upserted by ID with INSERT ... ON CONFLICT, so re-running the
+script only writes content that changed.
+
+Run with: python -m backend.scripts.migrate_education_data [--dry-run] [--batch-size 500]
 """
 
 import sys
@@ -13,7 +16,7 @@ import uuid
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from backend.database.connection import SessionLocal
-from backend.database.repositories import EducationRepository
+from backend.database.repositories import EducationRepository, UPSERT_BATCH_SIZE
 
 # Static education data from frontend
 STATIC_EDUCATION_DATA = [
@@ -382,63 +385,53 @@ Both strategies have their place in cloud migration. Lift and shift offers speed
     },
 ]
 
-def migrate_education_data():
-    """Migrate static education data to database."""
+def education_rows() -> list:
+    """Static education data as rows for the education table."""
+    return [
+        {
+            "id": data["id"],
+            "title": data["title"],
+            "description": data["description"],
+            "type": data["type"],
+            "category": data["category"],
+            "level": data["level"],
+            "full_content": data.get("full_content", data["description"]),
+            "duration": data.get("duration"),
+            "provider": data.get("provider", "general"),
+            "tags": data.get("tags", []),
+            "url": data.get("url"),
+            "is_active": True,
+        }
+        for data in STATIC_EDUCATION_DATA
+    ]
+
+
+def migrate_education_data(dry_run: bool = False, batch_size: int = UPSERT_BATCH_SIZE):
+    """
+    Upsert static education data by ID in one transaction (safe to re-run).
+    
+    Args:
+        dry_run: Only print what would be inserted or updated
+        batch_size: Rows per INSERT ... ON CONFLICT statement
+    """
     db = SessionLocal()
     try:
         print("=" * 50)
-        print("Education Data Migration")
+        print("Education Data Migration" + (" (dry run)" if dry_run else ""))
         print("=" * 50)
         
-        created_count = 0
-        updated_count = 0
+        result = EducationRepository.bulk_upsert(db, education_rows(), batch_size=batch_size, dry_run=dry_run)
         
-        for data in STATIC_EDUCATION_DATA:
-            # Check if education already exists
-            existing = EducationRepository.get_by_id(db, data["id"])
-            
-            if existing:
-                # Update existing
-                EducationRepository.update(
-                    db,
-                    data["id"],
-                    title=data["title"],
-                    description=data["description"],
-                    type=data["type"],
-                    category=data["category"],
-                    level=data["level"],
-                    full_content=data.get("full_content", data["description"]),
-                    duration=data.get("duration"),
-                    provider=data.get("provider", "general"),
-                    tags=data.get("tags", []),
-                    url=data.get("url"),
-                    is_active=True,
-                )
-                updated_count += 1
-                print(f"Updated: {data['title']}")
-            else:
-                # Create new
-                EducationRepository.create(
-                    db,
-                    title=data["title"],
-                    description=data["description"],
-                    type=data["type"],
-                    category=data["category"],
-                    level=data["level"],
-                    full_content=data.get("full_content", data["description"]),
-                    duration=data.get("duration"),
-                    provider=data.get("provider", "general"),
-                    tags=data.get("tags", []),
-                    url=data.get("url"),
-                    education_id=data["id"],  # Use the static ID
-                )
-                created_count += 1
-                print(f"Created: {data['title']}")
+        prefix = "Would " if dry_run else ""
+        for change in result["changes"]:
+            fields = f" ({', '.join(change['fields'])})" if change.get("fields") else ""
+            print(f"{prefix}{change['action']}: {change['key']}{fields}")
         
         print("\n" + "=" * 50)
-        print(f"Migration completed!")
-        print(f"Created: {created_count}")
-        print(f"Updated: {updated_count}")
+        print("Dry run completed, nothing was written" if dry_run else "Migration completed!")
+        print(f"Inserted: {result['inserted']}")
+        print(f"Updated: {result['updated']}")
+        print(f"Unchanged: {result['unchanged']}")
         print("=" * 50)
         
     except Exception as e:
@@ -450,4 +443,9 @@ def migrate_education_data():
         db.close()
 
 if __name__ == "__main__":
-    migrate_education_data()
+    parser = argparse.ArgumentParser(description="Upsert static education data")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
+    parser.add_argument("--batch-size", type=int, default=UPSERT_BATCH_SIZE, help="Rows per statement")
+    args = parser.parse_args()
+    
+    migrate_education_data(dry_run=args.dry_run, batch_size=args.batch_size)
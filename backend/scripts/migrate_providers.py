@@ -1,11 +1,15 @@
 """
 Script to migrate default providers to database.
 
-Run with: python -m backend.scripts.migrate_providers
+Providers are upserted by name with INSERT ... ON CONFLICT, so re-running
+the script only writes providers whose data changed.
+
+Run with: python -m backend.scripts.migrate_providers [--dry-run] [--batch-size 500]
 """
 
 import sys
 import os
+import argparse
 
 # Add parent directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -13,9 +17,8 @@ parent_dir = os.path.dirname(os.path.dirname(current_dir))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from backend.database.connection import get_db
-from backend.database.repositories import ProviderRepository
-from datetime import datetime
+from backend.database.connection import SessionLocal
+from backend.database.repositories import ProviderRepository, UPSERT_BATCH_SIZE
 
 # Default providers data from frontend
 DEFAULT_PROVIDERS = [
@@ -183,56 +186,35 @@ DEFAULT_PROVIDERS = [
     }
 ]
 
-def migrate_providers():
-    """Migrate default providers to database."""
-    db = next(get_db())
+def print_result(result: dict, dry_run: bool) -> None:
+    """Print per-row changes and the inserted/updated/unchanged counts."""
+    prefix = "Would " if dry_run else ""
+    for change in result["changes"]:
+        fields = f" ({', '.join(change['fields'])})" if change.get("fields") else ""
+        print(f"{prefix}{change['action']}: {change['key']}{fields}")
+    print(f"Inserted: {result['inserted']}, updated: {result['updated']}, unchanged: {result['unchanged']}")
+
+
+def migrate_providers(dry_run: bool = False, batch_size: int = UPSERT_BATCH_SIZE):
+    """
+    Upsert default providers by name in one transaction (safe to re-run).
+    
+    Args:
+        dry_run: Only print what would be inserted or updated
+        batch_size: Rows per INSERT ... ON CONFLICT statement
+    """
+    db = SessionLocal()
     
     try:
-        for provider_data in DEFAULT_PROVIDERS:
-            # Check if provider already exists
-            existing = ProviderRepository.get_by_name(db, provider_data["name"])
-            
-            if existing:
-                print(f"Provider '{provider_data['name']}' already exists, updating...")
-                # Update existing provider
-                ProviderRepository.update(
-                    db,
-                    existing.id,
-                    {
-                        "display_name": provider_data["display_name"],
-                        "short_name": provider_data["short_name"],
-                        "is_active": provider_data["is_active"],
-                        "compute_rates": provider_data["compute_rates"],
-                        "storage_rates": provider_data["storage_rates"],
-                        "region_multipliers": provider_data["region_multipliers"],
-                        "available_regions": provider_data["available_regions"],
-                        "logo": provider_data["logo"],
-                        "description": provider_data["description"],
-                    }
-                )
-                print(f"✓ Updated provider: {provider_data['display_name']}")
-            else:
-                # Create new provider
-                ProviderRepository.create(
-                    db,
-                    name=provider_data["name"],
-                    display_name=provider_data["display_name"],
-                    short_name=provider_data["short_name"],
-                    compute_rates=provider_data["compute_rates"],
-                    storage_rates=provider_data["storage_rates"],
-                    region_multipliers=provider_data["region_multipliers"],
-                    available_regions=provider_data["available_regions"],
-                    logo=provider_data["logo"],
-                    description=provider_data["description"]
-                )
-                print(f"✓ Created provider: {provider_data['display_name']}")
-        
-        db.commit()
-        print("\n✓ All providers migrated successfully!")
+        result = ProviderRepository.bulk_upsert(db, DEFAULT_PROVIDERS, batch_size=batch_size, dry_run=dry_run)
+        print_result(result, dry_run)
+        if dry_run:
+            print("\n✓ Dry run complete, nothing was written")
+        else:
+            print("\n✓ All providers migrated successfully!")
         return True
         
     except Exception as e:
-        db.rollback()
         print(f"\n✗ Error migrating providers: {e}")
         import traceback
         traceback.print_exc()
@@ -241,4 +223,10 @@ def migrate_providers():
         db.close()
 
 if __name__ == "__main__":
-    migrate_providers()
+    parser = argparse.ArgumentParser(description="Upsert default providers")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change without writing")
+    parser.add_argument("--batch-size", type=int, default=UPSERT_BATCH_SIZE, help="Rows per statement")
+    args = parser.parse_args()
+    
+    if not migrate_providers(dry_run=args.dry_run, batch_size=args.batch_size):
+        sys.exit(1)
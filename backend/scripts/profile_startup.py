@@ -0,0 +1,110 @@
+"""
+Startup profiler for create_app().
+
+Prints the median startup report and the slowest imports over fresh
+interpreters. With --budget-ms it exits with status 1 when startup is over budget.
+
+Run with: python -m backend.scripts.profile_startup [--runs 5] [--top 15] [--budget-ms 1500]
+"""
+
+import sys
+import os
+import argparse
+import json
+import statistics
+import subprocess
+from collections import defaultdict
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHILD = (
+    "import json\n"
+    "from backend.app import create_app\n"
+    "from backend.utils.startup_profile import startup_profile\n"
+    "create_app()\n"
+    "print('STARTUP_REPORT ' + json.dumps(startup_profile.report()))\n"
+)
+
+
+def run_once() -> tuple:
+    """Start the app in a fresh interpreter; return (startup report, own import µs per module or package)."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=120,
+        env={**os.environ, "STARTUP_PROFILE": "false"}
+    )
+    report = None
+    for line in completed.stdout.splitlines():
+        if line.startswith("STARTUP_REPORT "):
+            report = json.loads(line[len("STARTUP_REPORT "):])
+    if report is None:
+        raise RuntimeError(f"create_app() failed:\n{completed.stderr[-2000:]}")
+    
+    packages = defaultdict(int)
+    for line in completed.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|", 2)
+        if not own.strip().isdigit():
+            continue
+        name = name.strip()
+        # Own time excludes nested imports, so each microsecond is counted once
+        key = name if name.startswith("backend") else name.split(".")[0]
+        packages[key] += int(own)
+    return report, packages
+
+
+def profile_startup(runs: int, top: int, budget_ms: float = None) -> bool:
+    reports = []
+    package_runs = defaultdict(list)
+    for _ in range(runs):
+        report, packages = run_once()
+        reports.append(report)
+        for name, micros in packages.items():
+            package_runs[name].append(micros / 1000)
+    
+    steps = defaultdict(list)
+    kinds = {}
+    for report in reports:
+        for step in report["steps"]:
+            steps[step["name"]].append(step["ms"])
+            kinds[step["name"]] = step["kind"]
+    total = statistics.median(report["total_ms"] for report in reports)
+    
+    print("=" * 50)
+    print("Startup Profile")
+    print("=" * 50)
+    print(f"create_app(): median {total:.1f} ms over {runs} fresh interpreters "
+          f"(imports {statistics.median(r['import_ms'] for r in reports):.1f} ms, "
+          f"init {statistics.median(r['init_ms'] for r in reports):.1f} ms)")
+    print("\nSteps (median):")
+    for name, samples in sorted(steps.items(), key=lambda item: statistics.median(item[1]), reverse=True):
+        print(f"  {statistics.median(samples):>8.1f} ms  {kinds[name]:<6}  {name}")
+    
+    print(f"\nSlowest imports, own time per module or package (median, top {top}):")
+    ranked = sorted(package_runs.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, samples in ranked[:top]:
+        print(f"  {statistics.median(samples):>8.1f} ms  {name}")
+    print("=" * 50)
+    
+    if budget_ms is not None:
+        if total > budget_ms:
+            print(f"✗ Startup {total:.1f} ms is over the {budget_ms:.0f} ms budget")
+            return False
+        print(f"✓ Startup within the {budget_ms:.0f} ms budget")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile create_app() startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--top", type=int, default=15, help="Modules or packages to list")
+    parser.add_argument("--budget-ms", type=float, help="Fail if median startup exceeds this")
+    args = parser.parse_args()
+    
+    if not profile_startup(args.runs, args.top, args.budget_ms):
+        sys.exit(1)
@@ -0,0 +1,206 @@
+"""
+Sync Azure Virtual Machines prices into the local price store.
+
+Pages through the Retail Prices API per region; re-runs only write rows
+whose effectiveStartDate changed. --stub runs offline against canned pages
+and exits with status 1 if a check fails.
+
+Run with: python -m backend.scripts.sync_azure_prices [--regions westeurope eastus] [--store PATH] [--stub]
+"""
+
+import sys
+import os
+import argparse
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.azure_price_sync import AzurePriceSync, AZURE_PRICES_ENDPOINT, DEFAULT_REGIONS
+from backend.services.price_store import PriceStore, PRICE_STORE_PATH
+
+
+def print_stats(label: str, stats: dict, elapsed: float) -> None:
+    print(f"{label}: {stats['pages']} pages, {stats['items']} items in {elapsed:.2f} s")
+    print(f"  inserted={stats['inserted']} updated={stats['updated']} unchanged={stats['unchanged']}")
+
+
+# ==================== STUB SERVER ====================
+
+STUB_VM_SIZES = ["Standard_B2s", "Standard_B4ms", "Standard_D2s_v3", "Standard_D4s_v3", "Standard_D8s_v3"]
+
+
+def make_stub_items(region: str, count: int, effective_date: str) -> list:
+    """Canned Retail Prices items for one region, including rows the sync must drop."""
+    items = []
+    variants = [
+        ("Consumption", "", "Virtual Machines BS Series", None, 1.0),
+        ("Consumption", " Spot", "Virtual Machines BS Series", None, 0.3),
+        ("Consumption", "", "Virtual Machines BS Series Windows", None, 1.8),
+        ("Consumption", " Low Priority", "Virtual Machines BS Series", None, 0.2),
+        ("DevTestConsumption", "", "Virtual Machines BS Series", None, 0.9),
+        ("Reservation", "", "Virtual Machines BS Series", "1 Year", 0.6 * 8760),
+        ("Reservation", "", "Virtual Machines BS Series", "3 Years", 0.4 * 26280)
+    ]
+    for i in range(count):
+        size = f"{STUB_VM_SIZES[i % len(STUB_VM_SIZES)]}_{i // len(STUB_VM_SIZES)}"
+        price_type, suffix, product, term, factor = variants[i % len(variants)]
+        item = {
+            "currencyCode": "USD",
+            "retailPrice": round(0.05 * (i % 13 + 1) * factor, 6),
+            "unitPrice": round(0.05 * (i % 13 + 1) * factor, 6),
+            "armRegionName": region,
+            "effectiveStartDate": effective_date,
+            "meterId": f"{region}-{i}",
+            "productName": product,
+            "skuName": f"{size}{suffix}",
+            "serviceName": "Virtual Machines",
+            "armSkuName": size,
+            "type": price_type,
+            "unitOfMeasure": "1 Hour"
+        }
+        if term:
+            item["reservationTerm"] = term
+        items.append(item)
+    return items
+
+
+class StubRetailPricesHandler(BaseHTTPRequestHandler):
+    """Serves canned pages per region; fails the first request for every page once."""
+    
+    server_version = "StubRetailPrices/1.0"
+    
+    def do_GET(self):
+        stub = self.server.stub
+        query = parse_qs(urlparse(self.path).query)
+        odata_filter = query.get("$filter", [""])[0]
+        skip = int(query.get("$skip", ["0"])[0])
+        region = odata_filter.split("armRegionName eq '")[-1].rstrip("'")
+        
+        with stub["lock"]:
+            stub["requests"] += 1
+            page_key = (region, skip)
+            fail = page_key not in stub["served"]
+            stub["served"].add(page_key)
+        if fail and stub["inject_errors"]:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        
+        items = stub["items"].get(region, [])
+        page = items[skip:skip + stub["page_size"]]
+        next_link = None
+        if skip + stub["page_size"] < len(items):
+            params = urlencode({"$filter": odata_filter, "$skip": skip + stub["page_size"]})
+            next_link = f"http://{self.headers['Host']}/api/retail/prices?{params}"
+        
+        time.sleep(stub["latency"])
+        body = json.dumps({
+            "BillingCurrency": "USD",
+            "Items": page,
+            "NextPageLink": next_link,
+            "Count": len(page)
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def run_stub_demo(regions, items_per_region: int, page_size: int, concurrency: int) -> bool:
+    """
+    Sync three times against the stub server: initial, unchanged, and one region repriced.
+    
+    Returns:
+        True if every check passed
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubRetailPricesHandler)
+    server.daemon_threads = True
+    server.stub = {
+        "items": {region: make_stub_items(region, items_per_region, "2024-01-01T00:00:00Z") for region in regions},
+        "page_size": page_size,
+        "latency": 0.02,
+        "inject_errors": True,
+        "served": set(),
+        "requests": 0,
+        "lock": threading.Lock()
+    }
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/api/retail/prices"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(os.path.join(tmp, "prices.sqlite3"))
+        
+        start = time.perf_counter()
+        first = AzurePriceSync(store, endpoint, concurrency=concurrency, backoff=0.01).run(regions)
+        print_stats("Initial sync", first, time.perf_counter() - start)
+        print(f"  stub requests: {server.stub['requests']} (every page failed once with 503, then retried)")
+        
+        start = time.perf_counter()
+        second = AzurePriceSync(store, endpoint, concurrency=concurrency, backoff=0.01).run(regions)
+        print_stats("Repeat sync", second, time.perf_counter() - start)
+        
+        repriced = regions[0]
+        server.stub["items"][repriced] = make_stub_items(repriced, items_per_region, "2024-06-01T00:00:00Z")
+        start = time.perf_counter()
+        third = AzurePriceSync(store, endpoint, concurrency=concurrency, backoff=0.01).run(regions)
+        print_stats(f"After repricing {repriced}", third, time.perf_counter() - start)
+        
+        sample = store.get_rates("azure", repriced, "Standard_B2s_0", "Linux")
+    
+    server.shutdown()
+    
+    checks = [
+        (first["inserted"] > 0 and first["updated"] == 0, "Initial sync only inserted rows"),
+        (
+            second["inserted"] == 0 and second["updated"] == 0 and second["unchanged"] == first["inserted"],
+            "Repeat sync wrote nothing"
+        ),
+        (
+            third["updated"] == first["inserted"] // len(regions) and third["inserted"] == 0,
+            f"Repricing {repriced} updated only its rows"
+        ),
+        (sample["on_demand"]["effective_date"] == "2024-06-01T00:00:00Z", "Stored rate has the new effective date")
+    ]
+    for passed, label in checks:
+        print(f"{'✓' if passed else '✗'} {label}")
+    return all(passed for passed, _ in checks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync Azure VM prices into the local price store")
+    parser.add_argument("--regions", nargs="+", default=DEFAULT_REGIONS, help="armRegionName values to sync")
+    parser.add_argument("--store", default=PRICE_STORE_PATH, help="Price store path")
+    parser.add_argument("--endpoint", default=AZURE_PRICES_ENDPOINT, help="Retail Prices API endpoint")
+    parser.add_argument("--concurrency", type=int, default=4, help="Regions fetched in parallel")
+    parser.add_argument("--stub", action="store_true", help="Run against a local stub server instead")
+    parser.add_argument("--stub-items", type=int, default=700, help="Items per region served by the stub")
+    parser.add_argument("--stub-page-size", type=int, default=100, help="Items per stub page")
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("Azure Retail Prices Sync")
+    print("=" * 50)
+    
+    if args.stub:
+        passed = run_stub_demo(args.regions, args.stub_items, args.stub_page_size, args.concurrency)
+        print("=" * 50)
+        sys.exit(0 if passed else 1)
+    else:
+        print(f"Endpoint: {args.endpoint}")
+        print(f"Store:    {args.store}")
+        start = time.perf_counter()
+        stats = AzurePriceSync(PriceStore(args.store), args.endpoint, concurrency=args.concurrency).run(args.regions)
+        print_stats("Sync", stats, time.perf_counter() - start)
+        print("✓ Sync completed")
+    print("=" * 50)
@@ -4,16 +4,28 @@ Cloud Provider API Services
 This module contains API clients for AWS, Azure, GCP, and Huawei pricing APIs.
 These services simulate real API calls for academic demonstration purposes.
 Note: These are for demonstration only and do not affect actual calculations.
+
+Exports are resolved on first access, so importing any service module does
+not import every client (and the requests library) with it.
 """
 
-from backend.services.aws_api_client import AWSPricingClient
-from backend.services.azure_api_client import AzurePricingClient
-from backend.services.gcp_api_client import GCPPricingClient
-from backend.services.huawei_api_client import HuaweiPricingClient
+import importlib
+
+_EXPORTS = {
+    "AWSPricingClient": "backend.services.aws_api_client",
+    "AzurePricingClient": "backend.services.azure_api_client",
+    "GCPPricingClient": "backend.services.gcp_api_client",
+    "HuaweiPricingClient": "backend.services.huawei_api_client",
+    "RateCatalog": "backend.services.rate_catalog",
+    "get_rate_catalog": "backend.services.rate_catalog",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "AWSPricingClient",
-    "AzurePricingClient",
-    "GCPPricingClient",
-    "HuaweiPricingClient",
-]
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
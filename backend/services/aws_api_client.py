@@ -9,6 +9,8 @@ import os
 import requests
 from typing import Dict, Optional, Any
 from backend.utils.error_handler import handle_calculation_error
+from backend.services.rate_catalog import format_savings, get_rate_catalog
+from backend.services.price_store import get_price_store
 
 
 class AWSPricingClient:
@@ -49,6 +51,17 @@ class AWSPricingClient:
             # Simulated API call - In production, this would make actual HTTP request
             # Example: GET /offers/v1.0/aws/AmazonEC2/current/{region}/index.json
             
+            rates = get_rate_catalog().get_rates("aws", instance_type, os_type)
+            last_updated = "2024-01-15T10:30:00Z"
+            price_source = "catalog"
+            
+            # Prices ingested from the bulk offer file take precedence
+            stored = get_price_store().get_rates("aws", region, instance_type, os_type)
+            if stored:
+                rates = {**rates, **{tier: entry["price_per_hour"] for tier, entry in stored.items()}}
+                last_updated = stored.get("on_demand", next(iter(stored.values())))["effective_date"] or last_updated
+                price_source = "offer_file"
+            
             # Mock API response structure
             response = {
                 "provider": "aws",
@@ -57,25 +70,26 @@ class AWSPricingClient:
                 "region": region,
                 "pricing": {
                     "on_demand": {
-                        "price_per_hour": self._calculate_aws_hourly_rate(instance_type, os_type),
+                        "price_per_hour": rates["on_demand"],
                         "currency": "USD",
                         "unit": "Hrs"
                     },
                     "reserved": {
                         "1_year": {
-                            "price_per_hour": self._calculate_aws_hourly_rate(instance_type, os_type) * 0.6,
-                            "savings": "40%"
+                            "price_per_hour": rates["reserved_1_year"],
+                            "savings": format_savings(rates["reserved_1_year"], rates["on_demand"])
                         },
                         "3_year": {
-                            "price_per_hour": self._calculate_aws_hourly_rate(instance_type, os_type) * 0.5,
-                            "savings": "50%"
+                            "price_per_hour": rates["reserved_3_year"],
+                            "savings": format_savings(rates["reserved_3_year"], rates["on_demand"])
                         }
                     }
                 },
                 "metadata": {
                     "api_endpoint": f"{self.api_endpoint}/offers/v1.0/aws/AmazonEC2/current/{region}/index.json",
                     "api_version": "v1.0",
-                    "last_updated": "2024-01-15T10:30:00Z"
+                    "last_updated": last_updated,
+                    "price_source": price_source
                 }
             }
             
@@ -152,30 +166,3 @@ class AWSPricingClient:
         }
         
         return multipliers.get(region, 1.0)
-    
-    def _calculate_aws_hourly_rate(self, instance_type: str, os_type: str) -> float:
-        """
-        Calculate hourly rate based on instance type and OS.
-        This simulates the pricing calculation from AWS API.
-        """
-        # Base rates per vCPU-hour (simplified)
-        base_rates = {
-            "linux": 0.0415,
-            "windows": 0.083
-        }
-        
-        # Instance type multipliers (simplified)
-        instance_multipliers = {
-            "t3.small": 0.5,
-            "t3.medium": 1.0,
-            "t3.large": 2.0,
-            "t3.xlarge": 4.0,
-            "m5.large": 2.0,
-            "m5.xlarge": 4.0,
-            "m5.2xlarge": 8.0
-        }
-        
-        multiplier = instance_multipliers.get(instance_type, 2.0)
-        os_key = os_type.lower()
-        
-        return base_rates.get(os_key, base_rates["linux"]) * multiplier
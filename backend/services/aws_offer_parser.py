@@ -0,0 +1,298 @@
+"""
+AWS Offer File Parser
+
+Streams an AWS Price List bulk offer file (AmazonEC2 index.json) and yields
+only the EC2 instance prices the pricing client needs. The file is read in
+fixed-size chunks and decoded one product or one SKU's terms at a time,
+so memory stays flat however large the file is.
+
+Kept: shared-tenancy compute instances in AWS Regions (not Local Zones,
+Wavelength or Outposts), without pre-installed software or a capacity
+reservation, for the requested operating systems, with their on-demand
+rate and the standard no-upfront 1 and 3 year reserved rates.
+
+Each kept SKU must map to its own (region, instance type, os) store key.
+If a second SKU passes the filter for a key already taken, it is dropped
+and counted in `duplicates`, so one SKU never silently overwrites another.
+"""
+
+import codecs
+import json
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from backend.services.price_store import PriceRow
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+RESERVED_TIERS = {
+    "1yr": "reserved_1_year",
+    "3yr": "reserved_3_year"
+}
+
+
+class JSONStreamReader:
+    """
+    Incremental reader for one large JSON document.
+    
+    Objects can be walked member by member with iter_object(); any value
+    can be decoded whole with read_value(). Only the unread part of the
+    current chunk is buffered.
+    """
+    
+    def __init__(self, fileobj, chunk_size: int = 1 << 20):
+        self._file = fileobj
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.bytes_read = 0
+    
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at end of input."""
+        if self._eof:
+            return False
+        
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            self._buf = self._buf[self._pos:] + self._text_decoder.decode(b"", final=True)
+            self._pos = 0
+            return False
+        
+        if isinstance(chunk, bytes):
+            self.bytes_read += len(chunk)
+            chunk = self._text_decoder.decode(chunk)
+        else:
+            self.bytes_read += len(chunk.encode("utf-8"))
+        
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def _peek_char(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+    
+    def _next_char(self) -> str:
+        """Skip whitespace and consume the next character."""
+        char = self._peek_char()
+        self._pos += 1
+        return char
+    
+    def read_value(self):
+        """
+        Decode the next complete JSON value.
+        
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        self._peek_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value that ends exactly at the buffer end may be a truncated number
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+    
+    def iter_object(self) -> Iterator[str]:
+        """
+        Walk the members of the next JSON object, yielding each key.
+        
+        The caller must consume each member's value (read_value, a nested
+        iter_object or skip_value) before advancing the iterator.
+        
+        Raises:
+            ValueError: If the next value is not an object
+        """
+        if self._next_char() != "{":
+            raise ValueError("Expected JSON object")
+        if self._peek_char() == "}":
+            self._pos += 1
+            return
+        
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str) or self._next_char() != ":":
+                raise ValueError("Malformed JSON object")
+            yield key
+            
+            char = self._next_char()
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError("Malformed JSON object")
+    
+    def skip_value(self) -> None:
+        """Consume the next value, walking objects so large ones are never held whole."""
+        if self._peek_char() == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        else:
+            self.read_value()
+
+
+class AWSOfferParser:
+    """
+    Extracts EC2 instance prices from a streamed AWS offer file.
+    
+    Counters (products_seen, products_kept, terms_seen, rows, duplicates)
+    and the offer version are filled in while iter_rows() runs.
+    duplicate_skus lists the first few (key, kept SKU, dropped SKU) clashes.
+    """
+    
+    def __init__(self, fileobj, operating_systems=("Linux", "Windows"), chunk_size: int = 1 << 20):
+        self.reader = JSONStreamReader(fileobj, chunk_size)
+        self.operating_systems = set(operating_systems)
+        self.version = None
+        self.publication_date = None
+        self.products_seen = 0
+        self.products_kept = 0
+        self.terms_seen = 0
+        self.rows = 0
+        self.duplicates = 0
+        self.duplicate_skus: List[Tuple[Tuple[str, str, str], str, str]] = []
+    
+    @property
+    def bytes_read(self) -> int:
+        return self.reader.bytes_read
+    
+    def _match_product(self, product: dict) -> Optional[Tuple[str, str, str]]:
+        """Get (region, instance type, os) for a product worth keeping, else None."""
+        if not product.get("productFamily", "").startswith("Compute Instance"):
+            return None
+        
+        attributes = product.get("attributes", {})
+        if (
+            attributes.get("tenancy") != "Shared"
+            or attributes.get("locationType", "AWS Region") != "AWS Region"
+            or attributes.get("preInstalledSw", "NA") != "NA"
+            or attributes.get("capacitystatus", "Used") != "Used"
+            or attributes.get("marketoption", "OnDemand") != "OnDemand"
+            or attributes.get("licenseModel") == "Bring your own license"
+            or attributes.get("operatingSystem") not in self.operating_systems
+            or "instanceType" not in attributes
+        ):
+            return None
+        
+        region = attributes.get("regionCode") or attributes.get("location", "")
+        return region, attributes["instanceType"], attributes["operatingSystem"].lower()
+    
+    @staticmethod
+    def _hourly_price(offer: dict) -> Optional[float]:
+        """Get the USD per-hour price dimension of an offer term."""
+        for dimension in offer.get("priceDimensions", {}).values():
+            if dimension.get("unit") == "Hrs":
+                price = float(dimension.get("pricePerUnit", {}).get("USD", 0) or 0)
+                return price if price > 0 else None
+        return None
+    
+    def _term_prices(self, term_type: str, offers: dict) -> List[Tuple[str, float, Optional[str]]]:
+        """Get (tier, price per hour, effective date) for the terms of one SKU, one per tier."""
+        prices = []
+        tiers = set()
+        for offer in offers.values():
+            if term_type == "OnDemand":
+                tier = "on_demand"
+            else:
+                attributes = offer.get("termAttributes", {})
+                if (
+                    attributes.get("PurchaseOption") != "No Upfront"
+                    or attributes.get("OfferingClass", "standard") != "standard"
+                ):
+                    continue
+                tier = RESERVED_TIERS.get(attributes.get("LeaseContractLength"))
+                if tier is None:
+                    continue
+            
+            price = self._hourly_price(offer)
+            if price is not None and tier not in tiers:
+                tiers.add(tier)
+                prices.append((tier, price, offer.get("effectiveDate")))
+        return prices
+    
+    def _rows(self, sku: str, product: Tuple[str, str, str], prices: list) -> List[PriceRow]:
+        region, instance_type, os_key = product
+        return [
+            ("aws", region, instance_type, os_key, tier, price, "USD", effective_date, sku)
+            for tier, price, effective_date in prices
+        ]
+    
+    def iter_rows(self) -> Iterator[PriceRow]:
+        """
+        Stream the offer file and yield price rows for the kept products.
+        
+        AWS writes products before terms. If a file lists terms first,
+        their prices are held (compactly) until the products are read.
+        
+        Raises:
+            ValueError: If the file is not a valid offer file
+        """
+        reader = self.reader
+        kept: Dict[str, Tuple[str, str, str]] = {}
+        kept_keys: Dict[Tuple[str, str, str], str] = {}
+        pending: Dict[str, list] = {}
+        products_read = False
+        
+        for key in reader.iter_object():
+            if key == "products":
+                for sku in reader.iter_object():
+                    product = reader.read_value()
+                    self.products_seen += 1
+                    match = self._match_product(product)
+                    if match is None:
+                        continue
+                    if match in kept_keys:
+                        self.duplicates += 1
+                        if len(self.duplicate_skus) < 10:
+                            self.duplicate_skus.append((match, kept_keys[match], sku))
+                        continue
+                    kept_keys[match] = sku
+                    kept[sku] = match
+                    self.products_kept += 1
+                products_read = True
+            
+            elif key == "terms":
+                for term_type in reader.iter_object():
+                    if term_type not in ("OnDemand", "Reserved"):
+                        reader.skip_value()
+                        continue
+                    for sku in reader.iter_object():
+                        offers = reader.read_value()
+                        self.terms_seen += 1
+                        if products_read and sku not in kept:
+                            continue
+                        prices = self._term_prices(term_type, offers)
+                        if not prices:
+                            continue
+                        if products_read:
+                            rows = self._rows(sku, kept[sku], prices)
+                            self.rows += len(rows)
+                            yield from rows
+                        else:
+                            pending.setdefault(sku, []).extend(prices)
+            
+            elif key == "version":
+                self.version = reader.read_value()
+            elif key == "publicationDate":
+                self.publication_date = reader.read_value()
+            else:
+                reader.skip_value()
+        
+        for sku, prices in pending.items():
+            if sku in kept:
+                rows = self._rows(sku, kept[sku], prices)
+                self.rows += len(rows)
+                yield from rows
@@ -0,0 +1,219 @@
+"""
+Azure Retail Prices Sync
+
+Pulls Virtual Machines prices from the Azure Retail Prices API into the
+local price store. Each region is a separate filter whose pages are
+followed through NextPageLink; regions are fetched concurrently over one
+pooled HTTP session that retries transient failures with backoff.
+
+Sync is incremental: rows whose effectiveStartDate matches the stored
+row are left untouched.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend.services.price_store import PriceRow, PriceStore
+
+AZURE_PRICES_ENDPOINT = os.getenv(
+    "AZURE_PRICING_API_ENDPOINT",
+    "https://prices.azure.com/api/retail/prices"
+)
+
+DEFAULT_REGIONS = ["westeurope", "northeurope", "eastus", "westus2", "uaenorth", "southeastasia"]
+
+# Reservation unitPrice is the total for the term
+RESERVATION_TERMS = {
+    "1 Year": ("reserved_1_year", 365 * 24),
+    "3 Years": ("reserved_3_year", 3 * 365 * 24)
+}
+
+
+def create_session(pool_size: int, retries: int = 5, backoff: float = 0.5) -> requests.Session:
+    """
+    Create one pooled HTTP session that retries transient failures.
+    
+    429 and 5xx responses and connection errors are retried with
+    exponential backoff, honouring Retry-After.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def region_filter(region: str) -> str:
+    """OData filter for one region's Virtual Machines prices."""
+    return f"serviceName eq 'Virtual Machines' and armRegionName eq '{region}'"
+
+
+def item_to_row(item: dict) -> Optional[PriceRow]:
+    """
+    Map one Retail Prices item to a price row, or None if it is not kept.
+    
+    Kept: hourly pay-as-you-go, spot and reservation prices for VM SKUs.
+    Low priority, dev/test and non-hourly meters are dropped.
+    """
+    sku = item.get("armSkuName")
+    sku_name = item.get("skuName", "")
+    if not sku or item.get("unitOfMeasure") != "1 Hour" or "Low Priority" in sku_name:
+        return None
+    
+    price_type = item.get("type")
+    price = float(item.get("retailPrice", item.get("unitPrice", 0)) or 0)
+    
+    if price_type == "Consumption":
+        tier = "spot" if sku_name.endswith("Spot") else "on_demand"
+    elif price_type == "Reservation":
+        term = RESERVATION_TERMS.get(item.get("reservationTerm"))
+        if term is None:
+            return None
+        tier, hours = term
+        price /= hours
+    else:
+        return None
+    
+    if price <= 0:
+        return None
+    
+    os_key = "windows" if "Windows" in item.get("productName", "") else "linux"
+    return (
+        "azure", item.get("armRegionName", ""), sku, os_key, tier, price,
+        item.get("currencyCode", "USD"), item.get("effectiveStartDate"), item.get("meterId")
+    )
+
+
+class AzurePriceSync:
+    """
+    Sync job from the Azure Retail Prices API into a PriceStore.
+    
+    Counters (pages, items, inserted, updated, unchanged) are filled in by run().
+    """
+    
+    def __init__(
+        self,
+        store: PriceStore,
+        endpoint: str = AZURE_PRICES_ENDPOINT,
+        concurrency: int = 4,
+        timeout: float = 30,
+        retries: int = 5,
+        backoff: float = 0.5
+    ):
+        self.store = store
+        self.endpoint = endpoint
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.session = create_session(concurrency, retries, backoff)
+        self._lock = threading.Lock()
+        self.pages = 0
+        self.items = 0
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+    
+    def fetch_filter(self, odata_filter: str) -> List[PriceRow]:
+        """
+        Fetch every page of one filter, following NextPageLink.
+        
+        Raises:
+            requests.HTTPError: If a page still fails after retries
+        """
+        rows = []
+        url = self.endpoint
+        params = {"$filter": odata_filter}
+        
+        while url:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            page = response.json()
+            items = page.get("Items", [])
+            
+            with self._lock:
+                self.pages += 1
+                self.items += len(items)
+            
+            for item in items:
+                row = item_to_row(item)
+                if row is not None:
+                    rows.append(row)
+            
+            # NextPageLink already carries the filter and skip token
+            url = page.get("NextPageLink")
+            params = None
+        
+        return rows
+    
+    @staticmethod
+    def _latest_per_key(rows: Iterable[PriceRow]) -> Dict[Tuple, PriceRow]:
+        """Keep one row per price key, the one with the latest effective date."""
+        latest = {}
+        for row in rows:
+            key = row[1:5]
+            current = latest.get(key)
+            if current is None or (row[7] or "") > (current[7] or ""):
+                latest[key] = row
+        return latest
+    
+    def run(self, regions: Iterable[str] = DEFAULT_REGIONS) -> dict:
+        """
+        Sync the given regions into the store.
+        
+        Regions are fetched concurrently; each region's rows are written as
+        soon as it completes, skipping rows whose effective date is unchanged.
+        
+        Returns:
+            Sync statistics
+        
+        Raises:
+            requests.HTTPError: If any region fails after retries
+        """
+        conn = self.store.connect_writer()
+        try:
+            stored_dates = self.store.get_effective_dates(conn, "azure")
+            
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="azure-sync") as executor:
+                futures = {
+                    executor.submit(self.fetch_filter, region_filter(region)): region
+                    for region in regions
+                }
+                for future in as_completed(futures):
+                    changed = []
+                    for key, row in self._latest_per_key(future.result()).items():
+                        if key not in stored_dates:
+                            self.inserted += 1
+                        elif stored_dates[key] != row[7]:
+                            self.updated += 1
+                        else:
+                            self.unchanged += 1
+                            continue
+                        changed.append(row)
+                    self.store.upsert_prices(conn, changed)
+                    conn.commit()
+            
+            self.store.record_source(conn, "azure", self.endpoint, None, self.inserted + self.updated)
+            conn.commit()
+        finally:
+            conn.close()
+            self.session.close()
+        
+        return {
+            "pages": self.pages,
+            "items": self.items,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged
+        }
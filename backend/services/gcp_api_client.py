@@ -9,6 +9,7 @@ import os
 import requests
 from typing import Dict, Optional, Any
 from backend.utils.error_handler import handle_calculation_error
+from backend.services.rate_catalog import format_savings, get_rate_catalog
 
 
 class GCPPricingClient:
@@ -48,6 +49,8 @@ class GCPPricingClient:
             # Simulated API call to GCP Cloud Billing API
             # Example: GET /v1/services/6F81-5844-456A/skus?filter=description:compute
             
+            rates = get_rate_catalog().get_rates("gcp", machine_type, os_type)
+            
             response = {
                 "provider": "gcp",
                 "machine_type": machine_type,
@@ -55,23 +58,23 @@ class GCPPricingClient:
                 "region": region,
                 "pricing": {
                     "on_demand": {
-                        "price_per_hour": self._calculate_gcp_hourly_rate(machine_type, os_type),
+                        "price_per_hour": rates["on_demand"],
                         "currency": "USD",
                         "unit": "hour"
                     },
                     "committed_use": {
                         "1_year": {
-                            "price_per_hour": self._calculate_gcp_hourly_rate(machine_type, os_type) * 0.7,
-                            "savings": "30%"
+                            "price_per_hour": rates["committed_use_1_year"],
+                            "savings": format_savings(rates["committed_use_1_year"], rates["on_demand"])
                         },
                         "3_year": {
-                            "price_per_hour": self._calculate_gcp_hourly_rate(machine_type, os_type) * 0.5,
-                            "savings": "50%"
+                            "price_per_hour": rates["committed_use_3_year"],
+                            "savings": format_savings(rates["committed_use_3_year"], rates["on_demand"])
                         }
                     },
                     "sustained_use": {
-                        "price_per_hour": self._calculate_gcp_hourly_rate(machine_type, os_type) * 0.8,
-                        "savings": "20%",
+                        "price_per_hour": rates["sustained_use"],
+                        "savings": format_savings(rates["sustained_use"], rates["on_demand"]),
                         "note": "Automatic discount for 25%+ monthly usage"
                     }
                 },
@@ -153,28 +156,3 @@ class GCPPricingClient:
         }
         
         return multipliers.get(region, 1.0)
-    
-    def _calculate_gcp_hourly_rate(self, machine_type: str, os_type: str) -> float:
-        """
-        Calculate hourly rate based on machine type and OS.
-        This simulates the pricing calculation from GCP API.
-        """
-        base_rates = {
-            "linux": 0.0495,
-            "windows": 0.099
-        }
-        
-        machine_multipliers = {
-            "e2-micro": 0.25,
-            "e2-small": 0.5,
-            "e2-medium": 1.0,
-            "e2-standard-2": 2.0,
-            "e2-standard-4": 4.0,
-            "n1-standard-2": 2.0,
-            "n1-standard-4": 4.0
-        }
-        
-        multiplier = machine_multipliers.get(machine_type, 2.0)
-        os_key = os_type.lower()
-        
-        return base_rates.get(os_key, base_rates["linux"]) * multiplier
@@ -9,6 +9,7 @@ import os
 import requests
 from typing import Dict, Optional, Any
 from backend.utils.error_handler import handle_calculation_error
+from backend.services.rate_catalog import format_savings, get_rate_catalog
 
 
 class HuaweiPricingClient:
@@ -49,111 +50,7 @@ class HuaweiPricingClient:
             # Simulated API call to Huawei CCE Pricing API
             # Example: GET /v2/{project_id}/billing/ondemand/rating?product_type=CCE
             
-            response = {
-                "provider": "huawei-cce",
-                "cluster_type": cluster_type,
-                "os_type": os_type.lower(),
-                "region": region,
-                "pricing": {
-                    "on_demand": {
-                        "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type),
-                        "currency": "USD",
-                        "unit": "hour"
-                    },
-                    "yearly_package": {
-                        "1_year": {
-                            "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type) * 0.65,
-                            "savings": "35%"
-                        },
-                        "3_year": {
-                            "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type) * 0.55,
-                            "savings": "45%"
-                        }
-                    }
-                },
-                "metadata": {
-                    "api_endpoint": f"{self.api_endpoint}/{self.project_id}/billing/ondemand/rating?product_type=CCE",
-                    "api_version": "v2",
-                    "last_updated": "2024-01-15T10:30:00Z"
-                }
-            }
-            
-            return response
-            
-        except Exception as e:
-            raise Exception(f"Huawei CCE Pricing API error: {str(e)}")
-    
-    def get_cci_pricing(
-        self,
-        instance_type: str,
-        os_type: str = "Linux",
-        region: str = "cn-north-1"
-    ) -> Dict[str, Any]:
-        """
-        Fetch CCI (Cloud Container Instance) pricing from Huawei Cloud Billing API.
-        
-        Args:
-            instance_type: CCI instance type (e.g., 'small', 'medium', 'large')
-            os_type: Operating system ('Linux' or 'Windows')
-            region: Huawei region code
-            
-        Returns:
-            Dictionary containing CCI pricing information
-        """
-        try:
-            # Simulated API call to Huawei CCI Pricing API
-            # Example: GET /v2/{project_id}/billing/ondemand/rating?product_type=CCI
-            
-            response = {
-                "provider": "huawei-cci",
-                "instance_type": instance_type,
-                "os_type": os_type.lower(),
-                "region": region,
-                "pricing": {
-                    "on_demand": {
-                        "price_per_hour": self._calculate_huawei_cci_hourly_rate(instance_type, os_type),
-                        "currency": "USD",
-                        "unit": "hour"
-                    },
-                    "pay_per_use": {
-                        "price_per_hour": self._calculate_huawei_cci_hourly_rate(instance_type, os_type),
-                        "currency": "USD",
-                        "unit": "hour",
-                        "note": "Serverless - pay only for running time"
-                    }
-                },
-                "metadata": {
-                    "api_endpoint": f"{self.api_endpoint}/{self.project_id}/billing/ondemand/rating?product_type=CCI",
-                    "api_version": "v2",
-                    "last_updated": "2024-01-15T10:30:00Z"
-                }
-            }
-            
-            return response
-            
-        except Exception as e:
-            raise Exception(f"Huawei CCI Pricing API error: {str(e)}")
-    
-    def get_cce_pricing(
-        self,
-        cluster_type: str,
-        os_type: str = "Linux",
-        region: str = "cn-north-1"
-    ) -> Dict[str, Any]:
-        """
-        Fetch CCE (Cloud Container Engine) pricing from Huawei Cloud Billing API.
-        
-        Args:
-            cluster_type: CCE cluster type (e.g., 'standard', 'autopilot')
-            os_type: Operating system ('Linux' or 'Windows')
-            region: Huawei region code
-            
-        Returns:
-            Dictionary containing CCE pricing information
-        """
-        try:
-            # Simulated API call to Huawei CCE Pricing API
-            # Example: GET /v2/{project_id}/billing/ondemand/rating?product_type=CCE
+            rates = get_rate_catalog().get_rates("huawei-cce", cluster_type, os_type)
             
             response = {
                 "provider": "huawei-cce",
@@ -162,18 +59,18 @@ class HuaweiPricingClient:
                 "region": region,
                 "pricing": {
                     "on_demand": {
-                        "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type),
+                        "price_per_hour": rates["on_demand"],
                         "currency": "USD",
                         "unit": "hour"
                     },
                     "yearly_package": {
                         "1_year": {
-                            "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type) * 0.65,
-                            "savings": "35%"
+                            "price_per_hour": rates["yearly_package_1_year"],
+                            "savings": format_savings(rates["yearly_package_1_year"], rates["on_demand"])
                         },
                         "3_year": {
-                            "price_per_hour": self._calculate_huawei_cce_hourly_rate(cluster_type, os_type) * 0.55,
-                            "savings": "45%"
+                            "price_per_hour": rates["yearly_package_3_year"],
+                            "savings": format_savings(rates["yearly_package_3_year"], rates["on_demand"])
                         }
                     }
                 },
@@ -210,6 +107,8 @@ class HuaweiPricingClient:
             # Simulated API call to Huawei CCI Pricing API
             # Example: GET /v2/{project_id}/billing/ondemand/rating?product_type=CCI
             
+            rates = get_rate_catalog().get_rates("huawei-cci", instance_type, os_type)
+            
             response = {
                 "provider": "huawei-cci",
                 "instance_type": instance_type,
@@ -217,12 +116,12 @@ class HuaweiPricingClient:
                 "region": region,
                 "pricing": {
                     "on_demand": {
-                        "price_per_hour": self._calculate_huawei_cci_hourly_rate(instance_type, os_type),
+                        "price_per_hour": rates["on_demand"],
                         "currency": "USD",
                         "unit": "hour"
                     },
                     "pay_per_use": {
-                        "price_per_hour": self._calculate_huawei_cci_hourly_rate(instance_type, os_type),
+                        "price_per_hour": rates["pay_per_use"],
                         "currency": "USD",
                         "unit": "hour",
                         "note": "Serverless - pay only for running time"
@@ -261,6 +160,8 @@ class HuaweiPricingClient:
             # Simulated API call to Huawei Cloud Billing API
             # Example: GET /v2/{project_id}/billing/ondemand/rating
             
+            rates = get_rate_catalog().get_rates("huawei", flavor_type, os_type)
+            
             response = {
                 "provider": "huawei",
                 "flavor_type": flavor_type,
@@ -268,23 +169,23 @@ class HuaweiPricingClient:
                 "region": region,
                 "pricing": {
                     "on_demand": {
-                        "price_per_hour": self._calculate_huawei_hourly_rate(flavor_type, os_type),
+                        "price_per_hour": rates["on_demand"],
                         "currency": "USD",
                         "unit": "hour"
                     },
                     "yearly_package": {
                         "1_year": {
-                            "price_per_hour": self._calculate_huawei_hourly_rate(flavor_type, os_type) * 0.65,
-                            "savings": "35%"
+                            "price_per_hour": rates["yearly_package_1_year"],
+                            "savings": format_savings(rates["yearly_package_1_year"], rates["on_demand"])
                         },
                         "3_year": {
-                            "price_per_hour": self._calculate_huawei_hourly_rate(flavor_type, os_type) * 0.55,
-                            "savings": "45%"
+                            "price_per_hour": rates["yearly_package_3_year"],
+                            "savings": format_savings(rates["yearly_package_3_year"], rates["on_demand"])
                         }
                     },
                     "spot": {
-                        "price_per_hour": self._calculate_huawei_hourly_rate(flavor_type, os_type) * 0.75,
-                        "savings": "25%",
+                        "price_per_hour": rates["spot"],
+                        "savings": format_savings(rates["spot"], rates["on_demand"]),
                         "note": "Can be interrupted"
                     }
                 },
@@ -366,71 +267,3 @@ class HuaweiPricingClient:
         }
         
         return multipliers.get(region, 1.0)
-    
-    def _calculate_huawei_hourly_rate(self, flavor_type: str, os_type: str) -> float:
-        """
-        Calculate hourly rate based on flavor type and OS.
-        This simulates the pricing calculation from Huawei API.
-        """
-        base_rates = {
-            "linux": 0.042,
-            "windows": 0.084
-        }
-        
-        flavor_multipliers = {
-            "s6.small.1": 0.5,
-            "s6.medium.2": 1.0,
-            "s6.large.2": 2.0,
-            "s6.xlarge.2": 4.0,
-            "c6.large.2": 2.0,
-            "c6.xlarge.2": 4.0,
-            "c6.2xlarge.2": 8.0
-        }
-        
-        multiplier = flavor_multipliers.get(flavor_type, 2.0)
-        os_key = os_type.lower()
-        
-        return base_rates.get(os_key, base_rates["linux"]) * multiplier
-    
-    def _calculate_huawei_cce_hourly_rate(self, cluster_type: str, os_type: str) -> float:
-        """
-        Calculate hourly rate for CCE based on cluster type and OS.
-        This simulates the pricing calculation from Huawei CCE API.
-        """
-        base_rates = {
-            "linux": 0.045,
-            "windows": 0.090
-        }
-        
-        cluster_multipliers = {
-            "standard": 1.0,
-            "autopilot": 1.2,
-            "dedicated": 1.5
-        }
-        
-        multiplier = cluster_multipliers.get(cluster_type, 1.0)
-        os_key = os_type.lower()
-        
-        return base_rates.get(os_key, base_rates["linux"]) * multiplier
-    
-    def _calculate_huawei_cci_hourly_rate(self, instance_type: str, os_type: str) -> float:
-        """
-        Calculate hourly rate for CCI based on instance type and OS.
-        This simulates the pricing calculation from Huawei CCI API.
-        """
-        base_rates = {
-            "linux": 0.044,
-            "windows": 0.088
-        }
-        
-        instance_multipliers = {
-            "small": 0.5,
-            "medium": 1.0,
-            "large": 2.0,
-            "xlarge": 4.0
-        }
-        
-        multiplier = instance_multipliers.get(instance_type, 1.0)
-        os_key = os_type.lower()
-        
-        return base_rates.get(os_key, base_rates["linux"]) * multiplier
@@ -0,0 +1,201 @@
+"""
+Local Price Store
+
+Compact SQLite store of provider list prices, filled offline by the
+ingestion and sync scripts and read by the pricing clients at request time.
+One row per (provider, region, instance type, OS, tier), indexed by that key.
+
+Readers open the file read-only and never create it: until a store has
+been ingested, lookups return None and clients fall back to the rate catalog.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+PRICE_STORE_PATH = os.getenv(
+    "PRICE_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "price_store.sqlite3")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    provider TEXT NOT NULL,
+    region TEXT NOT NULL,
+    instance_type TEXT NOT NULL,
+    os TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    price_per_hour REAL NOT NULL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    effective_date TEXT,
+    sku TEXT,
+    PRIMARY KEY (provider, region, instance_type, os, tier)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sources (
+    provider TEXT NOT NULL,
+    source TEXT NOT NULL,
+    version TEXT,
+    ingested_at TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    PRIMARY KEY (provider, source)
+) WITHOUT ROWID;
+"""
+
+# (provider, region, instance_type, os, tier, price_per_hour, currency, effective_date, sku)
+PriceRow = Tuple[str, str, str, str, str, float, str, Optional[str], Optional[str]]
+
+UPSERT_SQL = """
+INSERT INTO prices (provider, region, instance_type, os, tier, price_per_hour, currency, effective_date, sku)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (provider, region, instance_type, os, tier) DO UPDATE SET
+    price_per_hour = excluded.price_per_hour,
+    currency = excluded.currency,
+    effective_date = excluded.effective_date,
+    sku = excluded.sku
+"""
+
+
+class PriceStore:
+    """
+    SQLite-backed price table.
+    
+    Connections are per thread. Writers create the file and schema on
+    first use; readers only open an existing file, read-only.
+    """
+    
+    def __init__(self, path: str = PRICE_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+    
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """Read-only connection for this thread, or None if the store does not exist yet."""
+        conn = getattr(self._local, "reader", None)
+        if conn is None:
+            if not os.path.exists(self.path):
+                return None
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.reader = conn
+        return conn
+    
+    def connect_writer(self) -> sqlite3.Connection:
+        """
+        Open a read-write connection, creating the store if needed.
+        
+        Returns:
+            Connection the caller must close
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+    
+    def upsert_prices(self, conn: sqlite3.Connection, rows: Iterable[PriceRow]) -> int:
+        """
+        Insert or update price rows (no commit).
+        
+        Args:
+            conn: Writer connection from connect_writer()
+            rows: Price rows
+        
+        Returns:
+            Number of rows inserted or updated
+        """
+        cursor = conn.executemany(UPSERT_SQL, rows)
+        return cursor.rowcount
+    
+    def count_rows(self, conn: sqlite3.Connection, provider: str) -> int:
+        """Get the number of stored price rows for a provider."""
+        return conn.execute("SELECT COUNT(*) FROM prices WHERE provider = ?", (provider,)).fetchone()[0]
+    
+    def get_effective_dates(self, conn: sqlite3.Connection, provider: str) -> Dict[Tuple, Optional[str]]:
+        """
+        Get the stored effective date of every price row for a provider.
+        
+        Args:
+            conn: Writer connection from connect_writer()
+            provider: Provider name
+        
+        Returns:
+            Dictionary of (region, instance_type, os, tier) -> effective date
+        """
+        rows = conn.execute(
+            "SELECT region, instance_type, os, tier, effective_date FROM prices WHERE provider = ?",
+            (provider,)
+        )
+        return {(region, instance_type, os_key, tier): date for region, instance_type, os_key, tier, date in rows}
+    
+    def record_source(
+        self,
+        conn: sqlite3.Connection,
+        provider: str,
+        source: str,
+        version: Optional[str],
+        row_count: int
+    ) -> None:
+        """Record where and when a provider's prices were loaded from (no commit)."""
+        conn.execute(
+            "INSERT OR REPLACE INTO sources (provider, source, version, ingested_at, row_count) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (provider, source, version, datetime.now(timezone.utc).isoformat(), row_count)
+        )
+    
+    def get_rates(
+        self,
+        provider: str,
+        region: str,
+        instance_type: str,
+        os_type: str
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        Get stored hourly rates for every tier of an instance type.
+        
+        Args:
+            provider: Provider name
+            region: Provider region code (e.g., 'eu-central-1')
+            instance_type: Instance type
+            os_type: Operating system ('Linux' or 'Windows', case-insensitive)
+        
+        Returns:
+            Dictionary of tier -> {price_per_hour, currency, effective_date},
+            or None if the store has no prices for this instance
+        """
+        conn = self._reader()
+        if conn is None:
+            return None
+        
+        try:
+            rows = conn.execute(
+                "SELECT tier, price_per_hour, currency, effective_date FROM prices "
+                "WHERE provider = ? AND region = ? AND instance_type = ? AND os = ?",
+                (provider, region, instance_type, os_type.lower())
+            ).fetchall()
+        except sqlite3.DatabaseError:
+            # Store exists but has not been initialized yet
+            return None
+        
+        if not rows:
+            return None
+        
+        return {
+            tier: {"price_per_hour": price, "currency": currency, "effective_date": effective_date}
+            for tier, price, currency, effective_date in rows
+        }
+
+
+_price_store = None
+_price_store_lock = threading.Lock()
+
+
+def get_price_store() -> PriceStore:
+    """Get the shared price store at PRICE_STORE_PATH."""
+    global _price_store
+    if _price_store is None:
+        with _price_store_lock:
+            if _price_store is None:
+                _price_store = PriceStore()
+    return _price_store
@@ -3,13 +3,80 @@ Cloud Provider Pricing Service
 
 Orchestrates API calls to AWS, Azure, and GCP pricing APIs.
 This service acts as a unified interface for fetching pricing data from multiple providers.
+
+Multi-provider requests fan out concurrently on one bounded thread pool
+shared by every PricingService, so latency is that of the slowest provider
+rather than the sum of all. HTTP calls to a provider get connect and read
+timeouts no longer than its fan-out timeout (http_timeout), so a call the
+fan-out gave up on also ends and frees its thread.
+Provider responses are cached with stale-while-revalidate refresh.
+
+Provider clients (and the requests library they use) are imported on
+first use, so app startup does not pay for them.
 """
 
-from typing import Dict, List, Optional, Any
-from backend.services.aws_api_client import AWSPricingClient
-from backend.services.azure_api_client import AzurePricingClient
-from backend.services.gcp_api_client import GCPPricingClient
-from backend.services.huawei_api_client import HuaweiPricingClient
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional, Any, Tuple
+from backend.utils.cache import RevalidatingCache
+
+PRICING_MAX_WORKERS = int(os.getenv("PRICING_MAX_WORKERS", 8))
+PRICING_CONNECT_TIMEOUT = float(os.getenv("PRICING_CONNECT_TIMEOUT", 1.0))
+
+# Provider prices change at most daily
+PRICING_CACHE_SIZE = int(os.getenv("PRICING_CACHE_SIZE", 4096))
+PRICING_CACHE_TTL = float(os.getenv("PRICING_CACHE_TTL", 6 * 3600))
+PRICING_CACHE_STALE_TTL = float(os.getenv("PRICING_CACHE_STALE_TTL", 24 * 3600))
+PRICING_CACHE_ERROR_TTL = float(os.getenv("PRICING_CACHE_ERROR_TTL", 60))
+
+# Shared by every PricingService instance. Only network failures are
+# negative-cached (requests' exceptions are OSErrors); bad input is not.
+pricing_cache = RevalidatingCache(
+    "provider_pricing",
+    maxsize=PRICING_CACHE_SIZE,
+    ttl=PRICING_CACHE_TTL,
+    stale_ttl=PRICING_CACHE_STALE_TTL,
+    error_ttl=PRICING_CACHE_ERROR_TTL,
+    error_types=(OSError,)
+)
+
+# Fan-out pool shared by every PricingService, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared fan-out thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PRICING_MAX_WORKERS, thread_name_prefix="pricing")
+    return _executor
+
+
+def _reset_executor_in_child() -> None:
+    # Forked workers (e.g., gunicorn) must not inherit the parent's dead pool
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_executor_in_child)
+
+# Client module and class per provider client, imported on first use
+CLIENT_CLASSES = {
+    "aws": ("backend.services.aws_api_client", "AWSPricingClient"),
+    "azure": ("backend.services.azure_api_client", "AzurePricingClient"),
+    "gcp": ("backend.services.gcp_api_client", "GCPPricingClient"),
+    "huawei": ("backend.services.huawei_api_client", "HuaweiPricingClient")
+}
+
+# Provider names get_provider_pricing() accepts (Huawei CCE/CCI use the Huawei client)
+SUPPORTED_PROVIDERS = ("aws", "azure", "gcp", "huawei", "huawei-cce", "huawei-cci")
 
 
 class PricingService:
@@ -20,11 +87,57 @@ class PricingService:
     It does not affect actual cost calculations - those use database/provider configurations.
     """
     
-    def __init__(self):
-        self.aws_client = AWSPricingClient()
-        self.azure_client = AzurePricingClient()
-        self.gcp_client = GCPPricingClient()
-        self.huawei_client = HuaweiPricingClient()
+    def __init__(
+        self,
+        provider_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        provider_timeouts: Optional[Dict[str, float]] = None
+    ):
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        
+        # Fan-out settings (seconds); per-provider overrides take precedence
+        self.provider_timeout = provider_timeout or float(os.getenv("PRICING_PROVIDER_TIMEOUT", 3.0))
+        self.deadline = deadline or float(os.getenv("PRICING_DEADLINE", 5.0))
+        self.provider_timeouts = provider_timeouts or {}
+    
+    def _get_client(self, name: str):
+        """Get a provider client, importing and creating it on first use."""
+        client = self._clients.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(name)
+                if client is None:
+                    module_name, class_name = CLIENT_CLASSES[name]
+                    client = getattr(importlib.import_module(module_name), class_name)()
+                    self._clients[name] = client
+        return client
+    
+    @property
+    def aws_client(self):
+        return self._get_client("aws")
+    
+    @property
+    def azure_client(self):
+        return self._get_client("azure")
+    
+    @property
+    def gcp_client(self):
+        return self._get_client("gcp")
+    
+    @property
+    def huawei_client(self):
+        return self._get_client("huawei")
+    
+    def http_timeout(self, provider: str) -> Tuple[float, float]:
+        """
+        Get (connect, read) timeouts for HTTP calls to a provider.
+        
+        Both are capped by the provider's fan-out timeout, so a call the
+        fan-out has given up on ends soon after and frees its pool thread.
+        """
+        timeout = self.provider_timeouts.get(provider, self.provider_timeout)
+        return min(PRICING_CONNECT_TIMEOUT, timeout), timeout
     
     def get_provider_pricing(
         self,
@@ -35,7 +148,41 @@ class PricingService:
         region: str
     ) -> Dict[str, Any]:
         """
-        Get pricing for a specific provider.
+        Get pricing for a specific provider, served from the pricing cache.
+        
+        Args:
+            provider: Provider name ('aws', 'azure', 'gcp')
+            instance_type: Instance/machine type
+            os_type: Operating system type
+            storage_type: Storage type
+            region: Region code
+            
+        Returns:
+            Dictionary containing pricing information (shared, read-only)
+            
+        Raises:
+            ValueError: If provider is not supported
+        """
+        provider = str(provider).strip().lower()
+        # Rejected before the cache, so made-up names never take cache slots
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"Unsupported provider: {provider}")
+        key = (provider, instance_type, os_type, storage_type, region)
+        return pricing_cache.get_or_load(
+            key,
+            lambda: self._fetch_provider_pricing(provider, instance_type, os_type, storage_type, region)
+        )
+    
+    def _fetch_provider_pricing(
+        self,
+        provider: str,
+        instance_type: str,
+        os_type: str,
+        storage_type: str,
+        region: str
+    ) -> Dict[str, Any]:
+        """
+        Fetch pricing for a specific provider from its API client.
         
         Args:
             provider: Provider name ('aws', 'azure', 'gcp')
@@ -102,34 +249,80 @@ class PricingService:
         region: str
     ) -> Dict[str, Any]:
         """
-        Get pricing for multiple providers simultaneously.
+        Get pricing for multiple providers concurrently.
+        
+        Each provider runs on the shared thread pool. A provider that exceeds
+        its timeout, or is still running at the overall deadline, is reported
+        with status "timeout" and the remaining results are returned.
         
         Args:
-            providers: List of provider names
+            providers: List of provider names (case-insensitive; results
+                are keyed by the lowercase name)
             instance_types: Dictionary mapping provider to instance type
             os_type: Operating system type
             storage_type: Storage type
             region: Region code
             
         Returns:
-            Dictionary containing pricing for all providers
+            Dictionary containing pricing for all providers, plus a
+            per-provider status ("ok", "error" or "timeout") and latency
         """
+        start = time.monotonic()
+        deadline_at = start + self.deadline
+        executor = get_executor()
+        instance_types = {str(name).strip().lower(): value for name, value in instance_types.items()}
+        
+        pending = {}
+        cutoffs = {}
+        for provider in dict.fromkeys(str(name).strip().lower() for name in providers):
+            instance_type = instance_types.get(provider, "default")
+            future = executor.submit(
+                self.get_provider_pricing,
+                provider, instance_type, os_type, storage_type, region
+            )
+            pending[future] = provider
+            timeout = self.provider_timeouts.get(provider, self.provider_timeout)
+            cutoffs[future] = min(start + timeout, deadline_at)
+        
         results = {}
+        status = {}
         
-        for provider in providers:
-            try:
-                instance_type = instance_types.get(provider, "default")
-                results[provider] = self.get_provider_pricing(
-                    provider, instance_type, os_type, storage_type, region
-                )
-            except Exception as e:
+        while pending:
+            next_cutoff = min(cutoffs[future] for future in pending)
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, next_cutoff - time.monotonic()),
+                return_when=FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            latency_ms = round((now - start) * 1000, 1)
+            
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    results[provider] = future.result()
+                    status[provider] = {"status": "ok", "latency_ms": latency_ms}
+                except Exception as e:
+                    results[provider] = {
+                        "error": str(e),
+                        "provider": provider
+                    }
+                    status[provider] = {"status": "error", "latency_ms": latency_ms}
+            
+            # Give up on providers past their cutoff; their threads finish in the background
+            for future in [f for f in pending if cutoffs[f] <= now]:
+                provider = pending.pop(future)
+                future.cancel()
                 results[provider] = {
-                    "error": str(e),
+                    "error": "Provider pricing request timed out",
                     "provider": provider
                 }
+                status[provider] = {"status": "timeout", "latency_ms": latency_ms}
         
         return {
             "providers": results,
+            "provider_status": status,
+            "partial": any(entry["status"] != "ok" for entry in status.values()),
             "region": region,
             "os_type": os_type,
             "storage_type": storage_type
@@ -0,0 +1,137 @@
+"""
+Provider Rate Catalog
+
+Compiles PROVIDER_RATES into an immutable table of hourly rates with every
+pricing tier already computed, for every (product, instance type, OS).
+Pricing clients read tiers with one dictionary lookup instead of
+rebuilding the rate tables on every call, and bulk queries are answered
+from the same table.
+
+The catalog is a snapshot of the configuration at build time.
+Call rebuild_rate_catalog() after changing PROVIDER_RATES.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Tuple
+
+from backend.config.provider_rates import PROVIDER_RATES
+
+DEFAULT_OS = "linux"
+
+
+class RateCatalog:
+    """
+    Immutable hourly rate table for all provider products.
+    
+    Each entry maps tier name to hourly rate: "on_demand" plus every tier
+    configured for the product (e.g. "reserved_1_year", "spot").
+    """
+    
+    def __init__(self, provider_rates: dict = PROVIDER_RATES):
+        rates = {}
+        defaults = {}
+        os_keys = {}
+        
+        for product, config in provider_rates.items():
+            base_rates = config["base_rates"]
+            tiers = config["tiers"]
+            os_keys[product] = frozenset(base_rates)
+            
+            for os_key, base_rate in base_rates.items():
+                for instance_type, multiplier in config["instance_multipliers"].items():
+                    rates[(product, instance_type, os_key)] = self._compile_tiers(base_rate * multiplier, tiers)
+                defaults[(product, os_key)] = self._compile_tiers(
+                    base_rate * config["default_multiplier"], tiers
+                )
+        
+        self._rates = MappingProxyType(rates)
+        self._defaults = MappingProxyType(defaults)
+        self._os_keys = MappingProxyType(os_keys)
+    
+    @staticmethod
+    def _compile_tiers(hourly_rate: float, tiers: dict) -> Mapping[str, float]:
+        """Compute every tier rate from the on-demand hourly rate."""
+        compiled = {"on_demand": hourly_rate}
+        for tier, factor in tiers.items():
+            compiled[tier] = hourly_rate * factor
+        return MappingProxyType(compiled)
+    
+    @property
+    def products(self) -> Tuple[str, ...]:
+        """Products covered by the catalog."""
+        return tuple(self._os_keys)
+    
+    def get_rates(self, product: str, instance_type: str, os_type: str = "Linux") -> Mapping[str, float]:
+        """
+        Get hourly rates for every tier of an instance type.
+        
+        Args:
+            product: Provider product ('aws', 'azure', 'gcp', 'huawei', 'huawei-cce', 'huawei-cci')
+            instance_type: Instance/machine/flavor type, or CCE cluster type
+            os_type: Operating system ('Linux' or 'Windows')
+        
+        Returns:
+            Read-only mapping of tier name to hourly rate
+        
+        Raises:
+            ValueError: If product is not in the catalog
+        """
+        os_key = os_type.lower()
+        rates = self._rates.get((product, instance_type, os_key))
+        if rates is not None:
+            return rates
+        
+        if product not in self._os_keys:
+            raise ValueError(f"Unsupported provider: {product}")
+        if os_key not in self._os_keys[product]:
+            os_key = DEFAULT_OS
+        
+        return self._rates.get((product, instance_type, os_key)) or self._defaults[(product, os_key)]
+    
+    def get_rates_bulk(self, queries: Iterable[Tuple[str, str, str]]) -> List[Mapping[str, float]]:
+        """
+        Get hourly rates for many (product, instance type, OS) queries.
+        
+        Args:
+            queries: Iterable of (product, instance_type, os_type) tuples
+        
+        Returns:
+            Rates per query, in query order
+        
+        Raises:
+            ValueError: If any product is not in the catalog
+        """
+        get_rates = self.get_rates
+        return [get_rates(product, instance_type, os_type) for product, instance_type, os_type in queries]
+
+
+def format_savings(rate: float, on_demand_rate: float) -> str:
+    """Format the saving of a discounted tier rate over on-demand (e.g. '40%')."""
+    if on_demand_rate <= 0:
+        return "0%"
+    return f"{round((1 - rate / on_demand_rate) * 100)}%"
+
+
+_catalog = RateCatalog()
+_rebuild_lock = threading.Lock()
+
+
+def get_rate_catalog() -> RateCatalog:
+    """Get the current rate catalog."""
+    return _catalog
+
+
+def rebuild_rate_catalog() -> RateCatalog:
+    """
+    Rebuild the rate catalog from the current PROVIDER_RATES.
+    
+    In-flight requests keep the catalog they already obtained.
+    
+    Returns:
+        Newly built catalog
+    """
+    global _catalog
+    with _rebuild_lock:
+        _catalog = RateCatalog()
+    return _catalog
@@ -1,26 +1,100 @@
 """
 Admin Authentication Middleware
 
-Checks if user is admin before allowing access to admin routes.
+Authorizes requests from the signed bearer token issued at login
+(Authorization: Bearer <token>), without a database lookup.
+
+Protected routes act for the token's user; only admins may name another
+user with the user_id route argument, query param or body field.
+
+AUTH_ALLOW_LEGACY_USER_ID=true (off by default, for client migration
+only) lets requests without a token authorize from the user_id parameter:
+admin routes then look the user up, user routes trust the given user_id,
+and every such request is logged. Routes on a single analysis always
+require a token.
 """
 
+import logging
+import os
 from functools import wraps
-from flask import request, jsonify
-from backend.database.connection import get_db
+from typing import Optional
+from flask import request, jsonify, g
+from backend.database.connection import get_request_db
 from backend.database.repositories import UserRepository
+from backend.utils.auth_tokens import TokenError, get_bearer_token, verify_token
+
+AUTH_ALLOW_LEGACY_USER_ID = os.getenv("AUTH_ALLOW_LEGACY_USER_ID", "false").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+
+def _request_user_id() -> Optional[str]:
+    """Get user_id from the query string or JSON body."""
+    body = request.get_json(silent=True)
+    return request.args.get("user_id") or (isinstance(body, dict) and body.get("user_id")) or None
+
+
+def _authenticate():
+    """
+    Verify the request's bearer token, if any.
+    
+    Returns:
+        Tuple of (claims or None, error response or None). Claims are None
+        with no error for a legacy request without a token.
+    """
+    token = get_bearer_token(request.headers.get("Authorization"))
+    if token is None:
+        if not AUTH_ALLOW_LEGACY_USER_ID:
+            return None, (jsonify({"error": "Authentication required"}), 401)
+        logger.warning("Legacy user_id authorization without a token: %s %s", request.method, request.path)
+        return None, None
+    
+    try:
+        claims = verify_token(token)
+    except TokenError as e:
+        return None, (jsonify({"error": "invalid_token", "message": str(e)}), 401)
+    
+    g.auth = claims
+    return claims, None
+
+
+def get_current_user_id() -> Optional[str]:
+    """Get the user ID of the request's verified token, or None."""
+    claims = g.get("auth")
+    return claims["sub"] if claims else None
+
+
+def get_target_user_id() -> Optional[str]:
+    """Get the user a require_user route acts for (see require_user)."""
+    return g.get("target_user_id")
+
+
+def current_user_is_admin() -> bool:
+    """Whether the request's verified token carries the admin role."""
+    claims = g.get("auth")
+    return bool(claims) and claims["role"] == "admin"
 
 
 def require_admin(f):
     """Decorator to require admin access."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # Get user_id from request (should be passed as query param or in body)
-        user_id = request.args.get("user_id") or (request.json and request.json.get("user_id"))
+        claims, error = _authenticate()
+        if error:
+            return error
+        
+        if claims is not None:
+            if claims["role"] != "admin":
+                return jsonify({"error": "Admin access required"}), 403
+            return f(*args, **kwargs)
+        
+        # Legacy: user_id passed as query param or in body
+        user_id = _request_user_id()
         
         if not user_id:
             return jsonify({"error": "user_id is required"}), 400
         
-        db = next(get_db())
+        db = get_request_db()
         user = UserRepository.get_by_id(db, user_id)
         
         if not user:
@@ -32,3 +106,35 @@ def require_admin(f):
         return f(*args, **kwargs)
     
     return decorated_function
+
+
+def require_user(f):
+    """
+    Decorator to require a user and resolve the user the request acts for.
+    
+    With a token, non-admins always act for themselves: a user_id route
+    argument must match the token's user, and user_id query or body fields
+    are ignored. Admins act for the user_id route argument, query param or
+    body field if given, else for themselves. Legacy requests without a
+    token act for the given user_id. The result is available from
+    get_target_user_id().
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        claims, error = _authenticate()
+        if error:
+            return error
+        
+        route_user_id = kwargs.get("user_id")
+        if claims is None:
+            g.target_user_id = route_user_id or _request_user_id()
+        elif claims["role"] == "admin":
+            g.target_user_id = route_user_id or _request_user_id() or claims["sub"]
+        else:
+            if route_user_id and route_user_id != claims["sub"]:
+                return jsonify({"error": "Access denied"}), 403
+            g.target_user_id = claims["sub"]
+        
+        return f(*args, **kwargs)
+    
+    return decorated_function
@@ -0,0 +1,269 @@
+"""
+Signed Auth Tokens
+
+Stateless bearer tokens issued at login. A token carries the user id,
+role, expiry and a unique id (jti), signed with HMAC-SHA256, so it is
+verified without a database round trip.
+
+Revoked tokens (logout) are kept in the revoked_tokens table until they
+expire. Changing a user's password or role, or deleting the user, stores
+a per-user cutoff in token_cutoffs instead: every token issued before it
+is rejected. Each process holds both small lists in memory and reloads
+them at most once per AUTH_DENYLIST_REFRESH seconds; if a reload fails,
+the last loaded copy stays in use until the next attempt. Cutoffs have
+second resolution, like the iat claim.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.database.connection import DB_INIT_MODE, SessionLocal, ensure_schema
+from backend.database.models import RevokedToken, TokenCutoff
+
+AUTH_TOKEN_TTL = int(os.getenv("AUTH_TOKEN_TTL", "43200"))
+AUTH_DENYLIST_REFRESH = float(os.getenv("AUTH_DENYLIST_REFRESH", "30"))
+
+logger = logging.getLogger(__name__)
+
+_secret = os.getenv("AUTH_TOKEN_SECRET") or os.getenv("SECRET_KEY")
+if not _secret:
+    _secret = secrets.token_hex(32)
+    logger.warning("AUTH_TOKEN_SECRET is not set: tokens are only valid in this process until it restarts")
+AUTH_TOKEN_SECRET = _secret.encode()
+
+
+class TokenError(ValueError):
+    """Raised when a token is malformed, badly signed, expired or revoked."""
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _timestamp(value: datetime) -> int:
+    """Unix timestamp of a stored datetime (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(AUTH_TOKEN_SECRET, payload.encode(), hashlib.sha256).digest())
+
+
+def issue_token(user_id: str, is_admin: bool, ttl: int = AUTH_TOKEN_TTL) -> Tuple[str, int]:
+    """
+    Issue a signed token for a user.
+    
+    Args:
+        user_id: User ID (sub claim)
+        is_admin: Whether the token carries the admin role
+        ttl: Lifetime in seconds
+    
+    Returns:
+        Tuple of (token, expiry as a Unix timestamp)
+    """
+    now = int(time.time())
+    claims = {
+        "sub": user_id,
+        "role": "admin" if is_admin else "user",
+        "iat": now,
+        "exp": now + ttl,
+        "jti": secrets.token_hex(12)
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload)}", claims["exp"]
+
+
+def decode_token(token: str) -> Dict:
+    """
+    Check a token's signature and expiry and return its claims.
+    
+    Raises:
+        TokenError: If the token is malformed, badly signed or expired
+    """
+    try:
+        payload, signature = token.split(".")
+    except ValueError:
+        raise TokenError("Malformed token")
+    
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise TokenError("Invalid token signature")
+    
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        raise TokenError("Malformed token")
+    
+    if not isinstance(claims, dict) or not all(key in claims for key in ("sub", "role", "exp", "jti")):
+        raise TokenError("Malformed token")
+    if claims["exp"] <= time.time():
+        raise TokenError("Token expired")
+    return claims
+
+
+class TokenDenyList:
+    """In-memory copy of the unexpired revoked token ids and user cutoffs, reloaded periodically."""
+    
+    def __init__(self, refresh_interval: float = AUTH_DENYLIST_REFRESH):
+        self.refresh_interval = refresh_interval
+        self._revoked: Dict[str, int] = {}
+        self._cutoffs: Dict[str, int] = {}
+        self._loaded_at = None
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self.reloads = 0
+        self.reload_failures = 0
+    
+    def _reload(self) -> None:
+        """Load unexpired revoked token ids and recent user cutoffs from the database."""
+        if DB_INIT_MODE == "deferred":
+            ensure_schema()
+        now = datetime.now(timezone.utc)
+        db = SessionLocal()
+        try:
+            rows = db.query(RevokedToken.jti, RevokedToken.expires_at).filter(RevokedToken.expires_at > now).all()
+            # Older cutoffs only reject tokens that have expired anyway
+            cutoff_rows = db.query(TokenCutoff.user_id, TokenCutoff.valid_after).filter(
+                TokenCutoff.valid_after > now - timedelta(seconds=AUTH_TOKEN_TTL)
+            ).all()
+        finally:
+            db.close()
+        
+        revoked = {jti: _timestamp(expires_at) for jti, expires_at in rows}
+        cutoffs = {user_id: _timestamp(valid_after) for user_id, valid_after in cutoff_rows}
+        with self._lock:
+            self._revoked = revoked
+            self._cutoffs = cutoffs
+            self._loaded_at = time.monotonic()
+            self.reloads += 1
+    
+    def _refresh(self) -> None:
+        """Reload the lists if they are stale."""
+        if self._is_stale():
+            with self._reload_lock:
+                # Another thread may have reloaded while this one waited
+                if self._is_stale():
+                    try:
+                        self._reload()
+                    except Exception:
+                        # Keep serving the last loaded list; retry after the refresh interval
+                        logger.warning("Could not reload the token deny-list; using the cached copy", exc_info=True)
+                        self._loaded_at = time.monotonic()
+                        self.reload_failures += 1
+    
+    def is_revoked(self, claims: Dict) -> bool:
+        """
+        Check whether a token is revoked, reloading the lists if they are stale.
+        
+        A token is revoked if its id is on the deny-list or it was issued
+        before its user's cutoff.
+        """
+        self._refresh()
+        if claims["jti"] in self._revoked:
+            return True
+        cutoff = self._cutoffs.get(claims["sub"])
+        return cutoff is not None and claims.get("iat", 0) < cutoff
+    
+    def _is_stale(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at >= self.refresh_interval
+    
+    def revoke(self, db: Session, claims: Dict) -> None:
+        """
+        Revoke a token until it expires, and prune revoked tokens that have expired.
+        
+        Args:
+            db: Database session
+            claims: Claims of the token to revoke
+        """
+        now = datetime.now(timezone.utc)
+        expires_at = datetime.fromtimestamp(claims["exp"], timezone.utc)
+        
+        db.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        if db.get(RevokedToken, claims["jti"]) is None:
+            db.add(RevokedToken(jti=claims["jti"], user_id=claims["sub"], expires_at=expires_at))
+        db.commit()
+        
+        with self._lock:
+            self._revoked[claims["jti"]] = claims["exp"]
+    
+    def revoke_user(self, db: Session, user_id: str) -> None:
+        """
+        Reject every token issued to a user so far, and prune expired cutoffs.
+        
+        Other processes pick the cutoff up on their next reload.
+        
+        Args:
+            db: Database session
+            user_id: User whose tokens to revoke
+        """
+        cutoff = int(time.time())
+        valid_after = datetime.fromtimestamp(cutoff, timezone.utc)
+        
+        db.query(TokenCutoff).filter(
+            TokenCutoff.valid_after <= valid_after - timedelta(seconds=AUTH_TOKEN_TTL)
+        ).delete(synchronize_session=False)
+        row = db.get(TokenCutoff, user_id)
+        if row is None:
+            db.add(TokenCutoff(user_id=user_id, valid_after=valid_after))
+        else:
+            row.valid_after = valid_after
+        db.commit()
+        
+        with self._lock:
+            self._cutoffs[user_id] = cutoff
+    
+    def stats(self) -> dict:
+        """Get deny-list statistics."""
+        with self._lock:
+            return {
+                "revoked": len(self._revoked),
+                "user_cutoffs": len(self._cutoffs),
+                "reloads": self.reloads,
+                "reload_failures": self.reload_failures
+            }
+
+
+deny_list = TokenDenyList()
+
+
+def verify_token(token: str) -> Dict:
+    """
+    Verify a token and return its claims.
+    
+    Signature and expiry are checked in memory; revocation against the
+    cached deny-list and user cutoffs.
+    
+    Raises:
+        TokenError: If the token is invalid, expired or revoked
+    """
+    claims = decode_token(token)
+    if deny_list.is_revoked(claims):
+        raise TokenError("Token revoked")
+    return claims
+
+
+def get_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Extract the token from an 'Authorization: Bearer <token>' header value."""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        return None
+    return token.strip()
@@ -0,0 +1,278 @@
+"""
+In-Process Caches
+
+Thread-safe LRU cache with optional TTL and hit/miss/eviction counters.
+Every cache registers itself by name so its statistics can be reported
+and it can be cleared when the configuration it depends on changes.
+
+RevalidatingCache adds loader-backed reads for slow upstream calls:
+stale-while-revalidate background refresh, negative caching of errors
+and single-flight loading per key.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_registry: Dict[str, "LRUCache"] = {}
+_registry_lock = threading.Lock()
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache.
+    
+    Entries expire after ttl seconds when a TTL is set. Once maxsize is
+    reached, the least recently used entry is evicted on insert.
+    """
+    
+    def __init__(self, name: str, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        
+        with _registry_lock:
+            _registry[name] = self
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default on miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def delete(self, key: Hashable) -> bool:
+        """Remove one entry. Returns True if it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class _Entry:
+    """Loaded value or error with the time it stops being fresh."""
+    
+    __slots__ = ("value", "error", "fresh_until")
+    
+    def __init__(self, value: Any, error: Optional[Exception], fresh_until: float):
+        self.value = value
+        self.error = error
+        self.fresh_until = fresh_until
+
+
+class RevalidatingCache(LRUCache):
+    """
+    LRU cache that loads missing values through a caller-supplied loader.
+    
+    A value is fresh for ttl seconds. For a further stale_ttl seconds it is
+    still served, but each read schedules one background refresh. Loader
+    errors of the error_types classes (e.g., transient upstream failures)
+    are cached for error_ttl seconds so a failing upstream is not called
+    on every request; other errors are raised without being cached. If a
+    background refresh fails, the stale value is kept until it expires.
+    Concurrent misses for one key share a single load.
+    
+    Cached values are shared between callers and must be treated as read-only.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 3600,
+        stale_ttl: float = 0,
+        error_ttl: float = 0,
+        error_types: Tuple[type, ...] = (Exception,),
+        refresh_workers: int = 2
+    ):
+        super().__init__(name, maxsize=maxsize, ttl=ttl + stale_ttl)
+        self.fresh_ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.error_ttl = error_ttl
+        self.error_types = error_types
+        self.refresh_workers = refresh_workers
+        self._inflight: Dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._executor = None
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+    
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, calling loader() on a miss.
+        
+        Args:
+            key: Cache key
+            loader: Zero-argument callable returning the value
+            
+        Returns:
+            Fresh or stale cached value, or the newly loaded value
+            
+        Raises:
+            Exception: The loader's error, from this call or a cached failure
+        """
+        entry = self.get(key)
+        
+        if entry is None:
+            return self._load(key, loader)
+        
+        if entry.error is not None:
+            with self._lock:
+                self.negative_hits += 1
+            raise entry.error.with_traceback(None)
+        
+        if entry.fresh_until <= time.monotonic():
+            with self._lock:
+                self.stale_hits += 1
+            self._refresh_in_background(key, loader)
+        
+        return entry.value
+    
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Load a missing key, sharing the result with concurrent callers."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        
+        if owner:
+            self._run_loader(key, loader, future, refresh=False)
+        
+        return future.result()
+    
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """Schedule one refresh of a stale key unless one is already running."""
+        with self._inflight_lock:
+            if key in self._inflight:
+                return
+            future = self._inflight[key] = Future()
+            if self._executor is None:
+                # Created on first use so forked workers never inherit a dead pool
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix=f"{self.name}-refresh"
+                )
+        
+        self._executor.submit(self._run_loader, key, loader, future, True)
+    
+    def _run_loader(self, key: Hashable, loader: Callable, future: Future, refresh: bool) -> None:
+        """Call loader, store the value or error and resolve the in-flight future."""
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                if refresh:
+                    self.refresh_errors += 1
+                else:
+                    self.load_errors += 1
+            # A failed refresh keeps serving the stale value until it expires
+            if not refresh and self.error_ttl > 0 and isinstance(e, self.error_types):
+                self.set(key, _Entry(None, e, 0.0), ttl=self.error_ttl)
+            future.set_exception(e)
+        else:
+            with self._lock:
+                if refresh:
+                    self.refreshes += 1
+                else:
+                    self.loads += 1
+            self.set(key, _Entry(value, None, time.monotonic() + self.fresh_ttl))
+            future.set_result(value)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def stats(self) -> dict:
+        """Get cache statistics, including revalidation counters."""
+        stats = super().stats()
+        with self._lock:
+            stats.update({
+                "ttl": self.fresh_ttl,
+                "stale_ttl": self.stale_ttl,
+                "error_ttl": self.error_ttl,
+                "stale_hits": self.stale_hits,
+                "negative_hits": self.negative_hits,
+                "loads": self.loads,
+                "load_errors": self.load_errors,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors
+            })
+        return stats
+
+
+def get_cache(name: str) -> Optional[LRUCache]:
+    """Get a registered cache by name."""
+    return _registry.get(name)
+
+
+def get_all_cache_stats() -> dict:
+    """Get statistics for every registered cache, keyed by name."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def clear_all_caches() -> None:
+    """Clear every registered cache."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    for cache in caches:
+        cache.clear()
@@ -4,8 +4,14 @@ Error Handling Utilities
 Standardized error response formatting for API endpoints.
 """
 
+import logging
+
 from flask import jsonify
 
+from backend.utils.metrics import record_error
+
+logger = logging.getLogger(__name__)
+
 def handle_validation_error(error: Exception) -> tuple:
     """
     Handle validation errors with standardized response.
@@ -32,10 +38,10 @@ def handle_calculation_error(error: Exception) -> tuple:
     Returns:
         JSON error response with 500 status
     """
-    import traceback
-    # Log the full error for debugging
-    print(f"ERROR: {type(error).__name__}: {str(error)}")
-    traceback.print_exc()
+    record_error(error)
+    
+    # Log the full error for debugging (traceback formatted off the request thread)
+    logger.error("%s: %s", type(error).__name__, error, exc_info=error, extra={"error_type": type(error).__name__})
     
     # Return user-friendly error message
     error_message = str(error)
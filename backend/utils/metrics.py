@@ -0,0 +1,330 @@
+"""
+Request Metrics
+
+In-process request instrumentation, exported in the Prometheus text
+format at /metrics:
+
+- http_request_duration_seconds: latency histogram per endpoint and method
+- http_requests_total: requests per endpoint, method and status
+- http_requests_in_flight
+- http_request_size_bytes / http_response_size_bytes: payload size histograms
+- db_queries_per_request / db_query_duration_seconds: SQLAlchemy statements
+  and time spent in them per request
+- app_errors_total: errors handled by handle_calculation_error
+- cache, connection pool and logging queue statistics, read when /metrics
+  is scraped
+
+Recording costs a few dictionary updates under one lock per request. Each
+worker process keeps its own counters.
+
+/metrics is closed by default: it needs "Authorization: Bearer <token>"
+with METRICS_TOKEN (for scrapers) or an admin auth token.
+"""
+
+import hmac
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import Response, g, has_app_context, has_request_context, request
+
+from backend.database.statement_events import observe_statements
+from backend.utils.cache import get_all_cache_stats
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Cache statistics exported as counters (name in stats -> metric suffix)
+CACHE_COUNTERS = (
+    "hits", "misses", "evictions", "expirations", "stale_hits",
+    "negative_hits", "loads", "load_errors", "refreshes", "refresh_errors"
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Histogram per label set; callers hold the registry lock while observing."""
+    
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple, list] = {}
+    
+    def observe(self, labels: Tuple, value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter per label set; callers hold the registry lock while incrementing."""
+    
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: Dict[Tuple, float] = {}
+    
+    def inc(self, labels: Tuple, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+
+def _gauge(name: str, help_text: str, samples: Iterable[Tuple[str, float]]) -> List[str]:
+    """Render a gauge from (label string, value) samples."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+    lines.extend(f"{name}{labels} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+class MetricsRegistry:
+    """Request, database and error metrics for this process."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        route = ("blueprint", "endpoint", "method")
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "Request latency in seconds.", route, LATENCY_BUCKETS)
+        self.requests = Counter(
+            "http_requests_total", "Requests by endpoint, method and status.", route + ("status",))
+        self.request_size = Histogram(
+            "http_request_size_bytes", "Request body size in bytes.", route, SIZE_BUCKETS)
+        self.response_size = Histogram(
+            "http_response_size_bytes", "Response body size in bytes.", route, SIZE_BUCKETS)
+        self.queries_per_request = Histogram(
+            "db_queries_per_request", "SQL statements executed per request.", route, QUERY_COUNT_BUCKETS)
+        self.query_duration = Histogram(
+            "db_query_duration_seconds", "Time spent executing SQL statements per request, in seconds.",
+            route, LATENCY_BUCKETS)
+        self.queries = Counter(
+            "db_queries_total", "SQL statements executed, inside requests or not.", ())
+        self.errors = Counter(
+            "app_errors_total", "Errors handled by handle_calculation_error, by endpoint and type.",
+            ("endpoint", "exception"))
+    
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+    
+    def request_finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+    
+    def observe_request(
+        self,
+        route: Tuple[str, str, str],
+        status: int,
+        duration: float,
+        request_size: int,
+        response_size: Optional[int],
+        query_count: int,
+        query_time: float
+    ) -> None:
+        """Record one finished request and take it off the in-flight gauge."""
+        with self._lock:
+            self.in_flight -= 1
+            self.request_duration.observe(route, duration)
+            self.requests.inc(route + (str(status),))
+            self.request_size.observe(route, request_size)
+            if response_size is not None:
+                self.response_size.observe(route, response_size)
+            self.queries_per_request.observe(route, query_count)
+            if query_count:
+                self.query_duration.observe(route, query_time)
+                self.queries.inc((), query_count)
+    
+    def record_query(self) -> None:
+        """Count a statement run outside a request (requests report theirs in observe_request)."""
+        with self._lock:
+            self.queries.inc(())
+    
+    def record_error(self, endpoint: str, error: Exception) -> None:
+        with self._lock:
+            self.errors.inc((endpoint, type(error).__name__))
+    
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        from backend.database.connection import get_pool_stats
+        from backend.utils.structured_logging import get_logging_stats
+        
+        with self._lock:
+            lines = _gauge("http_requests_in_flight", "Requests being handled.", [("", self.in_flight)])
+            for metric in (self.request_duration, self.requests, self.request_size, self.response_size,
+                           self.queries_per_request, self.query_duration, self.queries, self.errors):
+                lines.extend(metric.render())
+        
+        caches = get_all_cache_stats()
+        for key in CACHE_COUNTERS:
+            samples = [(f'{{cache="{_escape(name)}"}}', stats[key]) for name, stats in sorted(caches.items()) if key in stats]
+            if samples:
+                lines.append(f"# HELP cache_{key}_total Cache {key.replace('_', ' ')}.")
+                lines.append(f"# TYPE cache_{key}_total counter")
+                lines.extend(f"cache_{key}_total{labels} {value}" for labels, value in samples)
+        lines.extend(_gauge("cache_entries", "Entries held per cache.",
+                            [(f'{{cache="{_escape(name)}"}}', stats["size"]) for name, stats in sorted(caches.items())]))
+        lines.extend(_gauge("cache_hit_ratio", "Hits over lookups per cache.",
+                            [(f'{{cache="{_escape(name)}"}}', stats["hit_rate"]) for name, stats in sorted(caches.items())]))
+        
+        pool = get_pool_stats()
+        for key in ("checked_out", "checked_in", "overflow"):
+            if key in pool:
+                lines.extend(_gauge(f"db_pool_{key}", f"Connection pool {key.replace('_', ' ')} connections.", [("", pool[key])]))
+        lines.extend([
+            "# HELP db_pool_checkout_timeouts_total Connection checkouts that timed out.",
+            "# TYPE db_pool_checkout_timeouts_total counter",
+            f"db_pool_checkout_timeouts_total {pool['checkout_timeouts']}",
+            "# HELP db_pool_checkout_wait_seconds_total Time spent waiting for pooled connections.",
+            "# TYPE db_pool_checkout_wait_seconds_total counter",
+            f"db_pool_checkout_wait_seconds_total {_format_value(pool['wait_time_total_ms'] / 1000)}"
+        ])
+        
+        logs = get_logging_stats()
+        lines.extend(_gauge("log_queue_depth", "Log records waiting for the logging thread.", [("", logs["queued"])]))
+        lines.extend([
+            "# HELP log_records_dropped_total Log records dropped because the logging queue was full.",
+            "# TYPE log_records_dropped_total counter",
+            f"log_records_dropped_total {logs['dropped']}"
+        ])
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+def _before_request():
+    # One list per request: [start, statements, seconds in statements]
+    g._metrics = [time.perf_counter(), 0, 0.0]
+    metrics.request_started()
+
+
+def _after_request(response):
+    state = g.pop("_metrics", None)
+    if state is not None:
+        req = request._get_current_object()
+        metrics.observe_request(
+            (req.blueprint or "", req.endpoint or "unmatched", req.method),
+            response.status_code,
+            time.perf_counter() - state[0],
+            req.content_length or 0,
+            response.calculate_content_length(),
+            state[1],
+            state[2]
+        )
+    return response
+
+
+def _teardown_request(exc=None):
+    # Requests that never reached after_request still leave the in-flight gauge
+    if g.pop("_metrics", None) is not None:
+        metrics.request_finished()
+
+
+def _observe_statement(statement, parameters, elapsed):
+    state = g.get("_metrics") if has_app_context() else None
+    if state is not None:
+        state[1] += 1
+        state[2] += elapsed
+    else:
+        metrics.record_query()
+
+
+def request_query_stats() -> Optional[Tuple[int, float]]:
+    """
+    SQL statements run so far by the current request.
+    
+    Returns:
+        (statement count, seconds spent in them), or None outside an
+        instrumented request
+    """
+    state = g.get("_metrics") if has_request_context() else None
+    return (state[1], state[2]) if state is not None else None
+
+
+def _scrape_authorized(authorization: str) -> bool:
+    if METRICS_TOKEN and hmac.compare_digest(authorization, f"Bearer {METRICS_TOKEN}"):
+        return True
+    
+    from backend.utils.auth_tokens import TokenError, get_bearer_token, verify_token
+    token = get_bearer_token(authorization)
+    if token is None:
+        return False
+    try:
+        return verify_token(token)["role"] == "admin"
+    except TokenError:
+        return False
+
+
+def metrics_view():
+    """GET /metrics - Prometheus text exposition of this process's metrics (METRICS_TOKEN or admin token)."""
+    if not _scrape_authorized(request.headers.get("Authorization", "")):
+        return Response("Unauthorized\n", status=401, mimetype="text/plain")
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+
+def record_error(error: Exception) -> None:
+    """Count an error handled during the current request."""
+    if METRICS_ENABLED:
+        endpoint = (request.endpoint or "unmatched") if has_request_context() else ""
+        metrics.record_error(endpoint, error)
+
+
+def init_metrics(app, engine) -> None:
+    """
+    Instrument a Flask app and a SQLAlchemy engine, and add GET /metrics.
+    
+    Call before other before_request hooks so early-returning ones (e.g.,
+    CORS preflights) are timed too.
+    
+    Args:
+        app: Flask application
+        engine: SQLAlchemy engine whose statements are counted
+    """
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.add_url_rule("/metrics", "metrics", metrics_view, methods=["GET"])
+    observe_statements(engine, _observe_statement)
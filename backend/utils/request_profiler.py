@@ -0,0 +1,216 @@
+"""
+Request Profiler
+
+Profiles single requests on demand. An admin adds "X-Profile: 1" (or the
+query parameter _profile=1) to any request; the request then runs under
+cProfile, the profile is saved to PROFILE_DIR, and the slowest functions
+are returned with the response:
+
+- JSON object responses get a "_profile" key
+- every profiled response gets X-Profile-Id (the saved file name)
+
+"X-Profile: tottime" ranks by time spent in the function itself instead
+of cumulative time. Saved profiles open with pstats or snakeviz, and are
+listed and downloaded at /api/admin/profiles; only the newest
+PROFILE_KEEP are kept. REQUEST_PROFILING=false removes the hook.
+
+The check runs in WSGI middleware before Flask sees the request, so a
+request without the flag pays one dictionary lookup. The flag is honoured
+only with an admin bearer token; otherwise the request is served
+normally. One request is profiled at a time per process, and work done in
+other threads (e.g., concurrent provider pricing calls) is not included.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import secrets
+import threading
+import time
+from typing import Dict, List, Optional
+
+from backend.utils.auth_tokens import TokenError, get_bearer_token, verify_token
+
+PROFILE_DIR = os.getenv(
+    "PROFILE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "profiles")
+)
+REQUEST_PROFILING = os.getenv("REQUEST_PROFILING", "true").lower() == "true"
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "50"))
+PROFILE_TOP = int(os.getenv("PROFILE_TOP", "25"))
+
+SORT_KEYS = {"cumulative": 3, "tottime": 2}
+PROFILE_NAME = re.compile(r"^[\w.-]+\.prof$")
+
+
+def _requested_sort(environ) -> Optional[str]:
+    """The ranking asked for by the request, or None if it did not ask to be profiled."""
+    flag = environ.get("HTTP_X_PROFILE")
+    if flag is None:
+        query = environ.get("QUERY_STRING", "")
+        if "_profile=" not in query:
+            return None
+        flag = re.search(r"(?:^|&)_profile=([^&]*)", query)
+        flag = flag.group(1) if flag else None
+    if not flag or flag.lower() in ("0", "false", "off"):
+        return None
+    return flag.lower() if flag.lower() in SORT_KEYS else "cumulative"
+
+
+def _is_admin(environ) -> bool:
+    token = get_bearer_token(environ.get("HTTP_AUTHORIZATION"))
+    if token is None:
+        return False
+    try:
+        return verify_token(token)["role"] == "admin"
+    except TokenError:
+        return False
+
+
+def top_functions(profiler: cProfile.Profile, sort: str = "cumulative", limit: int = PROFILE_TOP) -> List[Dict]:
+    """
+    Rank a profile's functions.
+    
+    Args:
+        profiler: Finished profiler
+        sort: "cumulative" (time including callees) or "tottime" (own time)
+        limit: Number of functions to return
+    
+    Returns:
+        List of {function, calls, own_ms, cumulative_ms}, slowest first
+    """
+    stats = pstats.Stats(profiler).stats
+    index = SORT_KEYS[sort]
+    ranked = sorted(stats.items(), key=lambda item: item[1][index], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{name} ({os.path.basename(filename)}:{line})" if line else name,
+            "calls": calls,
+            "own_ms": round(own * 1000, 3),
+            "cumulative_ms": round(cumulative * 1000, 3)
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in ranked
+    ]
+
+
+def save_profile(profiler: cProfile.Profile, method: str, path: str) -> str:
+    """
+    Write a profile to PROFILE_DIR and drop the oldest beyond PROFILE_KEEP.
+    
+    Returns:
+        File name of the saved profile
+    """
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    slug = re.sub(r"[^\w]+", "_", path).strip("_")[:60] or "root"
+    now = time.time()
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now)) + f"{int(now * 1000) % 1000:03d}"
+    name = f"{stamp}-{method}-{slug}-{secrets.token_hex(3)}.prof"
+    profiler.dump_stats(os.path.join(PROFILE_DIR, name))
+    
+    saved = sorted(list_profiles(), key=lambda entry: entry["name"])
+    for entry in saved[:max(0, len(saved) - PROFILE_KEEP)]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, entry["name"]))
+        except OSError:
+            pass
+    return name
+
+
+def list_profiles() -> List[Dict]:
+    """Saved profiles, newest first, as {name, size_bytes, created_at}."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    entries = []
+    for name in os.listdir(PROFILE_DIR):
+        if PROFILE_NAME.match(name):
+            stat = os.stat(os.path.join(PROFILE_DIR, name))
+            entries.append({
+                "name": name,
+                "size_bytes": stat.st_size,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(stat.st_mtime))
+            })
+    return sorted(entries, key=lambda entry: entry["name"], reverse=True)
+
+
+class ProfilerMiddleware:
+    """WSGI middleware that profiles flagged admin requests."""
+    
+    def __init__(self, app):
+        self.app = app
+        self._lock = threading.Lock()
+    
+    def __call__(self, environ, start_response):
+        if "HTTP_X_PROFILE" not in environ and "_profile=" not in environ.get("QUERY_STRING", ""):
+            return self.app(environ, start_response)
+        
+        sort = _requested_sort(environ)
+        if sort is None or not _is_admin(environ):
+            return self.app(environ, start_response)
+        if not self._lock.acquire(blocking=False):
+            return self.app(environ, self._with_headers(start_response, [("X-Profile-Status", "busy")]))
+        
+        try:
+            captured = {}
+            
+            def capture(status, headers, exc_info=None):
+                captured["status"], captured["headers"] = status, headers
+                return lambda data: captured.setdefault("early", []).append(data)
+            
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                result = self.app(environ, capture)
+                try:
+                    body = b"".join(captured.pop("early", [])) + b"".join(result)
+                finally:
+                    if hasattr(result, "close"):
+                        result.close()
+            finally:
+                profiler.disable()
+            
+            name = save_profile(profiler, environ.get("REQUEST_METHOD", "GET"), environ.get("PATH_INFO", "/"))
+            # The body changes, so validators and caching headers no longer apply
+            headers = [
+                (key, value) for key, value in captured["headers"]
+                if key.lower() not in ("content-length", "etag", "cache-control")
+            ]
+            body = self._attach(body, headers, {"id": name, "sort": sort, "top": top_functions(profiler, sort)})
+            headers += [("Content-Length", str(len(body))), ("Cache-Control", "no-store"), ("X-Profile-Id", name)]
+            start_response(captured["status"], headers)
+            return [body]
+        finally:
+            self._lock.release()
+    
+    @staticmethod
+    def _attach(body: bytes, headers: list, profile: Dict) -> bytes:
+        """Add the profile to a JSON object body; other bodies are returned unchanged."""
+        content_type = next((value for key, value in headers if key.lower() == "content-type"), "")
+        if not content_type.startswith("application/json"):
+            return body
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return body
+        if not isinstance(payload, dict):
+            return body
+        payload["_profile"] = profile
+        return json.dumps(payload).encode()
+    
+    @staticmethod
+    def _with_headers(start_response, extra: list):
+        def wrapped(status, headers, exc_info=None):
+            return start_response(status, headers + extra, exc_info)
+        return wrapped
+
+
+def init_request_profiler(app) -> None:
+    """
+    Let admins profile any request of a Flask app with X-Profile / _profile.
+    
+    Args:
+        app: Flask application
+    """
+    if REQUEST_PROFILING:
+        app.wsgi_app = ProfilerMiddleware(app.wsgi_app)
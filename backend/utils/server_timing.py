@@ -0,0 +1,98 @@
+"""
+Server-Timing
+
+Per-request stage timings, sent as a Server-Timing response header (shown
+under Timing in browser devtools) and optionally logged as one structured
+record per request.
+
+Every response gets "total" and, when request metrics are enabled, "db"
+(time in SQL statements, with the statement count). Routes time their own
+stages with span():
+
+    with span("calculate"):
+        result = calculate_estimate(validated_data)
+
+Spans with the same name within one request are added together. Outside a
+request span() does nothing, so shared code can use it freely.
+
+Set SERVER_TIMING=false to stop sending the header and SERVER_TIMING_LOG=true
+to log them (as "server_timing" records with the stage fields).
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+
+from backend.utils.metrics import request_query_stats
+
+SERVER_TIMING = os.getenv("SERVER_TIMING", "true").lower() == "true"
+SERVER_TIMING_LOG = os.getenv("SERVER_TIMING_LOG", "false").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Time a block as stage `name` of the current request.
+    
+    Args:
+        name: Stage name; a header token, so no spaces or punctuation
+    """
+    timings = g.get("_server_timing") if has_request_context() else None
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def _before_request():
+    g._server_timing = {}
+    g._server_timing_start = time.perf_counter()
+
+
+def _after_request(response):
+    timings = g.pop("_server_timing", None)
+    if timings is None:
+        return response
+    total = time.perf_counter() - g.pop("_server_timing_start")
+    
+    entries = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()]
+    queries = request_query_stats()
+    if queries is not None and queries[0]:
+        entries.append(f'db;dur={queries[1] * 1000:.2f};desc="queries={queries[0]}"')
+    entries.append(f"total;dur={total * 1000:.2f}")
+    
+    if SERVER_TIMING:
+        response.headers["Server-Timing"] = ", ".join(entries)
+    if SERVER_TIMING_LOG:
+        logger.info("server_timing", extra={
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "stages_ms": {name: round(seconds * 1000, 2) for name, seconds in timings.items()},
+            "db_ms": round(queries[1] * 1000, 2) if queries else None,
+            "db_queries": queries[0] if queries else None
+        })
+    return response
+
+
+def init_server_timing(app) -> None:
+    """
+    Time every request of a Flask app and attach its Server-Timing header.
+    
+    Call after init_metrics() so the "db" entry can read the request's
+    query statistics before they are recorded.
+    
+    Args:
+        app: Flask application
+    """
+    if SERVER_TIMING or SERVER_TIMING_LOG:
+        app.before_request(_before_request)
+        app.after_request(_after_request)
@@ -0,0 +1,77 @@
+"""
+Startup Profiler
+
+Records how long each step of application startup takes: importing each
+blueprint module (including everything it pulls in) and each init step
+such as the schema check. The report is printed at startup when
+STARTUP_PROFILE is true and served at /api/admin/startup.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+
+
+class StartupProfile:
+    """Ordered, thread-safe list of timed startup steps."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: List[Dict] = []
+        self.started_at = time.perf_counter()
+        self.ready_at = None
+    
+    @contextmanager
+    def step(self, name: str, kind: str = "init"):
+        """
+        Time a startup step.
+        
+        Args:
+            name: Module or step name
+            kind: "import" or "init"
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._steps.append({"name": name, "kind": kind, "ms": round(elapsed * 1000, 2)})
+    
+    def mark_ready(self) -> None:
+        """Record that the app is ready to serve."""
+        self.ready_at = time.perf_counter()
+    
+    def report(self) -> Dict:
+        """
+        Get the startup report.
+        
+        Returns:
+            Dictionary with total_ms (from this module's import until the
+            app was ready), import_ms, init_ms and steps in the order they ran
+        """
+        with self._lock:
+            steps = list(self._steps)
+        end = self.ready_at if self.ready_at is not None else time.perf_counter()
+        return {
+            "total_ms": round((end - self.started_at) * 1000, 2),
+            "import_ms": round(sum(step["ms"] for step in steps if step["kind"] == "import"), 2),
+            "init_ms": round(sum(step["ms"] for step in steps if step["kind"] == "init"), 2),
+            "steps": steps
+        }
+    
+    def format_report(self) -> str:
+        """Format the startup report as a text table, slowest steps first."""
+        report = self.report()
+        lines = [f"Startup: {report['total_ms']:.1f} ms "
+                 f"(imports {report['import_ms']:.1f} ms, init {report['init_ms']:.1f} ms)"]
+        for step in sorted(report["steps"], key=lambda step: step["ms"], reverse=True):
+            lines.append(f"  {step['ms']:>8.1f} ms  {step['kind']:<6}  {step['name']}")
+        return "\n".join(lines)
+
+
+startup_profile = StartupProfile()
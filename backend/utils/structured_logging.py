@@ -0,0 +1,214 @@
+"""
+Structured Logging
+
+JSON log lines written off the request path. Request threads only put
+records on a bounded in-memory queue; a background listener thread does
+the formatting (including tracebacks) and writes to stdout.
+
+Records logged during a request carry request_id (from X-Request-ID, or
+generated, and echoed back in the response), method, path, endpoint and
+elapsed_ms since the request started. Extra fields passed with
+logger.info(..., extra={...}) are included as they are.
+
+If the queue is full the record is dropped and counted rather than
+blocking the request; the listener reports how many were dropped, and the
+total is exported as log_records_dropped_total on /metrics.
+
+Environment:
+    LOG_LEVEL        Minimum level, default INFO
+    LOG_FORMAT       json (default) or text for local development
+    LOG_QUEUE_SIZE   Records buffered before dropping, default 10000
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict
+
+from flask import g, has_request_context, request
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# Attributes every LogRecord has; anything else came from extra={...}
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the current request's id, route and elapsed time (runs before enqueueing)."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if has_request_context() and "request_id" not in vars(record):
+            record.request_id = g.get("request_id")
+            record.method = request.method
+            record.path = request.path
+            record.endpoint = request.endpoint
+            start = g.get("_log_request_start")
+            if start is not None:
+                record.elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops and counts records instead of blocking when the queue is full."""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._reported = 0
+        self._lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now (they may change later) but leave the
+        # traceback and JSON formatting to the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+    
+    def take_unreported(self) -> int:
+        """Drops since the last call."""
+        with self._lock:
+            count, self._reported = self.dropped - self._reported, self.dropped
+        return count
+
+
+class LogListener(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of failing."""
+    
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class _DropReporter(logging.Handler):
+    """Listener-side handler that logs a warning when records were dropped."""
+    
+    def __init__(self, queue_handler: DroppingQueueHandler, target: logging.Handler):
+        super().__init__()
+        self.queue_handler = queue_handler
+        self.target = target
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        dropped = self.queue_handler.take_unreported()
+        if dropped:
+            self.target.handle(logging.makeLogRecord({
+                "name": "backend.logging",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full: dropped {dropped} record(s)",
+                "dropped": dropped
+            }))
+
+
+_state: Dict = {}
+_state_lock = threading.Lock()
+
+
+def _start() -> None:
+    """Create the queue, handler and listener for this process."""
+    output = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "text":
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    else:
+        output.setFormatter(JsonFormatter())
+    
+    handler = DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    handler.addFilter(RequestContextFilter())
+    listener = LogListener(handler.queue, output, _DropReporter(handler, output))
+    listener.start()
+    
+    root = logging.getLogger()
+    if _state.get("handler") is not None:
+        root.removeHandler(_state["handler"])
+    root.addHandler(handler)
+    root.setLevel(LOG_LEVEL)
+    _state.update(handler=handler, listener=listener)
+
+
+def _restart_in_child() -> None:
+    # The listener thread does not survive fork (e.g., gunicorn workers)
+    if _state:
+        _start()
+
+
+def _stop() -> None:
+    listener = _state.get("listener")
+    if listener is not None:
+        listener.stop()
+
+
+def configure_logging() -> None:
+    """Route logging through the queue for this process (idempotent)."""
+    with _state_lock:
+        if _state:
+            return
+        _start()
+        atexit.register(_stop)
+        os.register_at_fork(after_in_child=_restart_in_child)
+
+
+def get_logging_stats() -> Dict:
+    """Queue depth and records dropped by this process."""
+    handler = _state.get("handler")
+    if handler is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": handler.queue.qsize(), "dropped": handler.dropped}
+
+
+def _before_request():
+    g._log_request_start = time.perf_counter()
+    g.request_id = request.headers.get("X-Request-ID", "")[:128] or uuid.uuid4().hex
+
+
+def _after_request(response):
+    request_id = g.get("request_id")
+    if request_id:
+        response.headers["X-Request-ID"] = request_id
+    return response
+
+
+def init_logging(app) -> None:
+    """
+    Configure queued JSON logging and give every request an id.
+    
+    Args:
+        app: Flask application
+    """
+    configure_logging()
+    app.before_request(_before_request)
+    app.after_request(_after_request)
@@ -0,0 +1,25 @@
+"""
+WSGI Entry Point
+
+Production entry point for gunicorn (see gunicorn.conf.py):
+
+    cd backend && gunicorn -c gunicorn.conf.py wsgi:app
+
+With preload_app the application, the compiled estimator and the rate
+catalog are built once in the master process and shared copy-on-write by
+every worker; each worker then discards the database connections it
+inherited (post_fork in gunicorn.conf.py).
+"""
+
+import os
+import sys
+
+# Add parent directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from backend.app import create_app
+
+app = create_app()
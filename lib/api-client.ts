@@ -6,6 +6,44 @@
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:5000/api"
 
+const TOKEN_STORAGE_KEY = "cloudguide_token"
+
+/**
+ * Store (or clear) the access token issued at login
+ */
+export function setAuthToken(token: string | null) {
+  if (typeof window === "undefined") return
+  if (token) {
+    localStorage.setItem(TOKEN_STORAGE_KEY, token)
+  } else {
+    localStorage.removeItem(TOKEN_STORAGE_KEY)
+  }
+}
+
+export function getAuthToken(): string | null {
+  if (typeof window === "undefined") return null
+  return localStorage.getItem(TOKEN_STORAGE_KEY)
+}
+
+// Only protected endpoints get the token, so public calls stay free of CORS preflights
+const AUTHENTICATED_PATHS = ["/auth/profile", "/auth/logout", "/analyses", "/admin"]
+
+/**
+ * fetch with the stored access token sent as a Bearer Authorization header
+ */
+function apiFetch(input: string, init: RequestInit = {}): Promise<Response> {
+  const token = getAuthToken()
+  const needsAuth = AUTHENTICATED_PATHS.some((path) => input.startsWith(`${API_BASE_URL}${path}`))
+  if (!token || !needsAuth) {
+    return fetch(input, init)
+  }
+  const headers = new Headers(init.headers)
+  if (!headers.has("Authorization")) {
+    headers.set("Authorization", `Bearer ${token}`)
+  }
+  return fetch(input, { ...init, headers })
+}
+
 export interface EstimateRequest {
   company_size: string
   current_infrastructure_type: string
@@ -72,7 +110,7 @@ export async function submitEstimate(
   data: EstimateRequest
 ): Promise<EstimateResponse> {
   try {
-    const response = await fetch(`${API_BASE_URL}/estimate`, {
+    const response = await apiFetch(`${API_BASE_URL}/estimate`, {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
@@ -103,7 +141,7 @@ export async function submitEstimate(
  */
 export async function checkHealth(): Promise<{ status: string; service: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/health`, {
+    const response = await apiFetch(`${API_BASE_URL}/health`, {
       method: "GET",
     })
 
@@ -142,6 +180,9 @@ export interface User {
 export interface AuthResponse {
   message: string
   user: User
+  token?: string
+  token_type?: string
+  expires_at?: number
 }
 
 /**
@@ -149,7 +190,7 @@ export interface AuthResponse {
  */
 export async function registerUser(data: RegisterRequest): Promise<AuthResponse> {
   try {
-    const response = await fetch(`${API_BASE_URL}/auth/register`, {
+    const response = await apiFetch(`${API_BASE_URL}/auth/register`, {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
@@ -180,7 +221,7 @@ export async function registerUser(data: RegisterRequest): Promise<AuthResponse>
  */
 export async function loginUser(data: LoginRequest): Promise<AuthResponse> {
   try {
-    const response = await fetch(`${API_BASE_URL}/auth/login`, {
+    const response = await apiFetch(`${API_BASE_URL}/auth/login`, {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
@@ -206,12 +247,27 @@ export async function loginUser(data: LoginRequest): Promise<AuthResponse> {
   }
 }
 
+/**
+ * Revoke the stored access token
+ */
+export async function logoutUser(): Promise<void> {
+  try {
+    if (getAuthToken()) {
+      await apiFetch(`${API_BASE_URL}/auth/logout`, { method: "POST" })
+    }
+  } catch {
+    // The token is dropped locally either way
+  } finally {
+    setAuthToken(null)
+  }
+}
+
 /**
  * Get user profile
  */
 export async function getUserProfile(userId: string): Promise<User> {
   try {
-    const response = await fetch(`${API_BASE_URL}/auth/profile/${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/auth/profile/${userId}`, {
       method: "GET",
     })
 
@@ -242,7 +298,7 @@ export async function updateUserProfile(
   updates: { name?: string; email?: string; title?: string }
 ): Promise<AuthResponse> {
   try {
-    const response = await fetch(`${API_BASE_URL}/auth/profile/${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/auth/profile/${userId}`, {
       method: "PUT",
       headers: {
         "Content-Type": "application/json",
@@ -275,9 +331,9 @@ export async function updateUserPassword(
   userId: string,
   currentPassword: string,
   newPassword: string
-): Promise<{ message: string }> {
+): Promise<{ message: string; token?: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/auth/profile/${userId}/password`, {
+    const response = await apiFetch(`${API_BASE_URL}/auth/profile/${userId}/password`, {
       method: "PUT",
       headers: {
         "Content-Type": "application/json",
@@ -297,7 +353,12 @@ export async function updateUserPassword(
       )
     }
 
-    return await response.json()
+    // Tokens issued before the change are revoked; keep the session on the new one
+    const data = await response.json()
+    if (data.token) {
+      setAuthToken(data.token)
+    }
+    return data
   } catch (error) {
     if (error instanceof ApiError) {
       throw error
@@ -342,6 +403,8 @@ export interface Analysis {
   config: any
   estimates: any[]
   trends?: any[]
+  headline_cost?: number | null
+  headline_provider?: string | null
   created_at: string
   updated_at?: string
 }
@@ -351,7 +414,7 @@ export interface Analysis {
  */
 export async function getUserAnalyses(userId: string): Promise<Analysis[]> {
   try {
-    const response = await fetch(`${API_BASE_URL}/analyses?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/analyses?user_id=${userId}`, {
       method: "GET",
     })
 
@@ -374,12 +437,96 @@ export async function getUserAnalyses(userId: string): Promise<Analysis[]> {
   }
 }
 
+export interface AnalysisSummary {
+  id: string
+  title: string
+  headline_cost: number | null
+  headline_provider: string | null
+  created_at: string
+  updated_at?: string | null
+}
+
+export interface AnalysisSummaryPage {
+  analyses: AnalysisSummary[]
+  next_cursor: string | null
+  has_more: boolean
+}
+
+/**
+ * Get one page of analysis summaries for a user (no config, estimates or trends)
+ */
+export async function getUserAnalysisSummaries(
+  userId: string,
+  limit = 20,
+  cursor?: string | null
+): Promise<AnalysisSummaryPage> {
+  try {
+    const params = new URLSearchParams({ user_id: userId, limit: String(limit) })
+    if (cursor) {
+      params.set("cursor", cursor)
+    }
+    const response = await apiFetch(`${API_BASE_URL}/analyses?${params.toString()}`, {
+      method: "GET",
+    })
+
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}))
+      throw new ApiError(
+        response.status,
+        errorData.error || "fetch_failed",
+        errorData.message || "Failed to fetch analyses"
+      )
+    }
+
+    return await response.json()
+  } catch (error) {
+    if (error instanceof ApiError) {
+      throw error
+    }
+    throw new ApiError(500, "network_error", "Network error occurred")
+  }
+}
+
+/**
+ * Get full analyses by ID in one request
+ */
+export async function getAnalysesByIds(
+  userId: string,
+  ids: string[]
+): Promise<{ analyses: Analysis[]; missing: string[] }> {
+  try {
+    const response = await apiFetch(`${API_BASE_URL}/analyses/bulk`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({ user_id: userId, ids }),
+    })
+
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}))
+      throw new ApiError(
+        response.status,
+        errorData.error || "fetch_failed",
+        errorData.message || "Failed to fetch analyses"
+      )
+    }
+
+    return await response.json()
+  } catch (error) {
+    if (error instanceof ApiError) {
+      throw error
+    }
+    throw new ApiError(500, "network_error", "Network error occurred")
+  }
+}
+
 /**
  * Get analysis by ID
  */
 export async function getAnalysisById(analysisId: string): Promise<Analysis> {
   try {
-    const response = await fetch(`${API_BASE_URL}/analyses/${analysisId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/analyses/${analysisId}`, {
       method: "GET",
     })
 
@@ -407,7 +554,7 @@ export async function getAnalysisById(analysisId: string): Promise<Analysis> {
  */
 export async function createAnalysis(data: CreateAnalysisRequest): Promise<{ message: string; analysis: Analysis }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/analyses`, {
+    const response = await apiFetch(`${API_BASE_URL}/analyses`, {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
@@ -441,7 +588,7 @@ export async function updateAnalysis(
   updates: Partial<CreateAnalysisRequest>
 ): Promise<{ message: string; analysis: Analysis }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/analyses/${analysisId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/analyses/${analysisId}`, {
       method: "PUT",
       headers: {
         "Content-Type": "application/json",
@@ -472,7 +619,7 @@ export async function updateAnalysis(
  */
 export async function deleteAnalysis(analysisId: string, userId: string): Promise<{ message: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/analyses/${analysisId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/analyses/${analysisId}?user_id=${userId}`, {
       method: "DELETE",
     })
 
@@ -538,7 +685,7 @@ export interface Provider {
 // Admin Users
 export async function getAdminUsers(userId: string): Promise<{ users: AdminUser[] }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/users?user_id=${userId}`)
+    const response = await apiFetch(`${API_BASE_URL}/admin/users?user_id=${userId}`)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch users")
@@ -552,7 +699,7 @@ export async function getAdminUsers(userId: string): Promise<{ users: AdminUser[
 
 export async function createAdminUser(userId: string, data: { email: string; password: string; name: string; title?: string; is_admin?: boolean }): Promise<{ message: string; user: AdminUser }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/users?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/users?user_id=${userId}`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(data),
@@ -570,7 +717,7 @@ export async function createAdminUser(userId: string, data: { email: string; pas
 
 export async function updateAdminUser(userId: string, targetUserId: string, updates: Partial<AdminUser>): Promise<{ message: string; user: AdminUser }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/users/${targetUserId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/users/${targetUserId}?user_id=${userId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(updates),
@@ -588,7 +735,7 @@ export async function updateAdminUser(userId: string, targetUserId: string, upda
 
 export async function deleteAdminUser(userId: string, targetUserId: string): Promise<{ message: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/users/${targetUserId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/users/${targetUserId}?user_id=${userId}`, {
       method: "DELETE",
     })
     if (!response.ok) {
@@ -606,7 +753,7 @@ export async function deleteAdminUser(userId: string, targetUserId: string): Pro
 export async function getAdminEducation(userId: string, activeOnly?: boolean): Promise<{ education: Education[] }> {
   try {
     const url = `${API_BASE_URL}/admin/education?user_id=${userId}${activeOnly ? "&active_only=true" : ""}`
-    const response = await fetch(url)
+    const response = await apiFetch(url)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch education")
@@ -620,7 +767,7 @@ export async function getAdminEducation(userId: string, activeOnly?: boolean): P
 
 export async function createAdminEducation(userId: string, data: Partial<Education>): Promise<{ message: string; education: Education }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/education?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/education?user_id=${userId}`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(data),
@@ -638,7 +785,7 @@ export async function createAdminEducation(userId: string, data: Partial<Educati
 
 export async function updateAdminEducation(userId: string, educationId: string, updates: Partial<Education>): Promise<{ message: string; education: Education }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/education/${educationId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/education/${educationId}?user_id=${userId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(updates),
@@ -656,7 +803,7 @@ export async function updateAdminEducation(userId: string, educationId: string,
 
 export async function deleteAdminEducation(userId: string, educationId: string): Promise<{ message: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/education/${educationId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/education/${educationId}?user_id=${userId}`, {
       method: "DELETE",
     })
     if (!response.ok) {
@@ -674,7 +821,7 @@ export async function deleteAdminEducation(userId: string, educationId: string):
 export async function getProviders(activeOnly: boolean = true): Promise<{ providers: Provider[] }> {
   try {
     const url = `${API_BASE_URL}/providers${activeOnly ? "?active_only=true" : ""}`
-    const response = await fetch(url)
+    const response = await apiFetch(url)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch providers")
@@ -690,7 +837,7 @@ export async function getProviders(activeOnly: boolean = true): Promise<{ provid
 export async function getAdminProviders(userId: string, activeOnly?: boolean): Promise<{ providers: Provider[] }> {
   try {
     const url = `${API_BASE_URL}/admin/providers?user_id=${userId}${activeOnly ? "&active_only=true" : ""}`
-    const response = await fetch(url)
+    const response = await apiFetch(url)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch providers")
@@ -704,7 +851,7 @@ export async function getAdminProviders(userId: string, activeOnly?: boolean): P
 
 export async function createAdminProvider(userId: string, data: Partial<Provider>): Promise<{ message: string; provider: Provider }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/providers?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/providers?user_id=${userId}`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(data),
@@ -722,7 +869,7 @@ export async function createAdminProvider(userId: string, data: Partial<Provider
 
 export async function updateAdminProvider(userId: string, providerId: string, updates: Partial<Provider>): Promise<{ message: string; provider: Provider }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/providers/${providerId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/providers/${providerId}?user_id=${userId}`, {
       method: "PUT",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(updates),
@@ -741,7 +888,7 @@ export async function updateAdminProvider(userId: string, providerId: string, up
 // Admin Analyses Statistics
 export async function getAdminAnalysesCount(userId: string): Promise<{ count: number }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/analyses/count?user_id=${userId}`)
+    const response = await apiFetch(`${API_BASE_URL}/admin/analyses/count?user_id=${userId}`)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch analyses count")
@@ -760,16 +907,20 @@ export async function getEducation(params?: {
   provider?: string
   level?: string
   type?: string
-}): Promise<{ education: Education[] }> {
+  limit?: number
+  cursor?: string
+}): Promise<{ education: Education[]; next_cursor?: string | null; has_more?: boolean }> {
   try {
     const queryParams = new URLSearchParams()
     if (params?.category) queryParams.append("category", params.category)
     if (params?.provider) queryParams.append("provider", params.provider)
     if (params?.level) queryParams.append("level", params.level)
     if (params?.type) queryParams.append("type", params.type)
+    if (params?.limit) queryParams.append("limit", String(params.limit))
+    if (params?.cursor) queryParams.append("cursor", params.cursor)
     
     const url = `${API_BASE_URL}/education${queryParams.toString() ? `?${queryParams.toString()}` : ""}`
-    const response = await fetch(url)
+    const response = await apiFetch(url)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch education")
@@ -781,9 +932,50 @@ export async function getEducation(params?: {
   }
 }
 
+export interface EducationSearchResult {
+  id: string
+  title: string
+  description: string
+  type: string
+  category: string
+  duration?: string
+  level: string
+  provider?: string
+  tags: string[]
+  url?: string
+  rank: number
+  /** HTML-escaped text; the only tags are <mark> around matched words */
+  snippet: string
+}
+
+export async function searchEducation(
+  query: string,
+  params?: { limit?: number; offset?: number; category?: string; provider?: string; level?: string; type?: string }
+): Promise<{ query: string; results: EducationSearchResult[]; has_more: boolean }> {
+  try {
+    const queryParams = new URLSearchParams({ q: query })
+    if (params?.limit) queryParams.append("limit", String(params.limit))
+    if (params?.offset) queryParams.append("offset", String(params.offset))
+    if (params?.category) queryParams.append("category", params.category)
+    if (params?.provider) queryParams.append("provider", params.provider)
+    if (params?.level) queryParams.append("level", params.level)
+    if (params?.type) queryParams.append("type", params.type)
+
+    const response = await apiFetch(`${API_BASE_URL}/education/search?${queryParams.toString()}`)
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}))
+      throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to search education")
+    }
+    return await response.json()
+  } catch (error) {
+    if (error instanceof ApiError) throw error
+    throw new ApiError(500, "network_error", "Network error occurred")
+  }
+}
+
 export async function getEducationById(educationId: string): Promise<{ education: Education }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/education/${educationId}`)
+    const response = await apiFetch(`${API_BASE_URL}/education/${educationId}`)
     if (!response.ok) {
       const errorData = await response.json().catch(() => ({}))
       throw new ApiError(response.status, errorData.error || "fetch_failed", errorData.message || "Failed to fetch education")
@@ -797,7 +989,7 @@ export async function getEducationById(educationId: string): Promise<{ education
 
 export async function deleteAdminProvider(userId: string, providerId: string): Promise<{ message: string }> {
   try {
-    const response = await fetch(`${API_BASE_URL}/admin/providers/${providerId}?user_id=${userId}`, {
+    const response = await apiFetch(`${API_BASE_URL}/admin/providers/${providerId}?user_id=${userId}`, {
       method: "DELETE",
     })
     if (!response.ok) {
@@ -918,7 +1110,7 @@ export async function getProviderPricing(
       region: params.region,
     })
 
-    const response = await fetch(`${API_BASE_URL}/pricing/provider/${provider}?${queryParams}`, {
+    const response = await apiFetch(`${API_BASE_URL}/pricing/provider/${provider}?${queryParams}`, {
       method: "GET",
     })
 
@@ -953,7 +1145,7 @@ export async function compareProviderPricing(
   data: ProviderPricingRequest
 ): Promise<ProviderPricingResponse> {
   try {
-    const response = await fetch(`${API_BASE_URL}/pricing/compare`, {
+    const response = await apiFetch(`${API_BASE_URL}/pricing/compare`, {
       method: "POST",
       headers: {
         "Content-Type": "application/json",
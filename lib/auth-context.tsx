@@ -5,6 +5,8 @@ import { createContext, useContext, useState, useEffect } from "react"
 import {
   registerUser,
   loginUser,
+  logoutUser,
+  setAuthToken,
   getUserProfile,
   updateUserProfile,
   updateUserPassword,
@@ -85,6 +87,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     try {
       setError(null)
       const response = await loginUser({ email, password })
+      setAuthToken(response.token ?? null)
       const localUser = apiUserToLocal(response.user)
       
       setUser(localUser)
@@ -106,6 +109,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     try {
       setError(null)
       const response = await registerUser({ name, email, password, title })
+      setAuthToken(response.token ?? null)
       const localUser = apiUserToLocal(response.user)
       
       setUser(localUser)
@@ -128,6 +132,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     if (typeof window !== "undefined") {
       localStorage.removeItem(STORAGE_KEY)
     }
+    void logoutUser()
   }
 
   const updateUser = async (updates: { name?: string; email?: string; title?: string }): Promise<boolean> => {